@@ -0,0 +1,112 @@
+"""
+Benchmark the load time and the file size of the configuration formats.
+
+The benchmark writes a machine generated config with a configurable
+number of nodes (10k by default) in every available format and measures
+the size of the file, the time to read the file to plain data and the
+time of parse_config, which also constructs the Configclasses.
+
+Run it with:
+
+    python benchmarks/bench_binary_format.py --nodes 10000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from simple_config_builder import Configclass, Field
+from simple_config_builder.config_formats import FormatRegistry
+from simple_config_builder.config_io import parse_config, write_config
+from simple_config_builder.config_types import ConfigTypes
+
+
+class Sensor(Configclass):
+    """Generated sensor node."""
+
+    name: str = "sensor"
+    channel: int = 0
+    enabled: bool = True
+    gain: float = 1.0
+    offsets: list[float] = Field(default_factory=list)
+    labels: dict[str, str] = Field(default_factory=dict)
+
+
+class Station(Configclass):
+    """Root node holding the sensors."""
+
+    sensors: list[Sensor]
+
+
+def make_config(nodes: int) -> dict:
+    """Make a config with `nodes` sensor nodes."""
+    return {
+        "station": Station(
+            sensors=[
+                Sensor(
+                    name=f"sensor{i}",
+                    channel=i,
+                    gain=i / 7,
+                    offsets=[0.25 * j for j in range(8)],
+                    labels={f"label{j}": f"value{j}" for j in range(4)},
+                )
+                for i in range(nodes)
+            ]
+        )
+    }
+
+
+def best_of(repeat: int, function) -> float:
+    """Call `function` `repeat` times and return the best time."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    config = make_config(args.nodes)
+    print(f"{'format':>8} {'size':>12} {'read':>9} {'parse':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for config_type, extension in (
+            (ConfigTypes.YAML, ".yaml"),
+            (ConfigTypes.JSON, ".json"),
+            (ConfigTypes.TOML, ".toml"),
+            (ConfigTypes.MSGPACK, ".msgpack"),
+            (ConfigTypes.BINARY, ".scb"),
+        ):
+            try:
+                config_format = FormatRegistry.get(config_type)
+            except ImportError:
+                print(f"{config_type.value:>8} not installed")
+                continue
+            config_file = os.path.join(directory, f"config{extension}")
+            write_config(config_file, config, config_type)
+            with open(config_file, "rb") as f:
+                config_bytes = f.read()
+
+            read = best_of(
+                args.repeat,
+                lambda f=config_format, b=config_bytes: f.loads(b),
+            )
+            parse = best_of(
+                args.repeat,
+                lambda f=config_file, t=config_type: parse_config(f, t),
+            )
+            print(
+                f"{config_type.value:>8} {len(config_bytes):>12,} "
+                f"{read:>8.3f}s {parse:>8.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark the construction of whole configuration trees.
+
+The benchmark constructs a tree with a configurable number of tagged
+nodes (50k by default) once with construct_config, which walks the tree
+in Python, and once with the single pass of the ConfigTreeValidator.
+
+Run it with:
+
+    python benchmarks/bench_config_tree.py --nodes 50000
+"""
+
+import argparse
+import copy
+import time
+
+from simple_config_builder import Configclass, Field
+from simple_config_builder.config_io import construct_config
+from simple_config_builder.config_tree import ConfigTreeValidator
+
+
+class Leaf(Configclass):
+    """Leaf node with typed fields."""
+
+    name: str = "leaf"
+    value: int = 0
+    weights: list[float] = Field(default_factory=list)
+    labels: dict[str, str] = Field(default_factory=dict)
+
+
+class Group(Configclass):
+    """Group node with untyped fields holding the leaves."""
+
+    leaves: list
+    meta: dict = Field(default_factory=dict)
+
+
+def make_config(nodes: int) -> dict:
+    """Make a config with `nodes` leaf nodes in groups of 100."""
+    return {
+        "groups": [
+            {
+                "_config_class_type": "Group",
+                "meta": {"index": group, "tags": ["a", "b", "c"]},
+                "leaves": [
+                    {
+                        "_config_class_type": "Leaf",
+                        "name": f"leaf{i}",
+                        "value": i,
+                        "weights": [0.5] * 8,
+                        "labels": {"kind": "leaf"},
+                    }
+                    for i in range(100)
+                ],
+            }
+            for group in range(max(nodes // 100, 1))
+        ]
+    }
+
+
+def run(construct, config: dict, repeat: int) -> float:
+    """Construct the config `repeat` times and return the best time."""
+    best = float("inf")
+    for _ in range(repeat):
+        data = copy.deepcopy(config)
+        start = time.perf_counter()
+        construct(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    config = make_config(args.nodes)
+    ConfigTreeValidator.validator()
+    walk = run(construct_config, config, args.repeat)
+    single_pass = run(ConfigTreeValidator.validate, config, args.repeat)
+
+    for label, seconds in (("walk", walk), ("single", single_pass)):
+        print(
+            f"{label:>7}: {seconds:.3f}s ({args.nodes / seconds:,.0f} nodes/s)"
+        )
+    print(f"speedup: {walk / single_pass:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark construct_config over the depth and width of the tree.
+
+The benchmark constructs generated trees of tagged nodes with
+construct_config and with the recursive traversal construct_config used
+before, which is kept here as reference. Deep trees exceed the recursion
+limit of the recursive traversal, which is reported as "recursion".
+
+Run it with:
+
+    python benchmarks/bench_construct_config.py --depths 10 1000 10000
+"""
+
+import argparse
+import time
+
+from simple_config_builder import Configclass, Field
+from simple_config_builder.config_io import construct_config
+from simple_config_builder.config_tree import (
+    resolve_config_class,
+    validate_config_class,
+)
+
+
+class Node(Configclass):
+    """Node of the generated trees."""
+
+    value: int = 0
+    children: list = Field(default_factory=list)
+
+
+def recursive_construct(config_data):
+    """Construct the configuration objects recursively, as before."""
+    if not isinstance(config_data, dict):
+        return config_data
+    for key, value in config_data.items():
+        if isinstance(value, dict):
+            config_data[key] = recursive_construct(value)
+        if isinstance(value, list):
+            for i, item in enumerate(value):
+                if isinstance(item, dict):
+                    value[i] = recursive_construct(item)
+        if isinstance(value, tuple):
+            value = list(value)
+            for i, item in enumerate(value):
+                if isinstance(item, dict):
+                    value[i] = recursive_construct(item)
+            config_data[key] = tuple(value)
+    if "_config_class_type" in config_data:
+        config_class = resolve_config_class(config_data["_config_class_type"])
+        del config_data["_config_class_type"]
+        return validate_config_class(config_class, config_data)
+    return config_data
+
+
+def make_config(depth: int, width: int) -> dict:
+    """Make a chain of `depth` nodes with `width` leaves per node."""
+    node: dict = {"_config_class_type": "Node", "value": 0}
+    for level in range(depth):
+        leaves = [
+            {"_config_class_type": "Node", "value": i} for i in range(width)
+        ]
+        node = {
+            "_config_class_type": "Node",
+            "value": level,
+            "children": [node, *leaves],
+        }
+    return {"root": node}
+
+
+def run(construct, depth: int, width: int, repeat: int) -> float | None:
+    """Construct the config `repeat` times and return the best time."""
+    best = float("inf")
+    for _ in range(repeat):
+        # copy.deepcopy recurses, so every config is made from scratch
+        data = make_config(depth, width)
+        start = time.perf_counter()
+        try:
+            construct(data)
+        except RecursionError:
+            return None
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--depths", type=int, nargs="+", default=[10, 100, 1000, 10000]
+    )
+    parser.add_argument("--widths", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--max-nodes", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'depth':>7} {'width':>7} {'nodes':>9} {'iterative':>10} ", end="")
+    print(f"{'recursive':>10}")
+    for depth in args.depths:
+        for width in args.widths:
+            nodes = depth * (width + 1) + 1
+            if nodes > args.max_nodes:
+                continue
+            iterative = run(construct_config, depth, width, args.repeat)
+            recursive = run(recursive_construct, depth, width, args.repeat)
+            columns = [
+                f"{seconds:.3f}s" if seconds is not None else "recursion"
+                for seconds in (iterative, recursive)
+            ]
+            print(
+                f"{depth:>7} {width:>7} {nodes:>9} "
+                f"{columns[0]:>10} {columns[1]:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark the access of configuration values by path.
+
+The benchmark reads a nested value, `db.pools[2].timeout`, by manual
+attribute and item traversal, by Configparser.get with its cached
+accessors, by Configparser.get_many in batches and by the generic
+traversal which parses the path on every call, and prints the time per
+read.
+
+Run it with:
+
+    python benchmarks/bench_path_access.py --reads 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from simple_config_builder import Configclass, Field
+from simple_config_builder.config_path import PathAccessor, parse_path
+from simple_config_builder.configparser import Configparser
+
+
+class Pool(Configclass):
+    """Generated connection pool."""
+
+    timeout: int = 5
+    size: int = 10
+
+
+class Database(Configclass):
+    """Database holding the pools."""
+
+    name: str = "db"
+    pools: list[Pool] = Field(
+        default_factory=lambda: [Pool(timeout=i) for i in range(4)]
+    )
+
+
+PATH = "db.pools[2].timeout"
+
+
+def best_of(repeat: int, function) -> float:
+    """Call `function` `repeat` times and return the best time."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reads", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    reads = range(args.reads)
+
+    with tempfile.TemporaryDirectory() as directory:
+        configparser = Configparser.from_python(
+            {"db": Database()}, os.path.join(directory, "config.json")
+        )
+        config_data = configparser.config_data
+
+        def manual():
+            for _ in reads:
+                config_data["db"].pools[2].timeout  # noqa: B018
+
+        def get():
+            for _ in reads:
+                configparser.get(PATH)
+
+        def get_many():
+            paths = [PATH] * 100
+            for _ in range(args.reads // 100):
+                configparser.get_many(paths)
+
+        def uncached():
+            for _ in reads:
+                parse_path.cache_clear()
+                PathAccessor(PATH, parse_path(PATH), None).get(config_data)
+
+        print(f"{'access':>10} {'per read':>10}")
+        for name, function in (
+            ("manual", manual),
+            ("get", get),
+            ("get_many", get_many),
+            ("uncached", uncached),
+        ):
+            seconds = best_of(args.repeat, function)
+            print(f"{name:>10} {seconds / args.reads * 1e9:>8.0f}ns")
+        configparser.close()
+
+
+if __name__ == "__main__":
+    main()
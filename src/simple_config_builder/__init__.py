@@ -1,17 +1,22 @@
 """The library provides a simple way to handle configuration files."""
 
+from simple_config_builder.callables import CallableCache
 from simple_config_builder.config import (
-    ConfigClassRegistry,
     Configclass,
+    ConfigClassRegistry,
     Field,
 )
+from simple_config_builder.config_cache import ConfigCache
+from simple_config_builder.config_types import ConfigTypes, Durability
 from simple_config_builder.configparser import Configparser
-from simple_config_builder.config_types import ConfigTypes
 
 __all__ = [
-    "Field",
+    "CallableCache",
+    "ConfigCache",
     "ConfigClassRegistry",
+    "ConfigTypes",
     "Configclass",
     "Configparser",
-    "ConfigTypes",
+    "Durability",
+    "Field",
 ]
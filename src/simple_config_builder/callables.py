@@ -0,0 +1,308 @@
+"""
+Resolution of serialized callables.
+
+Callables are stored in configuration files as dictionaries of the form
+`{"type": "callable", "module": ..., "name": ..., "file_path": ...}`.
+Resolving such a dictionary imports the module or executes the file the
+callable lives in. The CallableCache keeps the resolved callables and
+the executed modules, so a file is executed once per modification instead
+of once per callable that references it.
+
+A LazyCallable defers the resolution until the callable is first called
+or one of its attributes is accessed, so loading a configuration does not
+import the modules it references.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import os
+from collections import OrderedDict
+from threading import RLock
+from types import ModuleType
+from typing import Any, ClassVar
+
+
+class CallableCache:
+    """
+    Process wide LRU cache of resolved callables.
+
+    Entries are keyed by module, name, file path and the modification time
+    of the file, so editing a file referenced by a configuration makes the
+    next resolution execute the file again.
+    """
+
+    __callables: ClassVar[OrderedDict] = OrderedDict()
+    __modules: ClassVar[OrderedDict] = OrderedDict()
+    __lock: ClassVar = RLock()
+    __maxsize: ClassVar[int] = 1024
+    __hits: ClassVar[int] = 0
+    __misses: ClassVar[int] = 0
+
+    @classmethod
+    def resolve(cls, module: str, name: str, file_path: str = "") -> Any:
+        """
+        Resolve a callable from its module, name and file path.
+
+        Parameters
+        ----------
+        module: The module name of the callable.
+        name: The name of the callable.
+        file_path: The file to load the callable from. If empty, the
+            module is imported by its name.
+
+        Raises
+        ------
+        ImportError: If the module or file can not be loaded.
+        AttributeError: If the module has no attribute `name`.
+
+        Returns
+        -------
+        The resolved callable.
+        """
+        mtime = _modification_time(file_path) if file_path else None
+        key = (module, name, file_path, mtime)
+        with cls.__lock:
+            if key in cls.__callables:
+                cls.__callables.move_to_end(key)
+                cls.__hits += 1
+                return cls.__callables[key]
+            cls.__misses += 1
+            if file_path:
+                loaded_module = cls._load_file(name, file_path, mtime)
+            else:
+                loaded_module = importlib.import_module(module)
+            resolved = getattr(loaded_module, name)
+            cls.__callables[key] = resolved
+            cls._evict(cls.__callables)
+            return resolved
+
+    @classmethod
+    def _load_file(
+        cls, name: str, file_path: str, mtime: int | None
+    ) -> ModuleType:
+        """Execute the file at `file_path` once per modification time."""
+        key = (file_path, mtime)
+        if key in cls.__modules:
+            cls.__modules.move_to_end(key)
+            return cls.__modules[key]
+        spec = importlib.util.spec_from_file_location(name, file_path)
+        if spec is None:
+            msg = f"Could not find spec for module {name} at {file_path}"
+            raise ImportError(msg)
+        loaded_module = importlib.util.module_from_spec(spec)
+        if spec.loader is None:
+            msg = f"Could not load module {name} at {file_path}"
+            raise ImportError(msg)
+        spec.loader.exec_module(loaded_module)
+        cls.__modules[key] = loaded_module
+        cls._evict(cls.__modules)
+        return loaded_module
+
+    @classmethod
+    def _evict(cls, entries: OrderedDict):
+        """Drop the least recently used entries above the maximum size."""
+        while len(entries) > cls.__maxsize:
+            entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(
+        cls, file_path: str | None = None, module: str | None = None
+    ):
+        """
+        Invalidate cached callables.
+
+        Without arguments the whole cache is cleared. Otherwise only the
+        entries loaded from `file_path` or the module `module` are dropped.
+
+        Parameters
+        ----------
+        file_path: Drop the entries loaded from this file.
+        module: Drop the entries of this module.
+        """
+        with cls.__lock:
+            if file_path is None and module is None:
+                cls.__callables.clear()
+                cls.__modules.clear()
+                return
+            for key in list(cls.__callables):
+                entry_module, _, entry_file_path, _ = key
+                if (
+                    file_path is not None and entry_file_path == file_path
+                ) or (module is not None and entry_module == module):
+                    del cls.__callables[key]
+            for key in list(cls.__modules):
+                if file_path is not None and key[0] == file_path:
+                    del cls.__modules[key]
+
+    @classmethod
+    def set_maxsize(cls, maxsize: int):
+        """
+        Set the maximum number of cached callables and modules.
+
+        Parameters
+        ----------
+        maxsize: The maximum number of entries per cache.
+
+        Raises
+        ------
+        ValueError: If `maxsize` is smaller than one.
+        """
+        if maxsize < 1:
+            raise ValueError("The maximum cache size must be at least 1.")
+        with cls.__lock:
+            cls.__maxsize = maxsize
+            cls._evict(cls.__callables)
+            cls._evict(cls.__modules)
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """
+        Get the cache statistics.
+
+        Returns
+        -------
+        A dictionary with the hits, misses, cached callables, cached
+        modules and the maximum size of the cache.
+        """
+        with cls.__lock:
+            return {
+                "hits": cls.__hits,
+                "misses": cls.__misses,
+                "callables": len(cls.__callables),
+                "modules": len(cls.__modules),
+                "maxsize": cls.__maxsize,
+            }
+
+    @classmethod
+    def reset_stats(cls):
+        """Reset the hit and miss counters."""
+        with cls.__lock:
+            cls.__hits = 0
+            cls.__misses = 0
+
+
+_UNRESOLVED = object()
+
+
+class LazyCallable:
+    """
+    Proxy for a serialized callable that is resolved on first use.
+
+    The proxy resolves the callable through the CallableCache on the
+    first call or attribute access. Until then only the serialized form
+    is kept, which is also what the proxy serializes back to.
+
+    Example:
+        ``` python
+        func = LazyCallable("os.path", "join")
+        func.resolved  # False
+        func("a", "b")  # Imports os.path and returns "a/b"
+        ```
+    """
+
+    __slots__ = ("_resolved", "_spec")
+
+    def __init__(self, module: str, name: str, file_path: str = ""):
+        """
+        Initialize the proxy.
+
+        Parameters
+        ----------
+        module: The module name of the callable.
+        name: The name of the callable.
+        file_path: The file to load the callable from.
+        """
+        self._spec = (module, name, file_path)
+        self._resolved = _UNRESOLVED
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the callable has been resolved."""
+        return self._resolved is not _UNRESOLVED
+
+    def serialize(self) -> dict[str, Any]:
+        """
+        Serialize the proxy without resolving it.
+
+        Returns
+        -------
+        A dictionary with the type, module, name and file path of the
+        callable.
+        """
+        module, name, file_path = self._spec
+        return {
+            "type": "callable",
+            "module": module,
+            "name": name,
+            "file_path": file_path,
+        }
+
+    def resolve(self) -> Any:
+        """
+        Resolve the callable.
+
+        Returns
+        -------
+        The callable the proxy stands for.
+        """
+        if self._resolved is _UNRESOLVED:
+            self._resolved = CallableCache.resolve(*self._spec)
+        return self._resolved
+
+    def __call__(self, *args, **kwargs):
+        """Resolve and call the callable."""
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, item: str):
+        """Resolve the callable and get the attribute from it."""
+        if item in LazyCallable.__slots__:
+            raise AttributeError(item)
+        return getattr(self.resolve(), item)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare the proxy with another proxy or a callable.
+
+        The proxy equals the callable it resolves to. Proxies of the same
+        serialized form are equal without resolving them, and an
+        unresolved proxy is only resolved for a comparison with a callable
+        of the name and module of its serialized form, so comparisons do
+        not import modules needlessly.
+        """
+        if isinstance(other, LazyCallable):
+            if self._spec == other._spec:
+                return True
+            other = other.resolve()
+        if not callable(other):
+            return NotImplemented
+        if self._resolved is _UNRESOLVED:
+            module, name, file_path = self._spec
+            if getattr(other, "__name__", None) != name or (
+                not file_path and getattr(other, "__module__", None) != module
+            ):
+                return False
+        return self.resolve() == other
+
+    def __hash__(self) -> int:
+        """Hash the resolved callable, which the proxy equals."""
+        return hash(self.resolve())
+
+    def __repr__(self) -> str:
+        """Get the representation of the proxy."""
+        module, name, file_path = self._spec
+        location = file_path or module
+        state = "resolved" if self.resolved else "unresolved"
+        return f"<LazyCallable {location}:{name} ({state})>"
+
+
+def _modification_time(file_path: str) -> int | None:
+    """Get the modification time of a file or None if it does not exist."""
+    try:
+        return os.stat(file_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+__all__ = ["CallableCache", "LazyCallable"]
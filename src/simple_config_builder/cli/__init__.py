@@ -57,3 +57,52 @@ def start(host, port, directory):
     from simple_config_builder.gui_backend.api import app
 
     uvicorn.run(app, host=host, port=port)
+
+
+@config.command()
+@click.argument("source", type=click.Path(exists=True, dir_okay=False))
+@click.argument("target", type=click.Path(dir_okay=False))
+def convert(source, target):
+    """Convert the configuration file SOURCE to the format of TARGET."""
+    from simple_config_builder.config_io import convert_config
+
+    try:
+        convert_config(source, target)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+    click.echo(f"Converted {source} to {target}.")
+
+
+@config.command()
+@click.argument("old", type=click.Path(exists=True, dir_okay=False))
+@click.argument("new", type=click.Path(exists=True, dir_okay=False))
+def diff(old, new):
+    """
+    Show the changes from the configuration file OLD to NEW.
+
+    Exits with status 1 if the configurations differ.
+    """
+    import json
+
+    from simple_config_builder.config_diff import MISSING, diff_files
+    from simple_config_builder.config_io import to_dict
+
+    def _format(value):
+        return json.dumps(to_dict(value), default=str)
+
+    try:
+        changes = diff_files(old, new)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+    for path, old_value, new_value in changes:
+        path = path or "<root>"
+        if old_value is MISSING:
+            click.echo(f"+ {path}: {_format(new_value)}")
+        elif new_value is MISSING:
+            click.echo(f"- {path}: {_format(old_value)}")
+        else:
+            click.echo(
+                f"~ {path}: {_format(old_value)} -> {_format(new_value)}"
+            )
+    if changes:
+        raise SystemExit(1)
@@ -29,6 +29,8 @@ Example:
 from __future__ import annotations
 
 import importlib.util
+import weakref
+from collections.abc import Callable
 
 from pydantic import (
     BaseModel,
@@ -41,26 +43,34 @@ from pydantic import Field
 
 from typing import (
     TYPE_CHECKING,
+    Annotated,
     Any,
+    ClassVar,
+    ForwardRef,
+    Literal,
     Type,
+    TypeVar,
+    get_args,
+    get_origin,
 )
 
 if TYPE_CHECKING:
-    from typing import ClassVar
+    from collections.abc import Iterable
 from pydantic import ConfigDict
 
+from simple_config_builder.callables import CallableCache, LazyCallable
+
 
 class Configclass(BaseModel):
     """Configclass base class."""
 
     _config_class_type: str = PrivateAttr()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Set _config_class_type to the path and class name of the class
-        self._config_class_type = (
-            f"{self.__class__.__module__}.{self.__class__.__name__}"
-        )
+    # Per class tuple of the fields which can hold callables and the input
+    # keys (names and aliases) of these fields, see _callable_fields.
+    # Detected when the class is created.
+    __callable_fields__: ClassVar[tuple[str, ...] | None] = None
+    __callable_keys__: ClassVar[frozenset[str] | None] = None
 
     def _callable_serialization(self, value: Any) -> dict[str, Any]:
         """
@@ -74,6 +84,8 @@ class Configclass(BaseModel):
         -------
         A dictionary with the type, module, name and file path of the callable.
         """
+        if isinstance(value, LazyCallable):
+            return value.serialize()
         try:
             importlib.import_module(value.__module__)
             file_path = ""
@@ -87,34 +99,107 @@ class Configclass(BaseModel):
         }
 
     @classmethod
-    def _callable_deserialization(cls, value: dict[str, Any]) -> Any:
+    def _callable_deserialization(
+        cls, value: dict[str, Any], lazy: bool = False
+    ) -> Any:
         """
         Deserialize a callable from a dictionary.
 
         Parameters
         ----------
         value: The dictionary to deserialize.
+        lazy: Return a LazyCallable instead of resolving the callable.
 
         Returns
         -------
-        The callable represented by the dictionary.
-        """
-        module = value["module"]
-        name = value["name"]
-        file_path = value.get("file_path", "")
-        if file_path:
-            spec = importlib.util.spec_from_file_location(name, file_path)
-            if spec is None:
-                msg = f"Could not find spec for module {name} at {file_path}"
-                raise ImportError(msg)
-            module = importlib.util.module_from_spec(spec)
-            if spec.loader is None:
-                msg = f"Could not load module {name} at {file_path}"
-                raise ImportError(msg)
-            spec.loader.exec_module(module)
-        else:
-            module = importlib.import_module(module)
-        return getattr(module, name)
+        The callable represented by the dictionary. Resolved callables are
+        cached in the CallableCache.
+        """
+        if lazy:
+            return LazyCallable(
+                value["module"], value["name"], value.get("file_path", "")
+            )
+        return CallableCache.resolve(
+            value["module"], value["name"], value.get("file_path", "")
+        )
+
+    @classmethod
+    def _callable_fields(cls) -> tuple[str, ...]:
+        """
+        Get the fields of the class which can hold callables.
+
+        The fields are detected from their annotations when the class is
+        created. Only these fields are walked by the callable serialization
+        and deserialization, all other fields are left to pydantic-core.
+
+        Returns
+        -------
+        A tuple of the names of the fields which can hold callables.
+        """
+        callable_fields = cls.__dict__.get("__callable_fields__")
+        if callable_fields is None:
+            callable_fields = cls._detect_callable_fields()
+        return callable_fields
+
+    @classmethod
+    def _detect_callable_fields(cls) -> tuple[str, ...]:
+        """Detect and cache the fields which can hold callables."""
+        callable_fields = tuple(
+            key
+            for key, field_info in cls.model_fields.items()
+            if _can_hold_callable(field_info.annotation)
+        )
+        callable_keys = set(callable_fields)
+        for key in callable_fields:
+            field_info = cls.model_fields[key]
+            for alias in (field_info.alias, field_info.validation_alias):
+                if isinstance(alias, str):
+                    callable_keys.add(alias)
+        if cls.__pydantic_complete__:
+            # Annotations of incomplete models may still be forward
+            # references, so the detection is repeated once they are built.
+            cls.__callable_fields__ = callable_fields
+            cls.__callable_keys__ = frozenset(callable_keys)
+        return callable_fields
+
+    def _serialize_value(self, value: Any) -> Any:
+        """Serialize a value which can be or contain callables."""
+        if callable(value):
+            return self._callable_serialization(value)
+        if isinstance(value, list):
+            # If the value is a list, serialize each callable in the list
+            return [
+                self._callable_serialization(item) if callable(item) else item
+                for item in value
+            ]
+        if isinstance(value, dict):
+            # If the value is a dict, serialize each callable in the dict
+            return {
+                sub_key: self._callable_serialization(sub_value)
+                if callable(sub_value)
+                else sub_value
+                for sub_key, sub_value in value.items()
+            }
+        # Otherwise, use the standard serialization
+        return value
+
+    @classmethod
+    def _deserialize_value(cls, value: Any, lazy: bool = False) -> Any:
+        """Deserialize a value which can be or contain callables."""
+        if _is_serialized_callable(value):
+            return cls._callable_deserialization(value, lazy)
+        # check for list of Callable
+        if isinstance(value, list):
+            for i, item in enumerate(value):
+                if _is_serialized_callable(item):
+                    value[i] = cls._callable_deserialization(item, lazy)
+        elif isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                if _is_serialized_callable(sub_value):
+                    value[sub_key] = cls._callable_deserialization(
+                        sub_value, lazy
+                    )
+        return value
 
     @model_serializer(mode="wrap")
     def _wrap_ser(self, handler: SerializerFunctionWrapHandler):
@@ -124,32 +209,16 @@ class Configclass(BaseModel):
 
         data: dict[str, Any] = {}
 
-        data["_config_class_type"] = self._config_class_type
-
-        # Serialize callables to their string representation
-        for key, field_info in type(self).model_fields.items():
-            value = getattr(self, key)
-            if callable(value):
-                data[key] = self._callable_serialization(value)
-            elif isinstance(value, list):
-                # If the value is a list, serialize each callable in the list
-                data[key] = [
-                    self._callable_serialization(item)
-                    if callable(item)
-                    else item
-                    for item in value
-                ]
-            elif isinstance(value, dict):
-                # If the value is a dict, serialize each callable in the dict
-                data[key] = {
-                    sub_key: self._callable_serialization(sub_value)
-                    if callable(sub_value)
-                    else sub_value
-                    for sub_key, sub_value in value.items()
-                }
-            else:
-                # Otherwise, use the standard serialization
-                data[key] = value
+        # Read the private attribute without pydantic's __getattr__
+        data["_config_class_type"] = self.__pydantic_private__[
+            "_config_class_type"
+        ]
+
+        # The field values are handed to pydantic-core as they are, only
+        # the fields which can hold callables are walked in python.
+        data.update(self.__dict__)
+        for key in type(self)._callable_fields():
+            data[key] = self._serialize_value(data[key])
 
         return data
 
@@ -158,55 +227,74 @@ class Configclass(BaseModel):
     )
     @classmethod
     def _wrap_val(cls, data: dict[str, Any], info) -> dict[str, Any]:
-        for key, value in data.items():
-            if (
-                isinstance(value, dict)
-                and "type" in value
-                and value["type"] == "callable"
-            ):
-                data[key] = cls._callable_deserialization(value)
-            # check for list of Callable
-            elif isinstance(value, list):
-                for i, item in enumerate(value):
-                    if (
-                        isinstance(item, dict)
-                        and "type" in item
-                        and item["type"] == "callable"
-                    ):
-                        data[key][i] = cls._callable_deserialization(item)
-            elif isinstance(value, dict):
-                for sub_key, sub_value in value.items():
-                    if (
-                        isinstance(sub_value, dict)
-                        and "type" in sub_value
-                        and sub_value["type"] == "callable"
-                    ):
-                        data[key][sub_key] = cls._callable_deserialization(
-                            sub_value
-                        )
+        callable_keys = cls.__dict__.get("__callable_keys__")
+        if callable_keys is None:
+            cls._detect_callable_fields()
+            callable_keys = cls.__dict__.get("__callable_keys__")
+        if not callable_keys or not isinstance(data, dict):
+            # No field can hold a callable, nothing to deserialize
+            return data
+        # Callables are resolved lazily if the validation context asks for
+        # it, e.g. model_validate(data, context={"lazy_callables": True})
+        lazy = bool(info.context and info.context.get("lazy_callables"))
+        for key in callable_keys:
+            if key in data:
+                data[key] = cls._deserialize_value(data[key], lazy)
         return data
 
-    def __init_subclass__(cls, **kwargs):
+    def model_post_init(self, context: Any, /):
+        """Set the _config_class_type after the instance is validated."""
+        super().model_post_init(context)
+        # Set the class string without __setattr__, which would notify the
+        # assignment observers of every constructed instance.
+        cls = type(self)
+        self.__pydantic_private__["_config_class_type"] = (
+            f"{cls.__module__}.{cls.__name__}"
+        )
+
+    def __setattr__(self, name: str, value: Any):
+        """
+        Assign and validate a field and notify the assignment observers.
+
+        The observers are only notified once the value passed the
+        validation of the assignment, see AssignmentObservers.
+        """
+        super().__setattr__(name, value)
+        AssignmentObservers.notify(self, name)
+
+    def __init_subclass__(cls, aliases: Iterable[str] = (), **kwargs):
         """
         Initialize the subclass and register it in the ConfigClassRegistry.
 
         This method is called when a class is defined that
         inherits from Configclass.
         It registers the class in the ConfigClassRegistry.
+        Aliases can be declared as class keyword, e.g.
+        `class MyClass(Configclass, aliases=("my_class",))`.
         """
-        ConfigClassRegistry.register(cls)
+        ConfigClassRegistry.register(cls, aliases=aliases)
         return super().__init_subclass__(**kwargs)
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        """
+        Detect the callable fields of the subclass.
+
+        This method is called by pydantic once the fields of the subclass
+        are collected, so the callable detection sees the annotations.
+        """
+        kwargs.pop("aliases", None)
+        cls._detect_callable_fields()
+        return super().__pydantic_init_subclass__(**kwargs)
+
     @classmethod
     def __get_pydantic_json_schema__(cls, core_schema, handler):
         """Get the JSON schema for the Configclass."""
         # Check for Callable fields and convert them to a string representation
         for key, field_info in cls.model_fields.items():
-            print(core_schema)
             if field_info.annotation == "Callable":
                 # Convert Callable to a string representation
                 core_schema = core_schema.copy()
-                print(core_schema)
                 core_schema["type"] = "string"
                 core_schema["description"] = (
                     "A callable function, represented as a string."
@@ -217,13 +305,86 @@ class Configclass(BaseModel):
 
     model_config = ConfigDict(
         validate_assignment=True,
+        # Write infinite floats like the json module instead of null, so
+        # the values survive a round trip through a JSON file.
+        ser_json_inf_nan="constants",
+    )
+
+
+def _is_serialized_callable(value: Any) -> bool:
+    """Check if a value is a callable serialized to a dictionary."""
+    return (
+        isinstance(value, dict)
+        and "type" in value
+        and value["type"] == "callable"
     )
 
 
+def _can_hold_callable(annotation: Any) -> bool:
+    """
+    Check if a field annotation allows the field to hold callables.
+
+    Unknown or unresolved annotations are treated as able to hold
+    callables, so they keep the generic serialization.
+
+    Parameters
+    ----------
+    annotation: The annotation of the field.
+
+    Returns
+    -------
+    True if a value of the annotated type can be or contain a callable.
+    """
+    if annotation is Any or annotation is object or annotation is type:
+        return True
+    if isinstance(annotation, (str, ForwardRef, TypeVar)):
+        return True
+    if annotation is Callable:
+        return True
+    origin = get_origin(annotation)
+    if origin is Callable or origin is type:
+        return True
+    if origin is Literal:
+        return False
+    if origin is Annotated:
+        return _can_hold_callable(get_args(annotation)[0])
+    if origin is not None:
+        args = get_args(annotation)
+        if not args:
+            return True
+        return any(
+            _can_hold_callable(arg) for arg in args if arg is not Ellipsis
+        )
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            # Models serialize their own fields
+            return False
+        if hasattr(annotation, "__class_getitem__"):
+            # Unparametrized containers like list or dict hold anything
+            return True
+        return any(
+            "__call__" in vars(base)
+            for base in annotation.__mro__
+            if base is not object
+        )
+    return True
+
+
 class ConfigClassRegistry:
-    """Registry to hold all registered classes."""
+    """
+    Registry to hold all registered classes.
+
+    Classes are stored by their full class string. Secondary indexes map
+    short class names, declared aliases and the classes themselves back to
+    the full class string, so every lookup is a single dictionary access.
+    """
 
     __registry: ClassVar = {}  # Class variable to hold the registry
+    __class_to_name: ClassVar = {}  # Reverse index class -> class string
+    __short_names: ClassVar = {}  # Short class name -> set of class strings
+    __aliases: ClassVar = {}  # Declared alias -> class string
+    __attributes: ClassVar = {}  # Cached get_class_attributes results
+    __generation: ClassVar[int] = 0  # Incremented on every registration
 
     @classmethod
     def get_class_str_from_class(cls, class_to_register: type):
@@ -245,30 +406,79 @@ class ConfigClassRegistry:
         ----------
         class_to_register: The class to get the class string from.
         """
+        class_str = cls.__class_to_name.get(class_to_register)
+        if class_str is not None:
+            return class_str
         return f"{class_to_register.__module__}.{class_to_register.__name__}"
 
     @classmethod
-    def register[T](cls, class_to_register: type[T]):
+    def register[T](
+        cls, class_to_register: type[T], aliases: Iterable[str] = ()
+    ):
         """
         Register a class in the global registry.
 
+        Registering a class under a class string that is already taken
+        replaces the previous class, e.g. when a module is re-imported.
+
         Parameters
         ----------
         class_to_register: The class to register.
+        aliases: Additional names the class can be looked up by.
 
         Raises
         ------
-        ValueError: If the class is already registered.
+        ValueError: If an alias is already used by another class.
         """
-        if class_to_register not in cls.__registry:
-            class_str = cls.get_class_str_from_class(class_to_register)
-            cls.__registry[class_str] = class_to_register
-        else:
-            exception_msg = (
-                f"{cls.get_class_str_from_class(class_to_register)} "
-                f"is already registered."
-            )
-            raise ValueError(exception_msg)
+        class_str = (
+            f"{class_to_register.__module__}.{class_to_register.__name__}"
+        )
+        aliases = tuple(aliases)
+        for alias in aliases:
+            owner = cls.__aliases.get(alias)
+            if owner is not None and owner != class_str:
+                exception_msg = (
+                    f"The alias '{alias}' is already registered for {owner}."
+                )
+                raise ValueError(exception_msg)
+
+        previous = cls.__registry.get(class_str)
+        if previous is not None and previous is not class_to_register:
+            cls.__class_to_name.pop(previous, None)
+        cls.__registry[class_str] = class_to_register
+        cls.__class_to_name[class_to_register] = class_str
+        cls.__short_names.setdefault(class_to_register.__name__, set()).add(
+            class_str
+        )
+        for alias in aliases:
+            cls.__aliases[alias] = class_str
+        cls.__attributes.pop(class_str, None)
+        cls.__generation += 1
+
+    @classmethod
+    def generation(cls) -> int:
+        """
+        Get the generation of the registry.
+
+        The generation changes whenever a class is registered, so caches
+        derived from the registry can detect that they are outdated.
+
+        Returns
+        -------
+        The number of registrations so far.
+        """
+        return cls.__generation
+
+    @classmethod
+    def items(cls) -> list[tuple[str, type]]:
+        """
+        List all registered classes together with their class strings.
+
+        Returns
+        -------
+        A list of (class string, class) pairs.
+        """
+        return list(cls.__registry.items())
 
     @classmethod
     def list_classes(cls) -> list[str]:
@@ -290,15 +500,17 @@ class ConfigClassRegistry:
         ----------
         class_to_register: The class to check.
         """
-        return (
-            cls.get_class_str_from_class(class_to_register) in cls.__registry
-        )
+        return class_to_register in cls.__class_to_name
 
     @classmethod
     def get(cls, class_name) -> Type[Configclass]:
         """
         Get a class from the registry by name.
 
+        The name is resolved as a full class string first, then as a
+        declared alias and finally as a short class name. A short class
+        name only resolves if exactly one registered class carries it.
+
         Parameters
         ----------
         class_name: The name of the class to get.
@@ -311,9 +523,20 @@ class ConfigClassRegistry:
         -------
         The class if it is registered.
         """
-        for class_to_register in cls.__registry:
-            if class_to_register == class_name:
-                return cls.__registry[class_to_register]
+        config_class = cls.__registry.get(class_name)
+        if config_class is not None:
+            return config_class
+        class_str = cls.__aliases.get(class_name)
+        if class_str is not None:
+            return cls.__registry[class_str]
+        candidates = cls.__short_names.get(class_name)
+        if candidates is not None and len(candidates) == 1:
+            return cls.__registry[next(iter(candidates))]
+        if candidates:
+            exception_msg = (
+                f"{class_name} is ambiguous, it matches {sorted(candidates)}."
+            )
+            raise ValueError(exception_msg)
         raise ValueError(f"{class_name} is not registered.")
 
     @classmethod
@@ -330,16 +553,123 @@ class ConfigClassRegistry:
         A dictionary of attributes of the class.
         """
         config_class = cls.get(class_name)
-        if config_class is None:
-            raise ValueError(f"{class_name} is not registered.")
-        fields = {
-            key: value.annotation
-            for key, value in config_class.model_fields.items()
-        }
-        return fields
+        class_str = cls.__class_to_name[config_class]
+        fields = cls.__attributes.get(class_str)
+        if fields is None:
+            fields = {
+                key: value.annotation
+                for key, value in config_class.model_fields.items()
+            }
+            cls.__attributes[class_str] = fields
+        return dict(fields)
+
+
+class AssignmentObservers:
+    """
+    Registry of callbacks which are notified of field assignments.
+
+    Callbacks are registered per Configclass instance and are called with
+    the instance and the field name after a field of the instance was
+    assigned. The instances are held weakly and identified by identity,
+    so a notification is a single dictionary lookup.
+
+    Mutations of containers, e.g. `config.values.append(1)`, do not go
+    through the assignment and are not notified.
+    """
+
+    __observers: ClassVar[dict[int, tuple[weakref.ref, list[Callable]]]] = {}
+    __generation: ClassVar[int] = 0  # Incremented on every assignment
+
+    @classmethod
+    def observe(
+        cls, config: Configclass, callback: Callable[[Configclass, str], Any]
+    ):
+        """
+        Register a callback of an instance.
+
+        An instance can have several callbacks, registering the same
+        callback again has no effect.
+
+        Parameters
+        ----------
+        config: The Configclass instance.
+        callback: The callable to call with the instance and the field
+            name after an assignment.
+        """
+        key = id(config)
+        observers = cls.__observers
+        entry = observers.get(key)
+        if entry is not None and entry[0]() is config:
+            if callback not in entry[1]:
+                entry[1].append(callback)
+            return
+
+        def _remove(reference: weakref.ref):
+            entry = observers.get(key)
+            if entry is not None and entry[0] is reference:
+                del observers[key]
+
+        observers[key] = (weakref.ref(config, _remove), [callback])
+
+    @classmethod
+    def unobserve(
+        cls,
+        config: Configclass,
+        callback: Callable[[Configclass, str], Any] | None = None,
+    ):
+        """
+        Remove a callback of an instance.
+
+        Parameters
+        ----------
+        config: The Configclass instance.
+        callback: The callback to remove. Defaults to None, which removes
+            all callbacks of the instance.
+        """
+        entry = cls.__observers.get(id(config))
+        if entry is None or entry[0]() is not config:
+            return
+        if callback is None:
+            entry[1].clear()
+        elif callback in entry[1]:
+            entry[1].remove(callback)
+        if not entry[1]:
+            del cls.__observers[id(config)]
+
+    @classmethod
+    def notify(cls, config: Configclass, name: str):
+        """
+        Call the callbacks of an instance after an assignment.
+
+        Parameters
+        ----------
+        config: The Configclass instance.
+        name: The name of the assigned field.
+        """
+        cls.__generation += 1
+        entry = cls.__observers.get(id(config))
+        if entry is not None and entry[0]() is config:
+            for callback in list(entry[1]):
+                callback(config, name)
+
+    @classmethod
+    def generation(cls) -> int:
+        """
+        Get the generation of the assignments.
+
+        The generation changes whenever a field of any Configclass
+        instance is assigned, so caches derived from the field values can
+        detect that they are outdated.
+
+        Returns
+        -------
+        The number of assignments so far.
+        """
+        return cls.__generation
 
 
 __all__ = [
+    "AssignmentObservers",
     "Configclass",
     "ConfigClassRegistry",
     "Field",
@@ -0,0 +1,556 @@
+"""
+Compact binary format of configuration files.
+
+Large machine generated configurations are read faster from the binary
+format than from the text formats and take less space on the disk. The
+format stores the typed tree of the configuration with
+
+- a table of the dictionary keys and the `_config_class_type` values, so
+  every repeated string is stored once and referenced by its index,
+- containers prefixed with their length in bytes and their number of
+  items, so a reader can skip a subtree without reading it.
+
+Layout of a file:
+
+    magic    b"SCFG" followed by the version byte
+    strings  varint count, then varint length and UTF-8 bytes per string
+    root     the root value
+
+Every value starts with a tag byte:
+
+    0x00 None            0x06 string, index into the table
+    0x01 False           0x07 bytes, varint length and data
+    0x02 True            0x08 list
+    0x03 int, zigzag     0x09 tuple
+         varint          0x0A dictionary, alternating keys and values
+    0x04 float, 8 bytes  0x0B configuration, varint index of the
+    0x05 string, varint       `_config_class_type` followed by the
+         length and data      keys and values of the fields
+                         0x0C date, 0x0D datetime, ISO string
+
+Containers (0x08 to 0x0B) are followed by their length in bytes as four
+byte little endian integer, counted from after the length, and the varint
+number of items or fields.
+
+Example:
+    ``` python
+    from simple_config_builder.config_binary import (
+        deserialize_binary,
+        serialize_binary,
+    )
+
+    config_bytes = serialize_binary({"config": MyConfig()})
+    config_data = deserialize_binary(config_bytes)
+    ```
+
+The Configparser reads and writes `.scb` files in the format, see
+ConfigTypes.BINARY, and convert_config converts e.g. YAML files to it.
+"""
+
+from __future__ import annotations
+
+import datetime
+import struct
+from typing import Any
+
+from pydantic import BaseModel
+
+MAGIC = b"SCFG"
+VERSION = 1
+
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_FLOAT = 0x04
+_STR = 0x05
+_STR_REF = 0x06
+_BYTES = 0x07
+_LIST = 0x08
+_TUPLE = 0x09
+_DICT = 0x0A
+_CONFIG = 0x0B
+_DATE = 0x0C
+_DATETIME = 0x0D
+
+_FLOAT_STRUCT = struct.Struct("<d")
+_LENGTH_STRUCT = struct.Struct("<I")
+_MAX_LENGTH = 0xFFFFFFFF
+# The key of an open mapping before it is read
+_NO_KEY = object()
+
+
+class _Encoded:
+    """Encoded bytes of a string of the table, pushed on the stack."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+class _End:
+    """End of a container, whose length is written when it is popped."""
+
+    __slots__ = ("start",)
+
+    def __init__(self, start: int):
+        self.start = start
+
+
+def _varint(value: int) -> bytes:
+    """Encode a non-negative integer as varint."""
+    if value < 0x80:
+        return bytes((value,))
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Decode a varint, returning the value and the position after it."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def serialize_binary(config_data: Any) -> bytes:
+    """
+    Serialize configuration data to the binary format.
+
+    The tree is traversed with an explicit stack, so the depth of the
+    configuration is not limited by the recursion limit.
+
+    Parameters
+    ----------
+    config_data: The configuration data, which may contain Configclass
+        objects.
+
+    Returns
+    -------
+    The content of the binary file.
+
+    Raises
+    ------
+    TypeError: If the data contains a value the format does not store.
+    ValueError: If a container is larger than 4 GiB.
+    """
+    encoder = _Encoder([])
+    body = bytearray()
+    encoder.encode(config_data, body)
+    return encoder.document(body)
+
+
+class _Encoder:
+    """Encoder of values with a string table."""
+
+    def __init__(self, strings: list[str]):
+        self.strings = strings
+        self.table = {
+            string: _Encoded(bytes((_STR_REF,)) + _varint(index))
+            for index, string in enumerate(strings)
+        }
+
+    def reference(self, string: str) -> _Encoded:
+        """Get the encoded reference of a string, adding it to the table."""
+        encoded = self.table.get(string)
+        if encoded is None:
+            encoded = _Encoded(bytes((_STR_REF,)) + _varint(len(self.strings)))
+            self.table[string] = encoded
+            self.strings.append(string)
+        return encoded
+
+    def key(self, key: Any, body: bytearray):
+        """Encode the key of a mapping."""
+        if type(key) is str:
+            body += self.reference(key).data
+        else:
+            self.encode(key, body)
+
+    def encode(self, config_data: Any, body: bytearray):
+        """Encode a value to the end of the body."""
+        append = body.append
+        stack: list[Any] = [config_data]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            value = pop()
+            value_type = type(value)
+            if value_type is _Encoded:
+                body += value.data
+            elif value_type is _End:
+                length = len(body) - value.start - 4
+                if length > _MAX_LENGTH:
+                    raise ValueError(
+                        "A container is too large for the binary format."
+                    )
+                _LENGTH_STRUCT.pack_into(body, value.start, length)
+            elif value_type is str:
+                encoded = value.encode()
+                append(_STR)
+                body += _varint(len(encoded))
+                body += encoded
+            elif value_type is int:
+                append(_INT)
+                body += _varint(
+                    value << 1 if value >= 0 else (-value << 1) - 1
+                )
+            elif value_type is float:
+                append(_FLOAT)
+                body += _FLOAT_STRUCT.pack(value)
+            elif value is None:
+                append(_NONE)
+            elif value is True:
+                append(_TRUE)
+            elif value is False:
+                append(_FALSE)
+            elif value_type is dict:
+                config_class_type = value.get("_config_class_type")
+                is_config = type(config_class_type) is str
+                if is_config:
+                    items = [
+                        item
+                        for item in value.items()
+                        if item[0] != "_config_class_type"
+                    ]
+                else:
+                    items = list(value.items())
+                append(_CONFIG if is_config else _DICT)
+                start = len(body)
+                body += b"\0\0\0\0"
+                body += _varint(len(items))
+                if is_config:
+                    # The index of the type without the tag of the reference
+                    body += self.reference(config_class_type).data[1:]
+                push(_End(start))
+                for key, item in reversed(items):
+                    push(item)
+                    push(self.reference(key) if type(key) is str else key)
+            elif value_type is list or value_type is tuple:
+                append(_LIST if value_type is list else _TUPLE)
+                start = len(body)
+                body += b"\0\0\0\0"
+                body += _varint(len(value))
+                push(_End(start))
+                stack.extend(reversed(value))
+            elif isinstance(value, BaseModel):
+                push(value.model_dump())
+            elif isinstance(value, bytes | bytearray):
+                append(_BYTES)
+                body += _varint(len(value))
+                body += value
+            elif isinstance(value, datetime.date):
+                is_datetime = isinstance(value, datetime.datetime)
+                encoded = value.isoformat().encode()
+                append(_DATETIME if is_datetime else _DATE)
+                body += _varint(len(encoded))
+                body += encoded
+            elif isinstance(value, bool):
+                push(bool(value))
+            elif isinstance(value, int):
+                push(int(value))
+            elif isinstance(value, float):
+                push(float(value))
+            elif isinstance(value, str):
+                push(str(value))
+            elif isinstance(value, dict):
+                push(dict(value))
+            elif isinstance(value, list):
+                push(list(value))
+            elif isinstance(value, tuple):
+                push(tuple(value))
+            else:
+                raise TypeError(
+                    f"The value of type {value_type.__name__} cannot be "
+                    f"written in the binary format."
+                )
+
+    def document(self, body: bytearray) -> bytes:
+        """Prefix the encoded root value with the header and the table."""
+        header = bytearray(MAGIC)
+        header.append(VERSION)
+        header += _varint(len(self.strings))
+        for string in self.strings:
+            encoded = string.encode()
+            header += _varint(len(encoded))
+            header += encoded
+        return bytes(header + body)
+
+
+def deserialize_binary(config_bytes: bytes) -> Any:
+    """
+    Deserialize the binary format to plain configuration data.
+
+    Configuration objects are read as dictionaries tagged with
+    `_config_class_type`, like from the text formats, and are constructed
+    by parse_config.
+
+    Parameters
+    ----------
+    config_bytes: The content of the binary file.
+
+    Returns
+    -------
+    The plain configuration data.
+
+    Raises
+    ------
+    ValueError: If the content is not in the binary format or truncated.
+    """
+    data = bytes(config_bytes)
+    _check_header(data)
+    try:
+        strings, pos = _read_strings(data, 5)
+        value, pos = _read_value(data, pos, strings)
+    except IndexError:
+        raise ValueError("The binary configuration is truncated.") from None
+    if pos != len(data):
+        raise ValueError("The binary configuration has trailing data.")
+    return value
+
+
+def scan_sections(config_bytes: bytes) -> dict[Any, tuple[int, int]] | None:
+    """
+    Find the top level sections of a binary document.
+
+    Only the keys are read, the values are skipped by their length.
+
+    Parameters
+    ----------
+    config_bytes: The content of the binary file.
+
+    Returns
+    -------
+    The start and end offsets of the encoded values by their key, or None
+    if the root is not a mapping.
+    """
+    data = bytes(config_bytes)
+    _check_header(data)
+    sections = {}
+    try:
+        strings, pos = _read_strings(data, 5)
+        if data[pos] != _DICT:
+            return None
+        count, pos = _read_varint(data, pos + 5)
+        for _ in range(count):
+            key, pos = _read_value(data, pos, strings)
+            end = _skip_value(data, pos)
+            sections[key] = (pos, end)
+            pos = end
+    except IndexError:
+        raise ValueError("The binary configuration is truncated.") from None
+    return sections
+
+
+def deserialize_section(config_bytes: bytes, start: int, end: int) -> Any:
+    """
+    Deserialize a value found by scan_sections.
+
+    Parameters
+    ----------
+    config_bytes: The content of the binary file.
+    start: The start offset of the value.
+    end: The end offset of the value.
+
+    Returns
+    -------
+    The plain data of the value.
+    """
+    data = bytes(config_bytes)
+    strings, _ = _read_strings(data, 5)
+    value, pos = _read_value(data, start, strings)
+    if pos != end:
+        raise ValueError("The section does not end at its offset.")
+    return value
+
+
+def serialize_sections(
+    config_bytes: bytes,
+    sections: list[tuple[Any, tuple[int, int] | None, Any]],
+) -> bytes:
+    """
+    Serialize a mapping of sections, copying untouched sections.
+
+    The string table of the document is extended, so the copied sections
+    keep referencing their strings by the same index.
+
+    Parameters
+    ----------
+    config_bytes: The content of the binary file the sections were found
+        in.
+    sections: The key of each section, its offsets in `config_bytes` if it
+        is copied or None, and its value otherwise.
+
+    Returns
+    -------
+    The content of the binary file.
+    """
+    data = bytes(config_bytes)
+    strings, _ = _read_strings(data, 5)
+    encoder = _Encoder(strings)
+    body = bytearray((_DICT,))
+    body += b"\0\0\0\0"
+    body += _varint(len(sections))
+    for key, offsets, value in sections:
+        encoder.key(key, body)
+        if offsets is None:
+            encoder.encode(value, body)
+        else:
+            body += data[offsets[0] : offsets[1]]
+    if len(body) - 5 > _MAX_LENGTH:
+        raise ValueError("A container is too large for the binary format.")
+    _LENGTH_STRUCT.pack_into(body, 1, len(body) - 5)
+    return encoder.document(body)
+
+
+def _check_header(data: bytes):
+    """Check the magic and the version of a binary document."""
+    if data[:4] != MAGIC:
+        raise ValueError("The content is not in the binary config format.")
+    if data[4:5] != bytes((VERSION,)):
+        raise ValueError(
+            f"The version {data[4:5].hex()} of the binary config format is "
+            f"not supported."
+        )
+
+
+def _skip_value(data: bytes, pos: int) -> int:
+    """Get the position after the value at a position."""
+    tag = data[pos]
+    pos += 1
+    if _LIST <= tag <= _CONFIG:
+        (length,) = _LENGTH_STRUCT.unpack_from(data, pos)
+        return pos + 4 + length
+    if tag == _INT or tag == _STR_REF:
+        return _read_varint(data, pos)[1]
+    if tag == _FLOAT:
+        return pos + 8
+    if _STR <= tag <= _BYTES or _DATE <= tag <= _DATETIME:
+        length, pos = _read_varint(data, pos)
+        return pos + length
+    if tag <= _TRUE:
+        return pos
+    raise ValueError(f"Unknown tag {tag:#04x}.")
+
+
+def _read_strings(data: bytes, pos: int) -> tuple[list[str], int]:
+    """Read the string table."""
+    count, pos = _read_varint(data, pos)
+    strings = []
+    for _ in range(count):
+        length, pos = _read_varint(data, pos)
+        end = pos + length
+        if end > len(data):
+            raise IndexError
+        strings.append(data[pos:end].decode())
+        pos = end
+    return strings, pos
+
+
+def _read_value(data: bytes, pos: int, strings: list[str]) -> tuple[Any, int]:
+    """
+    Read a value with an explicit stack of the open containers.
+
+    Returns the value and the position after it.
+    """
+    # The open containers as [container, remaining items, tag, key]
+    stack: list[list[Any]] = []
+    unpack_float = _FLOAT_STRUCT.unpack_from
+    no_key = _NO_KEY
+    while True:
+        tag = data[pos]
+        pos += 1
+        if tag == _STR_REF:
+            index = data[pos]
+            pos += 1
+            if index >= 0x80:
+                index, pos = _read_varint(data, pos - 1)
+            value = strings[index]
+        elif _STR <= tag <= _BYTES or _DATE <= tag <= _DATETIME:
+            length = data[pos]
+            pos += 1
+            if length >= 0x80:
+                length, pos = _read_varint(data, pos - 1)
+            end = pos + length
+            if end > len(data):
+                raise IndexError
+            value = data[pos:end]
+            pos = end
+            if tag != _BYTES:
+                value = value.decode()
+                if tag == _DATE:
+                    value = datetime.date.fromisoformat(value)
+                elif tag == _DATETIME:
+                    value = datetime.datetime.fromisoformat(value)
+        elif tag == _INT:
+            zigzag = data[pos]
+            pos += 1
+            if zigzag >= 0x80:
+                zigzag, pos = _read_varint(data, pos - 1)
+            value = (zigzag >> 1) ^ -(zigzag & 1)
+        elif tag == _FLOAT:
+            value = unpack_float(data, pos)[0]
+            pos += 8
+        elif _LIST <= tag <= _CONFIG:
+            # The length in bytes is only needed to skip the container
+            count, pos = _read_varint(data, pos + 4)
+            container: Any
+            if tag == _CONFIG:
+                index, pos = _read_varint(data, pos)
+                # The type is the first key, like in Configclass.model_dump
+                container = {"_config_class_type": strings[index]}
+            else:
+                container = [] if tag <= _TUPLE else {}
+            if count:
+                stack.append([container, count, tag, no_key])
+                continue
+            value = tuple(container) if tag == _TUPLE else container
+        elif tag == _NONE:
+            value = None
+        elif tag == _TRUE:
+            value = True
+        elif tag == _FALSE:
+            value = False
+        else:
+            raise ValueError(f"Unknown tag {tag:#04x}.")
+
+        # Add the value to the open containers, closing the full ones
+        while stack:
+            frame = stack[-1]
+            if frame[2] >= _DICT:
+                if frame[3] is no_key:
+                    frame[3] = value
+                    break
+                frame[0][frame[3]] = value
+                frame[3] = no_key
+            else:
+                frame[0].append(value)
+            frame[1] -= 1
+            if frame[1]:
+                break
+            stack.pop()
+            value = frame[0]
+            if frame[2] == _TUPLE:
+                value = tuple(value)
+        else:
+            return value, pos
+
+
+__all__ = [
+    "MAGIC",
+    "VERSION",
+    "deserialize_binary",
+    "deserialize_section",
+    "scan_sections",
+    "serialize_binary",
+    "serialize_sections",
+]
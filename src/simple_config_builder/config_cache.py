@@ -0,0 +1,331 @@
+"""
+Persistent cache of parsed configurations.
+
+Parsing and validating a large configuration file, especially YAML, can
+take seconds. The ConfigCache stores the validated configuration of a file
+on disk, so the next parse of the unchanged file, e.g. after a restart of
+the process, only reads the stored result instead of the text format.
+
+Entries are keyed by the path and the content hash of the file and by
+the classes in the ConfigClassRegistry with the source of their modules,
+so a changed file or changed classes are parsed again. The results are
+stored in the compact binary format, see config_binary, and are
+constructed again by parse_config, so loading an entry does not execute
+code from the cache directory. The size of the cache directory is
+bounded by evicting the least recently used entries.
+
+Example:
+    ``` python
+    from simple_config_builder import ConfigCache, Configparser
+
+    cache = ConfigCache("/var/cache/my_app", max_size=512 * 1024**2)
+    configparser = Configparser("config.yaml", cache=cache)
+    ```
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import tempfile
+from threading import Lock
+from typing import Any
+
+from simple_config_builder.config import ConfigClassRegistry
+from simple_config_builder.config_binary import (
+    deserialize_binary,
+    serialize_binary,
+)
+from simple_config_builder.config_types import ConfigTypes
+
+# Version of the entry format, entries of other versions are not loaded
+_MAGIC = b"SCBCACHE\x02"
+_SUFFIX = ".bin"
+
+
+class ConfigCache:
+    """
+    On disk cache of parsed and validated configurations.
+
+    The cache is opt-in, it is used by passing it to parse_config or the
+    Configparser.
+    """
+
+    directory: str
+    max_size: int
+
+    def __init__(self, directory: str, max_size: int = 256 * 1024**2):
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        directory: The directory to store the entries in. It is created
+            if it does not exist.
+        max_size: The maximum size of all entries in bytes. Defaults to
+            256 MiB.
+
+        Raises
+        ------
+        ValueError: If `max_size` is smaller than one.
+        """
+        if max_size < 1:
+            raise ValueError("The maximum cache size must be at least 1.")
+        self.directory = directory
+        self.max_size = max_size
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(
+        self,
+        config_file: str,
+        config_type: ConfigTypes,
+        lazy_callables: bool = False,
+        content: bytes | None = None,
+    ) -> str | None:
+        """
+        Get the key of the entry of a configuration file.
+
+        Parameters
+        ----------
+        config_file: The configuration file path.
+        config_type: The configuration file type.
+        lazy_callables: Whether callables are loaded lazily.
+        content: The content of the file the entry is parsed from.
+            Defaults to None, which reads the file.
+
+        Returns
+        -------
+        The key, or None if the file does not exist.
+        """
+        path = os.path.abspath(config_file)
+        if content is None:
+            try:
+                with open(path, "rb") as f:
+                    content = f.read()
+            except FileNotFoundError:
+                return None
+        file_key = hashlib.blake2b(
+            repr(
+                (config_type.value, lazy_callables, _registry_fingerprint())
+            ).encode(),
+            digest_size=16,
+        )
+        file_key.update(content)
+        return f"{_path_key(path)}-{file_key.hexdigest()}"
+
+    def load(self, key: str) -> tuple[bool, Any]:
+        """
+        Load an entry.
+
+        Parameters
+        ----------
+        key: The key of the entry.
+
+        Returns
+        -------
+        A tuple of whether the entry was found and the plain data of the
+        configuration, with the Configclass objects as tagged
+        dictionaries, which parse_config constructs.
+        """
+        entry_file = self._entry_file(key)
+        try:
+            with open(entry_file, "rb") as f:
+                data = f.read()
+        except OSError:
+            data = b""
+        config = None
+        found = data.startswith(_MAGIC)
+        if found:
+            try:
+                config = deserialize_binary(memoryview(data)[len(_MAGIC) :])
+            except ValueError:
+                # E.g. a truncated entry
+                found = False
+        with self._lock:
+            if found:
+                self._hits += 1
+            else:
+                self._misses += 1
+        if found:
+            # Mark the entry as recently used for the eviction
+            try:
+                os.utime(entry_file)
+            except OSError:
+                # Evicted concurrently
+                pass
+        return found, config
+
+    def store(self, key: str, config: Any) -> bool:
+        """
+        Store an entry.
+
+        Other entries of the same file are removed, since they are stale.
+
+        Parameters
+        ----------
+        key: The key of the entry.
+        config: The parsed configuration.
+
+        Returns
+        -------
+        True if the entry was stored, False if the configuration can not
+        be written in the binary format, is larger than the cache or can
+        not be written.
+        """
+        try:
+            data = serialize_binary(config)
+        except (TypeError, ValueError):
+            # E.g. sets or file handles
+            return False
+        if len(_MAGIC) + len(data) > self.max_size:
+            return False
+        path_key = key.split("-", 1)[0]
+        with self._lock:
+            try:
+                fd, temp_file = tempfile.mkstemp(
+                    dir=self.directory, suffix=".tmp"
+                )
+            except OSError:
+                return False
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_MAGIC)
+                    f.write(data)
+                os.replace(temp_file, self._entry_file(key))
+            except OSError:
+                # E.g. the disk is full
+                _remove(temp_file)
+                return False
+            except BaseException:
+                _remove(temp_file)
+                raise
+            for entry in os.scandir(self.directory):
+                if (
+                    entry.name.startswith(f"{path_key}-")
+                    and entry.name.endswith(_SUFFIX)
+                    and entry.name != f"{key}{_SUFFIX}"
+                ):
+                    _remove(entry.path)
+            self._evict()
+        return True
+
+    def _entry_file(self, key: str) -> str:
+        """Get the file of an entry."""
+        return os.path.join(self.directory, f"{key}{_SUFFIX}")
+
+    def _evict(self):
+        """Remove the least recently used entries above the maximum size."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, entry_file in sorted(entries):
+            if size <= self.max_size:
+                break
+            _remove(entry_file)
+            size -= entry_size
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(_SUFFIX):
+                    _remove(entry.path)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get the cache statistics.
+
+        Returns
+        -------
+        A dictionary with the hits and misses of the cache, the number of
+        entries and their size in bytes.
+        """
+        entries = [
+            entry.stat().st_size
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(_SUFFIX)
+        ]
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(entries),
+                "size": sum(entries),
+            }
+
+
+_fingerprint: tuple[int, bytes] = (-1, b"")
+
+
+def _registry_fingerprint() -> bytes:
+    """
+    Get the fingerprint of the registered classes and their fields.
+
+    The source files of the modules of the classes are hashed as well, so
+    changed validators invalidate the entries. The fingerprint is computed
+    once per change of the registry.
+    """
+    global _fingerprint
+    generation = ConfigClassRegistry.generation()
+    if _fingerprint[0] != generation:
+        classes = []
+        sources: dict[str, str | None] = {}
+        for class_str, registered_class in sorted(ConfigClassRegistry.items()):
+            fields = getattr(registered_class, "__pydantic_fields__", {})
+            module = getattr(registered_class, "__module__", None)
+            if module not in sources:
+                sources[module] = _source_hash(module)
+            classes.append(
+                (
+                    class_str,
+                    [
+                        (name, repr(field_info.annotation))
+                        for name, field_info in fields.items()
+                    ],
+                    sources[module],
+                )
+            )
+        _fingerprint = (
+            generation,
+            hashlib.blake2b(repr(classes).encode(), digest_size=16).digest(),
+        )
+    return _fingerprint[1]
+
+
+def _source_hash(module_name: str | None) -> str | None:
+    """Hash the source file of a module, None if it has no readable file."""
+    module = sys.modules.get(module_name) if module_name else None
+    source_file = getattr(module, "__file__", None)
+    if source_file is None:
+        return None
+    try:
+        with open(source_file, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def _path_key(path: str) -> str:
+    """Get the part of the entry keys identifying a file path."""
+    return hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
+
+
+def _remove(entry_file: str):
+    """Remove an entry file, which may be removed concurrently."""
+    try:
+        os.remove(entry_file)
+    except FileNotFoundError:
+        pass
+
+
+__all__ = ["ConfigCache"]
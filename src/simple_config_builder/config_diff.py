@@ -0,0 +1,164 @@
+"""
+Structural diff of configuration data.
+
+diff_configs compares two trees of dictionaries, lists, tuples and
+Configclass instances and returns the changes as (path, old, new)
+tuples, where `old` is MISSING for added and `new` is MISSING for removed
+values. A changed value is reported at the deepest path at which the
+trees differ, e.g. `db.pools[2].timeout` instead of `db`. Items of lists
+and tuples are compared by position.
+
+Identical subtrees are skipped by identity, so trees which share their
+unchanged instances, like the reloads of a Configparser, are compared in
+time proportional to the change. Other subtrees are compared by
+equality before they are walked, which runs mostly in C and stops at
+the first difference.
+
+Example:
+    ``` python
+    from simple_config_builder.config_diff import diff_configs
+
+    for path, old, new in diff_configs(old_config, new_config):
+        print(f"{path}: {old!r} -> {new!r}")
+    ```
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+from simple_config_builder.config import Configclass
+from simple_config_builder.config_formats import FormatRegistry
+from simple_config_builder.config_index import child_path
+from simple_config_builder.config_io import parse_config
+
+
+class _Missing:
+    """Type of the MISSING marker."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+# Old value of added and new value of removed paths
+MISSING: Any = _Missing()
+
+
+class Change(NamedTuple):
+    """Change of a path of configuration data."""
+
+    path: str
+    old: Any
+    new: Any
+
+
+# The types of values without children
+_SCALARS = frozenset({str, int, float, bool, type(None), bytes})
+
+
+def diff_configs(old: Any, new: Any, path: str = "") -> list[Change]:
+    """
+    Get the changes between two trees of configuration data.
+
+    Parameters
+    ----------
+    old: The old configuration data.
+    new: The new configuration data.
+    path: The path of the trees, which prefixes the paths of the changes.
+        Defaults to "", the root.
+
+    Returns
+    -------
+    The changes in the order of the data, the old value of added paths
+    and the new value of removed paths are MISSING.
+    """
+    changes: list[Change] = []
+    stack = [(path, old, new)]
+    while stack:
+        path, old, new = stack.pop()
+        if old is new:
+            continue
+        value_type = type(old)
+        if value_type is not type(new):
+            changes.append(Change(path, old, new))
+        elif value_type in _SCALARS:
+            if old != new:
+                changes.append(Change(path, old, new))
+        elif isinstance(old, Configclass):
+            if old != new:
+                _push_mapping(stack, path, old.__dict__, new.__dict__)
+        elif isinstance(old, dict):
+            if old != new:
+                _push_mapping(stack, path, old, new)
+        elif isinstance(old, list | tuple):
+            if old != new:
+                _push_sequence(stack, path, old, new)
+        elif old != new:
+            changes.append(Change(path, old, new))
+    return changes
+
+
+def _push_mapping(
+    stack: list[tuple[str, Any, Any]], path: str, old: dict, new: dict
+):
+    """Push the items of two mappings to compare."""
+    # The children are pushed in reverse, so they are compared in order.
+    # Added and removed values differ in type from MISSING.
+    added = [
+        (child_path(path, key, True), MISSING, value)
+        for key, value in new.items()
+        if key not in old
+    ]
+    stack.extend(reversed(added))
+    stack.extend(
+        (child_path(path, key, True), value, new.get(key, MISSING))
+        for key, value in reversed(old.items())
+    )
+
+
+def _push_sequence(
+    stack: list[tuple[str, Any, Any]],
+    path: str,
+    old: list | tuple,
+    new: list | tuple,
+):
+    """Push the items of two sequences to compare by position."""
+    old_length = len(old)
+    new_length = len(new)
+    for index in range(max(old_length, new_length) - 1, -1, -1):
+        stack.append(
+            (
+                child_path(path, index, False),
+                old[index] if index < old_length else MISSING,
+                new[index] if index < new_length else MISSING,
+            )
+        )
+
+
+def diff_files(old_file: str, new_file: str) -> list[Change]:
+    """
+    Get the changes between two configuration files.
+
+    The files can be of different formats, e.g. YAML and JSON. The
+    formats are looked up by the file extensions in the FormatRegistry.
+
+    Parameters
+    ----------
+    old_file: The path of the old configuration file.
+    new_file: The path of the new configuration file.
+
+    Returns
+    -------
+    The changes, see diff_configs.
+
+    Raises
+    ------
+    ValueError: If the format of a file is not known.
+    """
+    return diff_configs(
+        parse_config(old_file, FormatRegistry.config_type_of(old_file)),
+        parse_config(new_file, FormatRegistry.config_type_of(new_file)),
+    )
+
+
+__all__ = ["MISSING", "Change", "diff_configs", "diff_files"]
@@ -0,0 +1,383 @@
+"""
+Registry of the readers and writers of the configuration file formats.
+
+Every configuration type is read and written by a ConfigFormat, which is
+registered in the FormatRegistry together with the file extensions of the
+format. parse_config, write_config and the Configparser look the format
+up in the registry, so formats can be added or replaced by faster
+implementations without changing them.
+
+Several formats can be registered for one configuration type. The
+available format with the highest priority is used, e.g. the orjson
+reader of JSON files if orjson is installed.
+
+Example:
+    ``` python
+    from simple_config_builder.config_formats import (
+        ConfigFormat,
+        FormatRegistry,
+    )
+    from simple_config_builder.config_types import ConfigTypes
+
+
+    @FormatRegistry.register
+    class FastJsonFormat(ConfigFormat):
+        config_type = ConfigTypes.JSON
+        extensions = (".json",)
+        priority = 20
+
+        def loads(self, config_bytes): ...
+
+        def dumps(self, config_data, compact=False): ...
+    ```
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from collections.abc import Iterable, Iterator
+from typing import IO, Any, ClassVar
+
+from simple_config_builder.config_types import ConfigTypes
+
+
+class ConfigFormat:
+    """
+    Reader and writer of a configuration file format.
+
+    A format reads the file content to plain data, i.e. dictionaries and
+    lists whose configuration objects are tagged with
+    `_config_class_type`, and writes configuration data to the content of
+    a file. Formats which read and write bytes in memory implement `loads`
+    and `dumps`, formats which read and write streams incrementally set
+    `streaming` and implement `load` and `dump`. The other pair defaults
+    to the implemented one.
+    """
+
+    # The configuration type and the file extensions of the format
+    config_type: ClassVar[ConfigTypes]
+    extensions: ClassVar[tuple[str, ...]] = ()
+    # The available format with the highest priority is used
+    priority: ClassVar[int] = 0
+    # Whether the format reads and writes bytes in memory, loads and dumps
+    bytes_io: ClassVar[bool] = True
+    # Whether load and dump read and write streams incrementally
+    streaming: ClassVar[bool] = False
+    # Whether the format stores a stream of records, see iter_configs
+    records: ClassVar[bool] = False
+
+    @classmethod
+    def available(cls) -> bool:
+        """
+        Check if the format can be used, e.g. its package is installed.
+
+        Returns
+        -------
+        True if the format can be used.
+        """
+        return True
+
+    def loads(self, config_bytes: bytes) -> Any:
+        """
+        Read the content of a file.
+
+        Parameters
+        ----------
+        config_bytes: The content of the file.
+
+        Returns
+        -------
+        The plain configuration data.
+        """
+        return self.load(io.BytesIO(config_bytes))
+
+    def dumps(self, config_data: Any, compact: bool = False) -> bytes:
+        """
+        Write configuration data to the content of a file.
+
+        Parameters
+        ----------
+        config_data: The configuration data, which may contain
+            Configclass objects.
+        compact: Write the content without layout, if the format has
+            one. Defaults to False.
+
+        Returns
+        -------
+        The content of the file.
+        """
+        f = io.BytesIO()
+        self.dump(config_data, f, compact)
+        return f.getvalue()
+
+    def load(self, f: IO[bytes]) -> Any:
+        """
+        Read a file opened in binary mode.
+
+        Parameters
+        ----------
+        f: The file.
+
+        Returns
+        -------
+        The plain configuration data.
+        """
+        return self.loads(f.read())
+
+    def dump(self, config_data: Any, f: IO[bytes], compact: bool = False):
+        """
+        Write configuration data to a file opened in binary mode.
+
+        Parameters
+        ----------
+        config_data: The configuration data.
+        f: The file.
+        compact: Write the content without layout. Defaults to False.
+        """
+        f.write(self.dumps(config_data, compact))
+
+    def validate(self, config_bytes: bytes, lazy_callables: bool) -> Any:
+        """
+        Construct the configuration directly from the content of a file.
+
+        Formats which can validate their content without reading it to
+        plain data first override the method, see ConfigJsonValidator.
+
+        Parameters
+        ----------
+        config_bytes: The content of the file.
+        lazy_callables: Whether callables are loaded lazily.
+
+        Returns
+        -------
+        The configuration, or None if the content has to be read with
+        `loads` and validated as plain data.
+        """
+        return None
+
+    def load_records(self, f: IO[bytes]) -> Iterator[Any]:
+        """
+        Read the records of a file one after another.
+
+        Formats which store a stream of records set `records` and
+        override the method together with `dump_records`.
+
+        Parameters
+        ----------
+        f: The file, opened in binary mode.
+
+        Returns
+        -------
+        An iterator over the plain data of the records, which holds one
+        record at a time.
+        """
+        raise NotImplementedError
+
+    def dump_records(self, records: Iterable[Any], f: IO[bytes]) -> int:
+        """
+        Write records one after another.
+
+        Parameters
+        ----------
+        records: The records, which are consumed one at a time.
+        f: The file, opened in binary mode.
+
+        Returns
+        -------
+        The number of written records.
+        """
+        raise NotImplementedError
+
+    def sections(
+        self, config_bytes: bytes
+    ) -> dict[Any, tuple[int, int]] | None:
+        """
+        Find the top level sections of a document in one cheap scan.
+
+        Formats which can read and write single sections of a document
+        override the method together with `load_section` and
+        `dump_sections`, see LazySections.
+
+        Parameters
+        ----------
+        config_bytes: The content of the file.
+
+        Returns
+        -------
+        The start and end offsets of the sections by their key, or None if
+        the document cannot be split, e.g. its root is not a mapping.
+        """
+        return None
+
+    def load_section(
+        self, config_bytes: bytes, key: Any, start: int, end: int
+    ) -> Any:
+        """
+        Read a section found by `sections`.
+
+        Parameters
+        ----------
+        config_bytes: The content of the file.
+        key: The key of the section.
+        start: The start offset of the section.
+        end: The end offset of the section.
+
+        Returns
+        -------
+        The plain data of the section.
+        """
+        raise NotImplementedError
+
+    def dump_sections(
+        self,
+        config_bytes: bytes,
+        sections: list[tuple[Any, tuple[int, int] | None, Any]],
+    ) -> bytes:
+        """
+        Write a document of sections, passing untouched sections through.
+
+        Parameters
+        ----------
+        config_bytes: The content of the file the sections were found in.
+        sections: The key of each section, its offsets in `config_bytes`
+            if it is written unchanged or None, and its value otherwise.
+
+        Returns
+        -------
+        The content of the file.
+        """
+        raise NotImplementedError
+
+
+class FormatRegistry:
+    """
+    Registry of the configuration formats.
+
+    Formats are stored per configuration type. The format in use for a
+    type is chosen once and recomputed when a format is registered.
+    """
+
+    __formats: ClassVar[dict[ConfigTypes, list[type[ConfigFormat]]]] = {}
+    __in_use: ClassVar[dict[ConfigTypes, ConfigFormat]] = {}
+
+    @classmethod
+    def register[T: type[ConfigFormat]](cls, format_class: T) -> T:
+        """
+        Register a format.
+
+        The method can be used as class decorator.
+
+        Parameters
+        ----------
+        format_class: The ConfigFormat subclass.
+
+        Returns
+        -------
+        The registered class.
+        """
+        formats = cls.__formats.setdefault(format_class.config_type, [])
+        if format_class not in formats:
+            formats.append(format_class)
+        cls.__in_use.clear()
+        return format_class
+
+    @classmethod
+    def unregister(cls, format_class: type[ConfigFormat]):
+        """
+        Unregister a format.
+
+        Parameters
+        ----------
+        format_class: The registered ConfigFormat subclass.
+        """
+        formats = cls.__formats.get(format_class.config_type, [])
+        if format_class in formats:
+            formats.remove(format_class)
+        cls.__in_use.clear()
+
+    @classmethod
+    def get(cls, config_type: ConfigTypes) -> ConfigFormat:
+        """
+        Get the format in use for a configuration type.
+
+        Parameters
+        ----------
+        config_type: The configuration type.
+
+        Returns
+        -------
+        The available format with the highest priority.
+
+        Raises
+        ------
+        ValueError: If no format is registered for the type.
+        ImportError: If no registered format is available.
+        """
+        config_format = cls.__in_use.get(config_type)
+        if config_format is not None:
+            return config_format
+        formats = cls.__formats.get(config_type)
+        if not formats:
+            raise ValueError("The configuration type is not supported.")
+        available = [
+            format_class
+            for format_class in formats
+            if format_class.available()
+        ]
+        if not available:
+            names = ", ".join(
+                format_class.__name__ for format_class in formats
+            )
+            raise ImportError(
+                f"No format of the configuration type {config_type.value} "
+                f"is available, the packages of {names} are not installed."
+            )
+        format_class = max(
+            available, key=lambda format_class: format_class.priority
+        )
+        config_format = format_class()
+        cls.__in_use[config_type] = config_format
+        return config_format
+
+    @classmethod
+    def formats(cls, config_type: ConfigTypes) -> list[type[ConfigFormat]]:
+        """
+        List the registered formats of a configuration type.
+
+        Parameters
+        ----------
+        config_type: The configuration type.
+
+        Returns
+        -------
+        The format classes, available or not.
+        """
+        return list(cls.__formats.get(config_type, ()))
+
+    @classmethod
+    def config_type_of(cls, config_file: str) -> ConfigTypes:
+        """
+        Get the configuration type of a file from its extension.
+
+        Parameters
+        ----------
+        config_file: The configuration file path.
+
+        Returns
+        -------
+        The configuration type.
+
+        Raises
+        ------
+        ValueError: If no format is registered for the extension.
+        """
+        extension = os.path.splitext(config_file)[1]
+        for config_type, formats in cls.__formats.items():
+            for format_class in formats:
+                if extension in format_class.extensions:
+                    return config_type
+        raise ValueError("The configuration type is not supported.")
+
+
+__all__ = ["ConfigFormat", "FormatRegistry"]
@@ -0,0 +1,308 @@
+"""
+Inverted index of the fields and types of configuration data.
+
+The ConfigIndex maps every field name to the paths it occurs at and every
+type to the values of it, so Configparser.contains and
+Configparser.find_all do not walk the configuration data on each call.
+The index is built with one walk and is updated on the assignments of
+the Configclass instances through the AssignmentObservers, only the
+assigned subtree is walked again. Mutations of containers, e.g.
+`config.values.append(1)`, do not go through an assignment, they are
+indexed by an explicit call of ConfigIndex.reindex.
+
+Paths are written like the paths of construction errors, e.g.
+`db.pools[2].timeout`.
+
+Example:
+    ``` python
+    from simple_config_builder.config_index import ConfigIndex
+
+    index = ConfigIndex(config_data)
+    index.find_field("timeout")  # [("db.pools[2].timeout", 5), ...]
+    index.find_type(PoolConfig)  # [("db.pools[2]", PoolConfig(...)), ...]
+    ```
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from threading import RLock
+from typing import Any
+
+from simple_config_builder.config import AssignmentObservers, Configclass
+
+
+def child_path(path: str, key: Any, mapping: bool) -> str:
+    """
+    Get the path of a child, e.g. `a.b` or `a[3]`.
+
+    Parameters
+    ----------
+    path: The path of the parent, "" for the root.
+    key: The key or index of the child.
+    mapping: Whether the parent is a mapping or a Configclass.
+
+    Returns
+    -------
+    The path of the child.
+    """
+    if not mapping:
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if path else str(key)
+
+
+# The types of values without children
+_SCALARS = frozenset({str, int, float, bool, type(None), bytes})
+_NO_CHILDREN: dict[Any, int] = {}
+
+# The fields of the nodes of the index
+_PARENT, _KEY, _MAPPING, _FIELD, _VALUE, _CHILDREN = range(6)
+
+
+class ConfigIndex:
+    """
+    Index from field names to paths and from types to values.
+
+    Field names are the keys of mappings, the fields of Configclass
+    instances and the strings of lists and tuples, like in
+    Configparser.contains. Every value of the data is indexed by its type,
+    except a dictionary or list at the root.
+
+    The values are indexed as nodes, which refer to their parent node and
+    their key in it, so keys which contain dots do not collide with the
+    paths of nested values. The paths are only written for the results.
+    """
+
+    def __init__(self, config_data: Any):
+        """
+        Index configuration data.
+
+        Parameters
+        ----------
+        config_data: The configuration data.
+        """
+        self._lock = RLock()
+        self._config_data = config_data
+        # Field name -> node ids, type -> node ids
+        self._fields: dict[Any, dict[int, None]] = {}
+        self._types: dict[type, dict[int, None]] = {}
+        # Node id -> [parent node id, key in the parent, whether the parent
+        # is a mapping or Configclass, field name or None, value, child
+        # node ids by their keys]
+        self._nodes: dict[int, list[Any]] = {}
+        self._next_node = 0
+        # id of a Configclass instance -> its node ids
+        self._instances: dict[int, dict[int, None]] = {}
+        # Query type -> the indexed types which are subclasses of it
+        self._subclasses: dict[type, list[type]] = {}
+        # Called with the path, old and new value of every assigned field
+        self.on_assigned: Callable[[str, Any, Any], object] | None = None
+        self._add(None, None, True, None, config_data)
+
+    def close(self):
+        """Stop updating the index on assignments."""
+        with self._lock:
+            for node_ids in self._instances.values():
+                config = self._nodes[next(iter(node_ids))][_VALUE]
+                AssignmentObservers.unobserve(config, self._assigned)
+            self._instances.clear()
+
+    def reindex(self):
+        """
+        Index the configuration data again.
+
+        Mutations of containers, e.g. `config.values.append(1)`, do not
+        go through an assignment and are only indexed by a reindex.
+        """
+        with self._lock:
+            self.close()
+            self._fields.clear()
+            self._types.clear()
+            self._nodes.clear()
+            self._subclasses.clear()
+            self._add(None, None, True, None, self._config_data)
+
+    def find_field(self, field: Any) -> list[tuple[str, Any]]:
+        """
+        Find every occurrence of a field name.
+
+        Parameters
+        ----------
+        field: The field name.
+
+        Returns
+        -------
+        The paths and values of the fields, and of the strings of lists
+        and tuples which equal the name.
+        """
+        with self._lock:
+            return [
+                (self._path(node_id), self._nodes[node_id][_VALUE])
+                for node_id in self._fields.get(field, ())
+            ]
+
+    def find_type(self, config_type: type) -> list[tuple[str, Any]]:
+        """
+        Find every value which is an instance of a type.
+
+        Parameters
+        ----------
+        config_type: The type, e.g. a Configclass.
+
+        Returns
+        -------
+        The paths and values of the instances.
+        """
+        with self._lock:
+            return [
+                (self._path(node_id), self._nodes[node_id][_VALUE])
+                for indexed_type in self._subclasses_of(config_type)
+                for node_id in self._types[indexed_type]
+            ]
+
+    def has_field(self, field: Any) -> bool:
+        """Check if a field name occurs in the data."""
+        with self._lock:
+            return field in self._fields
+
+    def has_type(self, config_type: type) -> bool:
+        """Check if the data contains an instance of a type."""
+        with self._lock:
+            return bool(self._subclasses_of(config_type))
+
+    def _path(self, node_id: int) -> str:
+        """Write the path of a node."""
+        keys = []
+        node = self._nodes[node_id]
+        while node[_PARENT] is not None:
+            keys.append((node[_KEY], node[_MAPPING]))
+            node = self._nodes[node[_PARENT]]
+        path = ""
+        for key, mapping in reversed(keys):
+            path = child_path(path, key, mapping)
+        return path
+
+    def _subclasses_of(self, config_type: type) -> list[type]:
+        """Get the indexed types which are subclasses of a type."""
+        subclasses = self._subclasses.get(config_type)
+        if subclasses is None:
+            subclasses = [
+                indexed_type
+                for indexed_type in self._types
+                if issubclass(indexed_type, config_type)
+            ]
+            self._subclasses[config_type] = subclasses
+        return subclasses
+
+    def _assigned(self, config: Configclass, name: str):
+        """Index the subtree of an assigned field again."""
+        assigned = []
+        with self._lock:
+            value = getattr(config, name)
+            for node_id in list(self._instances.get(id(config), ())):
+                old_id = self._nodes[node_id][_CHILDREN].get(name)
+                if old_id is not None:
+                    old_value = self._nodes[old_id][_VALUE]
+                    assigned.append((self._path(old_id), old_value))
+                    self._remove(old_id)
+                self._add(node_id, name, True, name, value)
+        on_assigned = self.on_assigned
+        if on_assigned is not None:
+            for path, old_value in assigned:
+                on_assigned(path, old_value, value)
+
+    def _add(
+        self,
+        parent: int | None,
+        key: Any,
+        mapping: bool,
+        field: Any,
+        value: Any,
+    ):
+        """Index a value and its subtree."""
+        nodes = self._nodes
+        fields = self._fields
+        types = self._types
+        stack = [(parent, key, mapping, field, value)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            parent, key, mapping, field, value = pop()
+            node_id = self._next_node
+            self._next_node += 1
+            node = [parent, key, mapping, field, value, _NO_CHILDREN]
+            nodes[node_id] = node
+            if parent is not None:
+                nodes[parent][_CHILDREN][key] = node_id
+            if field is not None:
+                node_ids = fields.get(field)
+                if node_ids is None:
+                    node_ids = fields[field] = {}
+                node_ids[node_id] = None
+            value_type = type(value)
+            if parent is not None or not isinstance(value, Mapping | list):
+                node_ids = types.get(value_type)
+                if node_ids is None:
+                    node_ids = types[value_type] = {}
+                    self._subclasses.clear()
+                node_ids[node_id] = None
+            if value_type in _SCALARS:
+                continue
+
+            if isinstance(value, Configclass):
+                self._instances.setdefault(id(value), {})[node_id] = None
+                AssignmentObservers.observe(value, self._assigned)
+                # The fields of a Configclass are the keys of its __dict__
+                items = list(value.__dict__.items())
+                child_mapping = True
+            elif isinstance(value, Mapping):
+                items = list(value.items())
+                child_mapping = True
+            elif isinstance(value, list | tuple):
+                items = list(enumerate(value))
+                child_mapping = False
+            else:
+                continue
+            node[_CHILDREN] = {}
+            # The children are indexed in the order of the data
+            for child_key, item in reversed(items):
+                if child_mapping:
+                    item_field = child_key
+                elif isinstance(item, str):
+                    item_field = item
+                else:
+                    item_field = None
+                push((node_id, child_key, child_mapping, item_field, item))
+
+    def _remove(self, node_id: int):
+        """Remove a value and its subtree from the index."""
+        nodes = self._nodes
+        parent = nodes[node_id][_PARENT]
+        if parent is not None:
+            del nodes[parent][_CHILDREN][nodes[node_id][_KEY]]
+        stack = [node_id]
+        while stack:
+            node_id = stack.pop()
+            _, _, _, field, value, children = nodes.pop(node_id)
+            if field is not None:
+                node_ids = self._fields[field]
+                del node_ids[node_id]
+                if not node_ids:
+                    del self._fields[field]
+            node_ids = self._types.get(type(value))
+            # The dictionary or list at the root is not indexed by its type
+            if node_ids is not None and node_id in node_ids:
+                del node_ids[node_id]
+                if not node_ids:
+                    del self._types[type(value)]
+                    self._subclasses.clear()
+            if isinstance(value, Configclass):
+                node_ids = self._instances[id(value)]
+                del node_ids[node_id]
+                if not node_ids:
+                    del self._instances[id(value)]
+                    AssignmentObservers.unobserve(value, self._assigned)
+            stack.extend(children.values())
+
+
+__all__ = ["ConfigIndex", "child_path"]
@@ -4,15 +4,38 @@ The module contains the IO functions.
 The IO functions are used to read and write the configuration file.
 """
 
-from typing import Any
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import IO, Any, ClassVar
 
-import importlib
+import importlib.util
+import io
+import json
 import os
+import re
+import secrets
+import stat
 
 from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError, to_json
 
-from simple_config_builder.config import ConfigClassRegistry, Configclass
-from simple_config_builder.config_types import ConfigTypes
+from simple_config_builder.config import Configclass
+from simple_config_builder.config_binary import (
+    deserialize_binary,
+    deserialize_section,
+    scan_sections,
+    serialize_binary,
+    serialize_sections,
+)
+from simple_config_builder.config_cache import ConfigCache
+from simple_config_builder.config_formats import ConfigFormat, FormatRegistry
+from simple_config_builder.config_tree import (
+    ConfigJsonValidator,
+    ConfigTreeValidator,
+    resolve_config_class,
+    validate_config_class,
+)
+from simple_config_builder.config_types import ConfigTypes, Durability
 
 
 def to_dict(obj: Any) -> dict | list | tuple:
@@ -40,7 +63,11 @@ def to_dict(obj: Any) -> dict | list | tuple:
 
 
 def parse_config(
-    config_file: str, config_type: ConfigTypes
+    config_file: str,
+    config_type: ConfigTypes,
+    lazy_callables: bool = False,
+    cache: ConfigCache | None = None,
+    config_bytes: bytes | None = None,
 ) -> dict | list | Configclass:
     """
     Parse the configuration file.
@@ -49,96 +76,196 @@ def parse_config(
     ----------
     config_file: The configuration file path.
     config_type: The configuration file type.
+    lazy_callables: Load callables as LazyCallable proxies, so the modules
+        they reference are imported on first use. Defaults to False.
+    cache: Return the stored result of an unchanged file from this cache
+        and store the result of a parse in it. Defaults to None.
+    config_bytes: The content of the file, if it was already read.
+        Defaults to None, which reads the file.
 
     Returns
     -------
     The configuration dictionary.
     """
-    config_data_dct = {}
-    match config_type:
-        case ConfigTypes.JSON:
-            config_data_dct = parse_json(config_file)
-        case ConfigTypes.YAML:
-            config_data_dct = parse_yaml(config_file)
-        case ConfigTypes.TOML:
-            config_data_dct = parse_toml(config_file)
-        case _:
-            raise ValueError("The configuration type is not supported.")
-    return construct_config(config_data_dct)
-
-
-def construct_config(config_data: Any):
-    """Construct the configuration objects."""
-    # If the configuration data is not a dictionary,
-    if not isinstance(config_data, dict):
-        return config_data
-
-    # Recursively construct the configuration objects
-    # from the configuration dictionary.
-    for key, value in config_data.items():
-        if isinstance(value, dict):
-            config_data[key] = construct_config(value)
-        if isinstance(value, list):
-            for i, item in enumerate(value):
-                if isinstance(item, dict):
-                    value[i] = construct_config(item)
-        if isinstance(value, tuple):
-            value = list(value)
-            for i, item in enumerate(value):
-                if isinstance(item, dict):
-                    value[i] = construct_config(item)
-            config_data[key] = tuple(value)
-    if "_config_class_type" in config_data:
-        config_class_type = config_data["_config_class_type"]
-        if not isinstance(config_class_type, str):
-            raise ValueError(
-                "The _config_class_type must be a "
-                "string representing the class type."
-            )
-
-        # cut of the class name if it is a full path
-        if "." in config_class_type:
-            config_class_module = config_class_type.rsplit(".", 1)[0]
+    config_format = FormatRegistry.get(config_type)
+    if config_bytes is None:
+        if not os.path.exists(config_file):
+            return {}
+        with open(config_file, "rb") as f:
+            if cache is None and (
+                config_format.streaming or not config_format.bytes_io
+            ):
+                return validate_config(config_format.load(f), lazy_callables)
+            config_bytes = f.read()
+    if cache is None:
+        return _parse_bytes(config_format, config_bytes, lazy_callables)
+    # The key is computed from the parsed content, so a concurrent write
+    # of the file can not store a stale result under the key of the write
+    key = cache.key(config_file, config_type, lazy_callables, config_bytes)
+    found, config_data = cache.load(key)
+    if found:
         try:
-            importlib.import_module(config_class_module)
-        except ImportError:
-            raise ImportError(
-                f"Could not import the module '{config_class_module}'. "
-                "Please make sure the module is installed and available "
-                "in the Python path."
-            )
-        try:
-            config_class = ConfigClassRegistry.get(config_class_type)
-        except ValueError:
-            raise ValueError(
-                f"Please make sure the class '{config_class_type}' "
-                f"is in the module '{config_class_module}'."
-            )
-        del config_data["_config_class_type"]
+            return validate_config(config_data, lazy_callables)
+        except (ValueError, ImportError):
+            # E.g. a class of the configuration was removed or renamed
+            pass
+    config = _parse_bytes(config_format, config_bytes, lazy_callables)
+    cache.store(key, config)
+    return config
 
-        # Log the expected fields of the config class
-        expected_fields = set(config_class.__pydantic_fields__.keys())
 
-        # Log the actual keys in the config data
-        actual_keys = set(config_data.keys())
+def _parse_bytes(
+    config_format: ConfigFormat, config_bytes: bytes, lazy_callables: bool
+) -> Any:
+    """Parse and validate the content of a configuration file."""
+    if config_format.bytes_io and not config_format.streaming:
+        # E.g. typed JSON documents are validated from the bytes
+        config = config_format.validate(config_bytes, lazy_callables)
+        if config is not None:
+            return config
+    return validate_config(
+        _load_bytes(config_format, config_bytes), lazy_callables
+    )
 
-        # Check for mismatched keys
-        mismatched_keys = actual_keys - expected_fields
-        if mismatched_keys:
-            raise ValueError(
-                f"Mismatched keys in config data: {mismatched_keys}. "
-                f"Expected fields: {expected_fields}"
-            )
-        # Filter config_data to include only expected fields
-        filtered_config_data = {
-            key: value
-            for key, value in config_data.items()
-            if key in expected_fields
-        }
 
-        # Pass filtered_config_data as a single dictionary argument
-        return config_class.model_validate(filtered_config_data)
-    return config_data
+def _load_bytes(config_format: ConfigFormat, config_bytes: bytes) -> Any:
+    """Read the content of a configuration file to plain data."""
+    if config_format.streaming or not config_format.bytes_io:
+        return config_format.load(io.BytesIO(config_bytes))
+    return config_format.loads(config_bytes)
+
+
+def load_config_data(
+    config_file: str,
+    config_type: ConfigTypes,
+    config_bytes: bytes | None = None,
+) -> Any:
+    """
+    Load the parsed data of a configuration file without constructing it.
+
+    Parameters
+    ----------
+    config_file: The configuration file path.
+    config_type: The configuration file type.
+    config_bytes: The content of the file, if it was already read.
+        Defaults to None, which reads the file.
+
+    Returns
+    -------
+    The parsed data, with the Configclass nodes as tagged dictionaries.
+    """
+    config_format = FormatRegistry.get(config_type)
+    if config_bytes is not None:
+        return _load_bytes(config_format, config_bytes)
+    if not os.path.exists(config_file):
+        return {}
+    with open(config_file, "rb") as f:
+        if config_format.streaming or not config_format.bytes_io:
+            return config_format.load(f)
+        return config_format.loads(f.read())
+
+
+def validate_config(config_data: Any, lazy_callables: bool = False) -> Any:
+    """
+    Construct the configuration objects of parsed configuration data.
+
+    Parameters
+    ----------
+    config_data: The parsed configuration data.
+    lazy_callables: Load callables as LazyCallable proxies.
+        Defaults to False.
+
+    Returns
+    -------
+    The configuration data with the Configclass objects constructed.
+    """
+    try:
+        return ConfigTreeValidator.validate(config_data, lazy_callables)
+    except RecursionError:
+        # The tree is too deep for the single pass validation
+        return construct_config(config_data, lazy_callables)
+
+
+def construct_config(config_data: Any, lazy_callables: bool = False):
+    """
+    Construct the configuration objects.
+
+    The tree is traversed with an explicit stack instead of recursion, so
+    the depth of the configuration is not limited by the recursion limit.
+    Every dictionary, list and tuple is visited once. The children of a
+    node are constructed before the node itself. Errors get a note with
+    the path of the failing node, e.g. `a.b[3].c`.
+
+    Parameters
+    ----------
+    config_data: The parsed configuration data.
+    lazy_callables: Load callables as LazyCallable proxies.
+        Defaults to False.
+
+    Returns
+    -------
+    The configuration data with the Configclass objects constructed.
+    Dictionaries and lists are modified in place.
+    """
+    root = [config_data]
+    # The containers in the order of their visit with the index of their
+    # parent and their key in it. Tuples are collected into lists.
+    nodes: list[tuple[dict | list, int, Any, bool]] = []
+    stack: list[tuple[Any, int, Any]] = [(config_data, -1, 0)]
+    containers = (dict, list, tuple)
+    while stack:
+        node, parent, key = stack.pop()
+        if isinstance(node, dict):
+            items = node.items()
+            is_tuple = False
+        elif isinstance(node, list):
+            items = enumerate(node)
+            is_tuple = False
+        elif isinstance(node, tuple):
+            node = list(node)
+            items = enumerate(node)
+            is_tuple = True
+        else:
+            continue
+        index = len(nodes)
+        nodes.append((node, parent, key, is_tuple))
+        for child_key, child in items:
+            if isinstance(child, containers):
+                stack.append((child, index, child_key))
+
+    # Children are visited after their parents, so the reversed order
+    # constructs every node after its children.
+    for index in range(len(nodes) - 1, -1, -1):
+        node, parent, key, is_tuple = nodes[index]
+        container = root if parent < 0 else nodes[parent][0]
+        if is_tuple:
+            container[key] = tuple(node)
+        elif isinstance(node, dict) and "_config_class_type" in node:
+            try:
+                config_class = resolve_config_class(node["_config_class_type"])
+                del node["_config_class_type"]
+                container[key] = validate_config_class(
+                    config_class, node, lazy_callables
+                )
+            except Exception as e:
+                path = _node_path(nodes, index)
+                if path:
+                    e.add_note(f"In the configuration at '{path}'.")
+                raise
+    return root[0]
+
+
+def _node_path(nodes: list, index: int) -> str:
+    """Get the path of a node of construct_config, e.g. `a.b[3].c`."""
+    parts = []
+    _, parent, key, _ = nodes[index]
+    while parent >= 0:
+        if isinstance(nodes[parent][0], dict):
+            parts.append(f".{key}")
+        else:
+            parts.append(f"[{key}]")
+        _, parent, key, _ = nodes[parent]
+    return "".join(reversed(parts)).removeprefix(".")
 
 
 def parse_json(config_file: str):
@@ -156,12 +283,123 @@ def parse_json(config_file: str):
     -------
     The parsed json data.
     """
+    return _read_file(config_file, ConfigTypes.JSON)
+
+
+def _read_file(config_file: str, config_type: ConfigTypes) -> Any:
+    """Read a file to plain data with the format in use of its type."""
     if not os.path.exists(config_file):
         return {}
-    import json
+    with open(config_file, "rb") as f:
+        return FormatRegistry.get(config_type).load(f)
+
+
+class YamlBackend:
+    """
+    Selection of the PyYAML implementation used to read and write YAML.
+
+    PyYAML ships the pure Python implementation and, if it was built with
+    libyaml, C accelerated loaders and dumpers, which are several times
+    faster and produce the same data and documents. By default the C
+    implementation is used if it is available. The backend can be forced
+    with `YamlBackend.use("python")` or `YamlBackend.use("libyaml")`, or
+    with the environment variable SIMPLE_CONFIG_BUILDER_YAML_BACKEND.
+    """
 
-    with open(config_file, "r") as f:
-        return json.load(f)
+    BACKENDS: ClassVar[tuple[str, ...]] = ("libyaml", "python")
+    __forced: ClassVar[str | None] = os.environ.get(
+        "SIMPLE_CONFIG_BUILDER_YAML_BACKEND"
+    )
+    __classes: ClassVar[dict[str, tuple[type, type]]] = {}
+
+    @classmethod
+    def use(cls, backend: str | None):
+        """
+        Force a backend.
+
+        Parameters
+        ----------
+        backend: "libyaml", "python" or None to select the backend
+            automatically.
+
+        Raises
+        ------
+        ValueError: If the backend is unknown.
+        ImportError: If libyaml is forced but not available.
+        """
+        if backend is not None and backend not in cls.BACKENDS:
+            raise ValueError(f"Unknown YAML backend {backend}.")
+        if backend == "libyaml" and not cls.available():
+            raise ImportError("PyYAML is not built with libyaml.")
+        cls.__forced = backend
+
+    @classmethod
+    def available(cls) -> bool:
+        """
+        Check if the C implementation is available.
+
+        Returns
+        -------
+        True if PyYAML is built with libyaml.
+        """
+        import yaml
+
+        return bool(getattr(yaml, "__with_libyaml__", False))
+
+    @classmethod
+    def name(cls) -> str:
+        """
+        Get the name of the backend in use.
+
+        Returns
+        -------
+        "libyaml" or "python".
+        """
+        if cls.__forced is not None:
+            return cls.__forced
+        return "libyaml" if cls.available() else "python"
+
+    @classmethod
+    def loader(cls) -> type:
+        """
+        Get the loader of the backend in use.
+
+        Returns
+        -------
+        yaml.CFullLoader or yaml.FullLoader.
+        """
+        return cls._classes()[0]
+
+    @classmethod
+    def dumper(cls) -> type:
+        """
+        Get the dumper of the backend in use.
+
+        Returns
+        -------
+        yaml.CDumper or yaml.Dumper.
+        """
+        return cls._classes()[1]
+
+    @classmethod
+    def _classes(cls) -> tuple[type, type]:
+        """Get and cache the loader and dumper of the backend in use."""
+        name = cls.name()
+        classes = cls.__classes.get(name)
+        if classes is None:
+            import yaml
+
+            if name == "python":
+                classes = (yaml.FullLoader, yaml.Dumper)
+            elif name != "libyaml":
+                # E.g. set by the environment variable
+                raise ValueError(f"Unknown YAML backend {name}.")
+            elif not cls.available():
+                raise ImportError("PyYAML is not built with libyaml.")
+            else:
+                classes = (yaml.CFullLoader, yaml.CDumper)
+            cls.__classes[name] = classes
+        return classes
 
 
 def parse_yaml(config_file: str):
@@ -179,12 +417,7 @@ def parse_yaml(config_file: str):
     -------
     The parsed yaml data.
     """
-    if not os.path.exists(config_file):
-        return {}
-    with open(config_file, "r") as f:
-        import yaml
-
-        return yaml.load(f, Loader=yaml.FullLoader)
+    return _read_file(config_file, ConfigTypes.YAML)
 
 
 def parse_toml(config_file: str):
@@ -199,38 +432,245 @@ def parse_toml(config_file: str):
     -------
     The parsed toml data.
     """
-    if not os.path.exists(config_file):
-        return {}
-    import toml
+    return _read_file(config_file, ConfigTypes.TOML)
 
-    with open(config_file, "r") as f:
-        return toml.load(f)
 
-
-def write_config(config_file: str, data: dict, config_type: ConfigTypes):
+def write_config(
+    config_file: str,
+    data: dict,
+    config_type: ConfigTypes,
+    compact: bool = False,
+    durability: Durability = Durability.FILE,
+):
     """
     Write the configuration file.
 
+    The file is replaced atomically, see Durability.
+
     Parameters
     ----------
     config_file: The configuration file path.
     data: The configuration data.
     config_type: The configuration file type.
+    compact: Write JSON without indentation. Defaults to False.
+    durability: What is flushed to the disk before the write returns.
+        Defaults to Durability.FILE.
+    """
+    config_format = FormatRegistry.get(config_type)
+    with atomic_write(config_file, "wb", durability) as f:
+        config_format.dump(data, f, compact)
+
+
+def serialize_config(
+    data: Any, config_type: ConfigTypes, compact: bool = False
+) -> bytes:
+    """
+    Serialize the configuration data to the content of a file.
+
+    The bytes are what write_config writes to the file.
+
+    Parameters
+    ----------
+    data: The configuration data.
+    config_type: The configuration file type.
+    compact: Serialize JSON without indentation. Defaults to False.
+
+    Returns
+    -------
+    The serialized configuration data.
+    """
+    return FormatRegistry.get(config_type).dumps(data, compact)
+
+
+def iter_configs(
+    config_file: str,
+    config_type: ConfigTypes | None = None,
+    lazy_callables: bool = False,
+) -> Iterator[Any]:
+    """
+    Iterate over the records of a JSON Lines or multi-document YAML file.
+
+    Every record is constructed as it is read, so only one record is held
+    in memory at a time, whatever the size of the file.
+
+    Parameters
+    ----------
+    config_file: The configuration file path.
+    config_type: The configuration file type. Defaults to None, which
+        takes the type from the file extension.
+    lazy_callables: Load callables as LazyCallable proxies.
+        Defaults to False.
+
+    Returns
+    -------
+    An iterator over the constructed records.
+
+    Raises
+    ------
+    ValueError: If the configuration type does not store records.
+    """
+    if config_type is None:
+        config_type = FormatRegistry.config_type_of(config_file)
+    config_format = FormatRegistry.get(config_type)
+    if not config_format.records:
+        raise ValueError("The configuration type does not store records.")
+    return _iter_records(config_file, config_format, lazy_callables)
+
+
+def _iter_records(
+    config_file: str, config_format: ConfigFormat, lazy_callables: bool
+) -> Iterator[Any]:
+    """Construct the records of a file as they are read."""
+    with open(config_file, "rb") as f:
+        for record in config_format.load_records(f):
+            yield validate_config(record, lazy_callables)
+
+
+def write_configs(
+    config_file: str,
+    records: Iterable[Any],
+    config_type: ConfigTypes | None = None,
+    durability: Durability = Durability.FILE,
+) -> int:
+    """
+    Write records to a JSON Lines or multi-document YAML file.
+
+    The records are written as they are consumed, so they can be produced
+    by a generator without holding them in memory. The file is replaced
+    atomically once all records are written.
+
+    Parameters
+    ----------
+    config_file: The configuration file path.
+    records: The records, e.g. Configclass objects.
+    config_type: The configuration file type. Defaults to None, which
+        takes the type from the file extension.
+    durability: What is flushed to the disk before the write returns.
+        Defaults to Durability.FILE.
+
+    Returns
+    -------
+    The number of written records.
+
+    Raises
+    ------
+    ValueError: If the configuration type does not store records.
+    """
+    if config_type is None:
+        config_type = FormatRegistry.config_type_of(config_file)
+    config_format = FormatRegistry.get(config_type)
+    if not config_format.records:
+        raise ValueError("The configuration type does not store records.")
+    with atomic_write(config_file, "wb", durability) as f:
+        return config_format.dump_records(records, f)
+
+
+def convert_config(
+    source_file: str,
+    target_file: str,
+    durability: Durability = Durability.FILE,
+):
+    """
+    Convert a configuration file to the format of another file.
+
+    The formats are taken from the file extensions, e.g. a `.yaml` file is
+    converted to the binary format by a target file with the `.scb`
+    extension. The data is converted without constructing the
+    configuration, so the Configclasses do not need to be imported.
+
+    Parameters
+    ----------
+    source_file: The path of the configuration file to convert.
+    target_file: The path of the converted configuration file.
+    durability: What is flushed to the disk before the write returns.
+        Defaults to Durability.FILE.
+    """
+    source_format = FormatRegistry.get(
+        FormatRegistry.config_type_of(source_file)
+    )
+    target_format = FormatRegistry.get(
+        FormatRegistry.config_type_of(target_file)
+    )
+    with open(source_file, "rb") as f:
+        config_data = source_format.load(f)
+    with atomic_write(target_file, "wb", durability) as f:
+        target_format.dump(config_data, f)
+
+
+@contextmanager
+def atomic_write(
+    config_file: str,
+    mode: str = "w",
+    durability: Durability = Durability.FILE,
+) -> Iterator[IO]:
+    """
+    Open a temporary file which atomically replaces a file when closed.
+
+    The temporary file is created in the directory of the file, so it is
+    renamed on the same file system. It gets the permissions of the
+    replaced file. If the block raises an exception, the temporary file is
+    removed and the file is left unchanged. A symbolic link is followed,
+    so the file it points to is replaced.
+
+    Parameters
+    ----------
+    config_file: The file path.
+    mode: The mode to open the temporary file with, "w" or "wb".
+        Defaults to "w".
+    durability: What is flushed to the disk before the file is replaced,
+        see Durability. Defaults to Durability.FILE.
+
+    Returns
+    -------
+    A context manager yielding the opened temporary file.
     """
-    # try to make the data to a dictionary
-    config_data = to_dict(data)
-    match config_type:
-        case ConfigTypes.JSON:
-            write_json(config_file, config_data)
-        case ConfigTypes.YAML:
-            write_yaml(config_file, config_data)
-        case ConfigTypes.TOML:
-            write_toml(config_file, config_data)
-        case _:
-            raise ValueError("The configuration type is not supported.")
+    config_file = os.path.realpath(config_file)
+    directory, name = os.path.split(config_file)
+    while True:
+        temp_file = os.path.join(
+            directory, f".{name}.{secrets.token_hex(4)}.tmp"
+        )
+        try:
+            # Created like open(config_file, "w") would, with the umask
+            fd = os.open(
+                temp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666
+            )
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, mode) as f:
+            try:
+                mode_bits = stat.S_IMODE(os.stat(config_file).st_mode)
+            except FileNotFoundError:
+                pass
+            else:
+                os.chmod(fd, mode_bits)
+            yield f
+            f.flush()
+            if durability is not Durability.NONE:
+                os.fsync(fd)
+        os.replace(temp_file, config_file)
+    except BaseException:
+        try:
+            os.unlink(temp_file)
+        except FileNotFoundError:
+            pass
+        raise
+    if durability is Durability.FULL:
+        directory_fd = os.open(directory or ".", os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
 
 
-def write_json(config_file: str, config_data: dict | list | tuple):
+def write_json(
+    config_file: str,
+    config_data: Any,
+    compact: bool = False,
+    durability: Durability = Durability.FILE,
+):
     """
     Write the JSON configuration file.
 
@@ -238,14 +678,87 @@ def write_json(config_file: str, config_data: dict | list | tuple):
     ----------
     config_file: The configuration file path.
     config_data: The configuration data.
+    compact: Write the JSON without indentation and whitespace.
+        Defaults to False.
+    durability: What is flushed to the disk before the write returns.
+        Defaults to Durability.FILE.
+    """
+    config_bytes = serialize_json(config_data, compact)
+    with atomic_write(config_file, "wb", durability) as f:
+        f.write(config_bytes)
+
+
+def serialize_json(config_data: Any, compact: bool = False) -> bytes:
+    """
+    Serialize the configuration data to JSON.
+
+    The data is serialized to bytes by pydantic-core, including the
+    Configclass objects in it, without converting them to dictionaries
+    first. The output is the same as `json.dump(config_data, f, indent=4)`
+    would write for the dictionaries of the data.
+
+    Parameters
+    ----------
+    config_data: The configuration data.
+    compact: Serialize the JSON without indentation and whitespace.
+        Defaults to False.
+
+    Returns
+    -------
+    The JSON document.
+    """
+    indent = None if compact else 4
+    try:
+        config_bytes = to_json(config_data, indent=indent, ensure_ascii=True)
+    except PydanticSerializationError:
+        # json raises the usual error for data which can not be serialized
+        config_bytes = None
+    if config_bytes is None or b'"None"' in config_bytes:
+        # pydantic-core writes None keys as "None", json as "null"
+        separators = (",", ":") if compact else None
+        return json.dumps(
+            to_dict(config_data), indent=indent, separators=separators
+        ).encode()
+    return _as_json_dump(config_bytes)
+
+
+# Strings of a JSON document and, outside of them, the exponents of
+# negative powers of ten and the floats from 1e-05 to 1e-04 written
+# without an exponent.
+_JSON_NUMBER = re.compile(
+    rb'"(?:[^"\\]|\\.)*"'
+    rb"|(?<=[0-9])e-([0-9])(?![0-9])"
+    rb"|(?<![0-9.])(0\.0000[1-9][0-9]*)"
+)
+
+
+def _as_json_number(match: re.Match) -> bytes:
+    """Write a number like the json module, strings are kept."""
+    if match.group(1) is not None:
+        return b"e-0" + match.group(1)
+    if match.group(2) is not None:
+        return repr(float(match.group(2))).encode()
+    return match.group(0)
+
+
+def _as_json_dump(config_bytes: bytes) -> bytes:
     """
-    import json
+    Format JSON written by pydantic-core like the json module does.
 
-    with open(config_file, "w") as f:
-        json.dump(config_data, f, indent=4)
+    The json module pads negative exponents of floats to two digits, e.g.
+    `1e-07`, writes the floats below 1e-04 with an exponent, e.g. `1e-05`
+    instead of `0.00001`, and escapes the DEL character in ascii output.
+    """
+    if b"e-" in config_bytes or b"0.0000" in config_bytes:
+        config_bytes = _JSON_NUMBER.sub(_as_json_number, config_bytes)
+    return config_bytes.replace(b"\x7f", b"\\u007f")
 
 
-def write_yaml(config_file: str, config_data: dict | list | tuple):
+def write_yaml(
+    config_file: str,
+    config_data: dict | list | tuple,
+    durability: Durability = Durability.FILE,
+):
     """
     Write the YAML configuration file.
 
@@ -253,14 +766,40 @@ def write_yaml(config_file: str, config_data: dict | list | tuple):
     ----------
     config_file: The configuration file path.
     config_data: The configuration data.
+    durability: What is flushed to the disk before the write returns.
+        Defaults to Durability.FILE.
+    """
+    config_bytes = serialize_yaml(config_data)
+    with atomic_write(config_file, "wb", durability) as f:
+        f.write(config_bytes)
+
+
+def serialize_yaml(config_data: dict | list | tuple) -> bytes:
+    """
+    Serialize the configuration data to YAML.
+
+    The document is the same for both YamlBackend implementations, except
+    that only the Python implementation writes the end marker `...` after
+    a single plain scalar and writes empty keys as explicit `? ''` keys.
+
+    Parameters
+    ----------
+    config_data: The configuration data.
+
+    Returns
+    -------
+    The YAML document.
     """
     import yaml
 
-    with open(config_file, "w") as f:
-        yaml.dump(config_data, f)
+    return yaml.dump(config_data, Dumper=YamlBackend.dumper()).encode()
 
 
-def write_toml(config_file: str, config_data: dict | list | tuple):
+def write_toml(
+    config_file: str,
+    config_data: dict | list | tuple,
+    durability: Durability = Durability.FILE,
+):
     """
     Write the TOML configuration file.
 
@@ -268,11 +807,480 @@ def write_toml(config_file: str, config_data: dict | list | tuple):
     ----------
     config_file: The configuration file path.
     config_data: The configuration data.
+    durability: What is flushed to the disk before the write returns.
+        Defaults to Durability.FILE.
+    """
+    config_bytes = serialize_toml(config_data)
+    with atomic_write(config_file, "wb", durability) as f:
+        f.write(config_bytes)
+
+
+def serialize_toml(config_data: dict | list | tuple) -> bytes:
+    """
+    Serialize the configuration data to TOML.
+
+    Parameters
+    ----------
+    config_data: The configuration data.
+
+    Returns
+    -------
+    The TOML document.
     """
     import toml
 
-    with open(config_file, "w") as f:
-        toml.dump(config_data, f)
+    return toml.dumps(config_data).encode()
+
+
+@FormatRegistry.register
+class JsonFormat(ConfigFormat):
+    """
+    JSON format of the json module and pydantic-core.
+
+    Typed documents are validated from the bytes by pydantic-core, see
+    ConfigJsonValidator, and the data is written by pydantic-core in the
+    layout of `json.dump(config_data, f, indent=4)`.
+    """
+
+    config_type = ConfigTypes.JSON
+    extensions = (".json",)
+
+    def loads(self, config_bytes: bytes) -> Any:
+        """Read a JSON document."""
+        return json.loads(config_bytes)
+
+    def dumps(self, config_data: Any, compact: bool = False) -> bytes:
+        """Write a JSON document."""
+        # The Configclass objects are serialized by pydantic-core
+        return serialize_json(config_data, compact)
+
+    def validate(self, config_bytes: bytes, lazy_callables: bool) -> Any:
+        """Validate a typed JSON document from the bytes."""
+        return ConfigJsonValidator.validate(config_bytes, lazy_callables)
+
+
+@FormatRegistry.register
+class OrjsonFormat(JsonFormat):
+    """
+    JSON format reading untyped documents with orjson, if installed.
+
+    Documents which orjson does not read, e.g. with `Infinity` or integers
+    beyond 64 bits, are read by the json module. The documents are written
+    like by JsonFormat, so the layout of the files does not depend on the
+    installed packages.
+    """
+
+    priority = 10
+
+    @classmethod
+    def available(cls) -> bool:
+        """Check if orjson is installed."""
+        return importlib.util.find_spec("orjson") is not None
+
+    def loads(self, config_bytes: bytes) -> Any:
+        """Read a JSON document with orjson."""
+        import orjson
+
+        try:
+            return orjson.loads(config_bytes)
+        except orjson.JSONDecodeError:
+            return json.loads(config_bytes)
+
+
+# Lines at the first column and the keys of them
+_YAML_TOP_LEVEL_LINE = re.compile(rb"^\S.*$", re.MULTILINE)
+_YAML_KEY = re.compile(
+    rb"('(?:[^']|'')*'|\"(?:[^\"\\]|\\.)*\"|[^\s#'\"\-?:,\[\]{}&*!|>%@`][^:]*)"
+    rb"[ \t]*:(?:[ \t]|\r?$)"
+)
+_YAML_ANCHOR = re.compile(rb"(?:^|[\s\[{,])&[^\s\[\]{},]", re.MULTILINE)
+# The rests of quoted scalars up to their closing quotes
+_YAML_QUOTE_END = {
+    ord("'"): re.compile(rb"(?:[^']|'')*'(?!')"),
+    ord('"'): re.compile(rb'(?:[^"\\]|\\.)*"'),
+}
+# The ends of plain scalars in the block and the flow context
+_YAML_PLAIN_END = re.compile(rb":(?=\s|$)|\s#")
+_YAML_FLOW_PLAIN_END = re.compile(rb"[,\[\]{}]|:(?=[\s,\[\]{}]|$)|\s#")
+_YAML_PROPERTY_END = re.compile(rb"[\s,\[\]{}]|$")
+_YAML_LINE_INDICATOR = re.compile(rb"[-?:](?:\s|$)")
+
+
+def _yaml_section_closed(section: bytes) -> bool:
+    """
+    Check that no quoted scalar or flow collection is open after a section.
+
+    Quoted scalars and flow collections may continue at the first column,
+    where the next line would not start a key then. The lines are scanned
+    for the tokens which open and close them, skipping the lines of block
+    scalars and of plain scalars. Tokens which are not understood count as
+    open.
+    """
+    if not any(char in section for char in (b"'", b'"', b"[", b"{")):
+        return True
+    quote = None
+    depth = 0
+    # The column of the node of a plain or block scalar continued below
+    plain = None
+    block = None
+    for line in section.split(b"\n"):
+        line = line.rstrip(b"\r")
+        position = 0
+        if quote is not None:
+            match = _YAML_QUOTE_END[quote].match(line)
+            if match is None:
+                continue
+            quote = None
+            position = match.end()
+        else:
+            if not line.strip():
+                continue
+            position = len(line) - len(line.lstrip(b" "))
+            if block is not None:
+                if position > block:
+                    continue
+                block = None
+            if plain is not None and position > plain:
+                # The continuation of a plain scalar
+                if line[position] == ord("#"):
+                    plain = None
+                    continue
+                if _YAML_LINE_INDICATOR.match(
+                    line, position
+                ) or _YAML_PLAIN_END.search(line, position):
+                    return False
+                continue
+            plain = None
+        node = token = position
+        while position < len(line):
+            char = line[position]
+            following = line[position + 1 : position + 2]
+            if char in b" \t":
+                position += 1
+            elif char == ord("#"):
+                if line[position - 1 : position] not in (b"", b" ", b"\t"):
+                    return False
+                break
+            elif char in b"'\"":
+                token = position
+                match = _YAML_QUOTE_END[char].match(line, position + 1)
+                if match is None:
+                    quote = char
+                    break
+                position = match.end()
+            elif char in b"[{":
+                depth += 1
+                position += 1
+            elif char in b"]}":
+                depth -= 1
+                if depth < 0:
+                    return False
+                position += 1
+            elif char == ord(",") and depth:
+                position += 1
+            elif char in b"-?:" and following in (b"", b" ", b"\t"):
+                node = token if char == ord(":") else position
+                position += 1
+            elif char in b"!&*":
+                position = _YAML_PROPERTY_END.search(line, position).start()
+            elif char in b"|>" and not depth:
+                # The lines of a block scalar are indented more than its node
+                block = node
+                break
+            elif char in b",%@`":
+                return False
+            else:
+                token = position
+                end = (
+                    _YAML_FLOW_PLAIN_END if depth else _YAML_PLAIN_END
+                ).search(line, position + 1)
+                if end is None:
+                    if not depth:
+                        plain = node
+                    break
+                if line[end.start()] in b" \t":
+                    break
+                position = end.start()
+    return quote is None and depth == 0
+
+
+@FormatRegistry.register
+class JsonLinesFormat(ConfigFormat):
+    """
+    JSON Lines format, a compact JSON document per record and line.
+
+    The file is read as the list of its records by parse_config.
+    """
+
+    config_type = ConfigTypes.JSONL
+    extensions = (".jsonl", ".ndjson")
+    streaming = True
+    records = True
+
+    def load(self, f: IO[bytes]) -> Any:
+        """Read the list of the records."""
+        return list(self.load_records(f))
+
+    def dump(self, config_data: Any, f: IO[bytes], compact: bool = False):
+        """Write a list of records."""
+        if not isinstance(config_data, list | tuple):
+            raise TypeError("JSON Lines files store a list of records.")
+        self.dump_records(config_data, f)
+
+    def load_records(self, f: IO[bytes]) -> Iterator[Any]:
+        """Read the records line by line, skipping blank lines."""
+        # E.g. orjson reads the lines if it is installed
+        json_format = FormatRegistry.get(ConfigTypes.JSON)
+        for line in f:
+            if not line.isspace():
+                yield json_format.loads(line)
+
+    def dump_records(self, records: Iterable[Any], f: IO[bytes]) -> int:
+        """Write every record as a compact JSON document on a line."""
+        count = 0
+        for record in records:
+            f.write(serialize_json(record, compact=True))
+            f.write(b"\n")
+            count += 1
+        return count
+
+
+@FormatRegistry.register
+class YamlFormat(ConfigFormat):
+    """YAML format of PyYAML, see YamlBackend."""
+
+    config_type = ConfigTypes.YAML
+    extensions = (".yaml", ".yml")
+    streaming = True
+    records = True
+
+    def loads(self, config_bytes: bytes) -> Any:
+        """Read a YAML document."""
+        import yaml
+
+        return yaml.load(config_bytes, Loader=YamlBackend.loader())
+
+    def load(self, f: IO[bytes]) -> Any:
+        """Read a YAML document from a file."""
+        import yaml
+
+        # libyaml reads decoded text faster than bytes
+        text = io.TextIOWrapper(f, encoding="utf-8")
+        try:
+            return yaml.load(text, Loader=YamlBackend.loader())
+        finally:
+            text.detach()
+
+    def dumps(self, config_data: Any, compact: bool = False) -> bytes:
+        """Write a YAML document."""
+        return serialize_yaml(to_dict(config_data))
+
+    def load_records(self, f: IO[bytes]) -> Iterator[Any]:
+        """Read the documents of a file separated by `---`."""
+        import yaml
+
+        text = io.TextIOWrapper(f, encoding="utf-8")
+        try:
+            yield from yaml.load_all(text, Loader=YamlBackend.loader())
+        finally:
+            text.detach()
+
+    def dump_records(self, records: Iterable[Any], f: IO[bytes]) -> int:
+        """Write every record as a document starting with `---`."""
+        count = 0
+        for record in records:
+            f.write(b"---\n")
+            f.write(self.dumps(record))
+            count += 1
+        return count
+
+    def sections(
+        self, config_bytes: bytes
+    ) -> dict[Any, tuple[int, int]] | None:
+        """
+        Find the top level keys of a block mapping by their lines.
+
+        A section reaches from the line of its key to the line of the next
+        key. Documents with other lines at the first column, e.g. several
+        documents or a sequence, documents with anchors, which may be
+        referenced across sections, and documents with quoted scalars or
+        flow collections continued past a section are not split.
+        """
+        import yaml
+
+        if _YAML_ANCHOR.search(config_bytes):
+            return None
+        starts = []
+        comment_start = None
+        for line in _YAML_TOP_LEVEL_LINE.finditer(config_bytes):
+            if line.group().startswith(b"#"):
+                # Comments before a key belong to its section
+                if comment_start is None:
+                    comment_start = line.start()
+                continue
+            match = _YAML_KEY.match(line.group())
+            if match is None:
+                return None
+            start = line.start() if comment_start is None else comment_start
+            starts.append((start, match.group(1)))
+            comment_start = None
+        if not starts:
+            return None
+        sections = {}
+        for index, (start, key_text) in enumerate(starts):
+            key = yaml.load(key_text, Loader=YamlBackend.loader())
+            if key in sections or isinstance(key, dict | list):
+                return None
+            end = (
+                starts[index + 1][0]
+                if index + 1 < len(starts)
+                else len(config_bytes)
+            )
+            # The lines before the first key belong to its section
+            start = 0 if index == 0 else start
+            if not _yaml_section_closed(config_bytes[start:end]):
+                return None
+            sections[key] = (start, end)
+        return sections
+
+    def load_section(
+        self, config_bytes: bytes, key: Any, start: int, end: int
+    ) -> Any:
+        """Read the value of a section from its lines."""
+        section = self.loads(config_bytes[start:end])
+        if not isinstance(section, dict) or list(section) != [key]:
+            raise ValueError(f"The section {key!r} cannot be read alone.")
+        return section[key]
+
+    def dump_sections(
+        self,
+        config_bytes: bytes,
+        sections: list[tuple[Any, tuple[int, int] | None, Any]],
+    ) -> bytes:
+        """Write the lines of the sections one after another."""
+        chunks = []
+        for key, offsets, value in sections:
+            if offsets is None:
+                chunk = self.dumps({key: value})
+            else:
+                chunk = config_bytes[offsets[0] : offsets[1]]
+                if not chunk.endswith(b"\n"):
+                    chunk += b"\n"
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+
+@FormatRegistry.register
+class TomlFormat(ConfigFormat):
+    """TOML format, read by tomllib and written by the toml package."""
+
+    config_type = ConfigTypes.TOML
+    extensions = (".toml",)
+
+    def loads(self, config_bytes: bytes) -> Any:
+        """Read a TOML document."""
+        import tomllib
+
+        return tomllib.loads(config_bytes.decode())
+
+    def dumps(self, config_data: Any, compact: bool = False) -> bytes:
+        """Write a TOML document."""
+        return serialize_toml(to_dict(config_data))
+
+
+@FormatRegistry.register
+class MsgpackFormat(ConfigFormat):
+    """
+    Binary MessagePack format, if the msgpack package is installed.
+
+    The plain data of the configuration is packed, so tuples are read as
+    lists and values need to be of the types MessagePack supports.
+    """
+
+    config_type = ConfigTypes.MSGPACK
+    extensions = (".msgpack",)
+    streaming = True
+
+    @classmethod
+    def available(cls) -> bool:
+        """Check if msgpack is installed."""
+        return importlib.util.find_spec("msgpack") is not None
+
+    def loads(self, config_bytes: bytes) -> Any:
+        """Read a MessagePack document."""
+        import msgpack
+
+        return msgpack.unpackb(
+            config_bytes, raw=False, strict_map_key=False, use_list=True
+        )
+
+    def load(self, f: IO[bytes]) -> Any:
+        """Read a MessagePack document incrementally from a file."""
+        import msgpack
+
+        unpacker = msgpack.Unpacker(
+            f, raw=False, strict_map_key=False, use_list=True
+        )
+        return unpacker.unpack()
+
+    def dumps(self, config_data: Any, compact: bool = False) -> bytes:
+        """Write a MessagePack document."""
+        import msgpack
+
+        return msgpack.packb(to_dict(config_data), use_bin_type=True)
+
+    def dump(self, config_data: Any, f: IO[bytes], compact: bool = False):
+        """Write a MessagePack document to a file."""
+        import msgpack
+
+        msgpack.pack(to_dict(config_data), f, use_bin_type=True)
+
+
+@FormatRegistry.register
+class BinaryFormat(ConfigFormat):
+    """Compact binary format, see the config_binary module."""
+
+    config_type = ConfigTypes.BINARY
+    extensions = (".scb",)
+
+    def loads(self, config_bytes: bytes) -> Any:
+        """Read a binary document."""
+        return deserialize_binary(config_bytes)
+
+    def dumps(self, config_data: Any, compact: bool = False) -> bytes:
+        """Write a binary document."""
+        return serialize_binary(config_data)
+
+    def sections(
+        self, config_bytes: bytes
+    ) -> dict[Any, tuple[int, int]] | None:
+        """Find the top level sections by the lengths of the values."""
+        return scan_sections(config_bytes)
+
+    def load_section(
+        self, config_bytes: bytes, key: Any, start: int, end: int
+    ) -> Any:
+        """Read the value of a section."""
+        return deserialize_section(config_bytes, start, end)
+
+    def dump_sections(
+        self,
+        config_bytes: bytes,
+        sections: list[tuple[Any, tuple[int, int] | None, Any]],
+    ) -> bytes:
+        """Write the sections, copying the untouched ones."""
+        return serialize_sections(config_bytes, sections)
 
 
-__all__ = ["to_dict", "parse_config", "write_config"]
+__all__ = [
+    "YamlBackend",
+    "atomic_write",
+    "convert_config",
+    "iter_configs",
+    "load_config_data",
+    "to_dict",
+    "parse_config",
+    "serialize_config",
+    "write_config",
+    "write_configs",
+]
@@ -0,0 +1,305 @@
+"""
+Path expressions of configuration data and their compiled accessors.
+
+A path addresses a value of the configuration data, either dotted, e.g.
+`db.pools[2].timeout` or `labels["key.with.dots"]`, or as JSON pointer,
+e.g. `/db/pools/2/timeout`. The empty path addresses the root.
+
+Paths are parsed once and cached. A PathAccessor is compiled from a
+parsed path and the shape of the data it is first used on into a chain
+of `operator.attrgetter` and `operator.itemgetter`, e.g.
+`itemgetter("db")`, `attrgetter("pools")`, `itemgetter(2)` and
+`attrgetter("timeout")`, which reads the value without dispatching on
+the type of every node. If the data changed its shape, the accessor
+falls back to the generic traversal. A method is read from a container
+which replaced a Configclass, e.g. `attrgetter("items")` of a dictionary,
+so method values are read with the generic traversal as well.
+
+Example:
+    ``` python
+    from simple_config_builder.config_path import PathAccessor
+
+    accessor = PathAccessor.compile("db.pools[2].timeout", config_data)
+    timeout = accessor.get(config_data)
+    ```
+
+Configparser.get, Configparser.set and Configparser.get_many cache the
+accessors of a configparser until its configuration data is replaced,
+e.g. by a reload.
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+import re
+import types
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from pydantic import BaseModel
+
+# The kinds of the steps of a path: a name of a dotted path, an index in
+# brackets and a segment of a JSON pointer, which is an index of lists
+# and a key of mappings.
+NAME = "name"
+INDEX = "index"
+SEGMENT = "segment"
+
+# The types of the methods which an attrgetter returns if a Configclass
+# of the compiled shape was replaced by a container, e.g. `dict.items`
+_METHOD_TYPES = (
+    types.MethodType,
+    types.BuiltinMethodType,
+    types.MethodWrapperType,
+)
+
+_DOTTED_STEP = re.compile(
+    r"""(?:^|\.)([^.\[\]"']+)|\[(-?\d+)\]|\[(["'])(.*?)\3\]"""
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_path(path: str) -> tuple[tuple[Any, str], ...]:
+    """
+    Parse a path expression into its steps.
+
+    Parameters
+    ----------
+    path: The dotted path or JSON pointer.
+
+    Returns
+    -------
+    The steps of the path as pairs of the key and its kind.
+
+    Raises
+    ------
+    ValueError: If the path is not valid.
+    """
+    if path == "":
+        return ()
+    if path.startswith("/"):
+        return tuple(
+            (segment.replace("~1", "/").replace("~0", "~"), SEGMENT)
+            for segment in path[1:].split("/")
+        )
+    steps = []
+    end = 0
+    for match in _DOTTED_STEP.finditer(path):
+        if match.start() != end or (end == 0 and path[0] == "."):
+            raise ValueError(f"The path {path!r} is not valid.")
+        name, index, _, key = match.groups()
+        if name is not None:
+            steps.append((name, NAME))
+        elif index is not None:
+            steps.append((int(index), INDEX))
+        else:
+            steps.append((key, NAME))
+        end = match.end()
+    if end != len(path):
+        raise ValueError(f"The path {path!r} is not valid.")
+    return tuple(steps)
+
+
+def resolve_step(node: Any, key: Any, kind: str) -> Any:
+    """
+    Read the child of a node addressed by a step.
+
+    Parameters
+    ----------
+    node: The node, e.g. a Configclass, mapping or list.
+    key: The key of the step.
+    kind: The kind of the step.
+
+    Returns
+    -------
+    The child.
+
+    Raises
+    ------
+    LookupError: If the node has no such child.
+    """
+    if isinstance(node, BaseModel):
+        if kind != INDEX and key in type(node).model_fields:
+            return getattr(node, key)
+    elif isinstance(node, Mapping):
+        return node[key]
+    elif (
+        isinstance(node, Sequence)
+        and not isinstance(node, str | bytes)
+        and (kind == INDEX or (kind == SEGMENT and key.isdigit()))
+    ):
+        return node[int(key)]
+    raise LookupError(key)
+
+
+def _chain(getters: list[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Chain the getters of the parts of a path into one function."""
+    if len(getters) == 1:
+        return getters[0]
+    chained = tuple(getters)
+
+    def get(root: Any) -> Any:
+        for getter in chained:
+            root = getter(root)
+        return root
+
+    return get
+
+
+class PathAccessor:
+    """Compiled reader and writer of a path of configuration data."""
+
+    __slots__ = ("_get", "path", "steps")
+
+    def __init__(
+        self,
+        path: str,
+        steps: tuple[tuple[Any, str], ...],
+        get: Callable[[Any], Any] | None,
+    ):
+        self.path = path
+        self.steps = steps
+        self._get = get
+
+    @classmethod
+    def compile(cls, path: str, config_data: Any) -> PathAccessor:
+        """
+        Compile the accessor of a path for the shape of the data.
+
+        Parameters
+        ----------
+        path: The dotted path or JSON pointer.
+        config_data: The configuration data the accessor is used on.
+
+        Returns
+        -------
+        The accessor. If the path does not resolve in the data, the
+        accessor uses the generic traversal.
+
+        Raises
+        ------
+        ValueError: If the path is not valid.
+        """
+        steps = parse_path(path)
+        # The names of consecutive fields are read by one attrgetter
+        getters: list[Callable[[Any], Any]] = []
+        names: list[str] = []
+        node = config_data
+        try:
+            for key, kind in steps:
+                if isinstance(node, BaseModel):
+                    names.append(key)
+                else:
+                    if names:
+                        getters.append(operator.attrgetter(".".join(names)))
+                        names = []
+                    if kind == SEGMENT and not isinstance(node, Mapping):
+                        getters.append(operator.itemgetter(int(key)))
+                    else:
+                        getters.append(operator.itemgetter(key))
+                node = resolve_step(node, key, kind)
+        except (LookupError, ValueError):
+            return cls(path, steps, None)
+        if names:
+            getters.append(operator.attrgetter(".".join(names)))
+        return cls(path, steps, _chain(getters))
+
+    def get(self, config_data: Any) -> Any:
+        """
+        Read the value of the path.
+
+        Parameters
+        ----------
+        config_data: The configuration data.
+
+        Returns
+        -------
+        The value.
+
+        Raises
+        ------
+        KeyError: If the path is not in the configuration data.
+        """
+        if self._get is not None:
+            try:
+                value = self._get(config_data)
+            except (LookupError, AttributeError, TypeError):
+                # The shape of the data changed since the compilation
+                self._get = None
+            else:
+                if not isinstance(value, _METHOD_TYPES):
+                    return value
+        return self.resolve(config_data)
+
+    def resolve(self, config_data: Any, steps: int | None = None) -> Any:
+        """
+        Read the value of the path, or of its first steps, generically.
+
+        Parameters
+        ----------
+        config_data: The configuration data.
+        steps: The number of steps to follow. Defaults to all steps.
+
+        Returns
+        -------
+        The value.
+
+        Raises
+        ------
+        KeyError: If the path is not in the configuration data.
+        """
+        node = config_data
+        for key, kind in self.steps[:steps]:
+            try:
+                node = resolve_step(node, key, kind)
+            except LookupError:
+                raise KeyError(
+                    f"The path {self.path!r} is not in the configuration data."
+                ) from None
+        return node
+
+    def set(self, config_data: Any, value: Any) -> bool:
+        """
+        Write the value of the path.
+
+        Fields of Configclass instances are assigned, so the value is
+        validated by `validate_assignment` and the assignment is notified
+        to the AssignmentObservers.
+
+        Parameters
+        ----------
+        config_data: The configuration data.
+        value: The value.
+
+        Returns
+        -------
+        True if a field of a Configclass was assigned, False if an item of
+        a container was set.
+
+        Raises
+        ------
+        KeyError: If the parent of the path is not in the configuration
+            data, or the path addresses a field the Configclass does not
+            have.
+        ValueError: If the path is the root.
+        pydantic.ValidationError: If the value is not valid for the field.
+        """
+        if not self.steps:
+            raise ValueError("The root cannot be set through a path.")
+        parent = self.resolve(config_data, -1)
+        key, kind = self.steps[-1]
+        if isinstance(parent, BaseModel):
+            if kind == INDEX or key not in type(parent).model_fields:
+                raise KeyError(
+                    f"The path {self.path!r} is not in the configuration data."
+                )
+            setattr(parent, key, value)
+            return True
+        if kind == SEGMENT and not isinstance(parent, Mapping):
+            key = int(key)
+        parent[key] = value
+        return False
+
+
+__all__ = ["PathAccessor", "parse_path", "resolve_step"]
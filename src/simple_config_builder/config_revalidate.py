@@ -0,0 +1,289 @@
+"""
+Incremental validation of reloaded configuration data.
+
+revalidate_config compares the parsed data of a reloaded configuration
+file with the parsed data of the previous load and validates only the
+changed subtrees. Values are unchanged if their parsed data is equal
+and of the same types, e.g. `1` and `true` differ. Unchanged subtrees
+keep their values, so their Configclass instances are reused as they are
+and keep their identity.
+The Configclass nodes on the paths to the changes are validated from
+their parsed data again, like the tree validation validates a node: the
+fields which can hold tagged nodes get the reused and the validated
+children, all other fields get their parsed data, see
+can_hold_config_node. Pydantic keeps the instances passed to a
+constructed node, but copies its dictionaries and lists.
+
+Example:
+    ``` python
+    from simple_config_builder.config_revalidate import (
+        copy_config_data,
+        revalidate_config,
+    )
+
+    config, revalidated = revalidate_config(old_raw, new_raw, old_config)
+    ```
+
+The parsed data of the previous load must be unchanged, see
+copy_config_data, and must match the previous configuration, which does
+not hold after assignments to it or modifications of its containers,
+see is_unmodified.
+"""
+
+from __future__ import annotations
+
+import copy
+import marshal
+from typing import Any
+
+from simple_config_builder.config import Configclass
+from simple_config_builder.config_io import validate_config
+from simple_config_builder.config_tree import (
+    CONFIG_CLASS_TYPE_KEY,
+    can_hold_config_node,
+    resolve_config_class,
+    validate_config_class,
+)
+
+
+def copy_config_data(config_data: Any) -> Any:
+    """
+    Copy parsed configuration data, which the validation may modify.
+
+    Parameters
+    ----------
+    config_data: The parsed configuration data.
+
+    Returns
+    -------
+    A deep copy of the data.
+    """
+    try:
+        # Version 2 of marshal copies equal objects as separate objects
+        return marshal.loads(marshal.dumps(config_data, 2))
+    except ValueError:
+        # E.g. the dates of YAML and TOML files
+        return copy.deepcopy(config_data)
+
+
+def count_nodes(config_data: Any) -> int:
+    """
+    Count the dictionaries, lists and tuples of parsed configuration data.
+
+    Parameters
+    ----------
+    config_data: The parsed configuration data.
+
+    Returns
+    -------
+    The number of nodes.
+    """
+    count = 0
+    stack = [config_data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            count += 1
+            stack.extend(value.values())
+        elif isinstance(value, list | tuple):
+            count += 1
+            stack.extend(value)
+    return count
+
+
+def collect_nodes(config_data: Any) -> list[Any]:
+    """
+    Collect the values of configuration data to detect modifications.
+
+    Fields of Configclass instances and items of dictionaries and lists
+    are set without notice to the configparser. The collected values hold
+    the identities of all values of the data, so assignments and
+    modifications replace some of them.
+
+    Parameters
+    ----------
+    config_data: The configuration data.
+
+    Returns
+    -------
+    The keys and values of the data in the order of a walk, see
+    is_unmodified.
+    """
+    nodes = [config_data]
+    stack = [config_data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Configclass):
+            children = list(value.__dict__.values())
+        elif isinstance(value, dict):
+            nodes.extend(value)
+            children = list(value.values())
+        elif isinstance(value, list | tuple):
+            children = value
+        else:
+            continue
+        nodes.extend(children)
+        stack.extend(children)
+    return nodes
+
+
+def is_unmodified(nodes: list[Any], config_data: Any) -> bool:
+    """
+    Check if configuration data still holds the values it held.
+
+    Parameters
+    ----------
+    nodes: The values collected from the data, see collect_nodes. They
+        keep the values alive, so their identities are not reused.
+    config_data: The configuration data.
+
+    Returns
+    -------
+    True if every key and value of the data is the same object as at the
+    time of the collection.
+    """
+    return list(map(id, collect_nodes(config_data))) == list(map(id, nodes))
+
+
+def _same_data(old_raw: Any, new_raw: Any) -> bool:
+    """Check if parsed data is equal, with the same types of all values."""
+    if type(old_raw) is not type(new_raw):
+        return False
+    if isinstance(new_raw, dict):
+        return old_raw.keys() == new_raw.keys() and all(
+            _same_data(old_raw[key], item) for key, item in new_raw.items()
+        )
+    if isinstance(new_raw, list | tuple):
+        return len(old_raw) == len(new_raw) and all(
+            map(_same_data, old_raw, new_raw)
+        )
+    return old_raw == new_raw
+
+
+def revalidate_config(
+    old_raw: Any,
+    new_raw: Any,
+    old_config: Any,
+    lazy_callables: bool = False,
+) -> tuple[Any, int]:
+    """
+    Validate the changed subtrees of reloaded configuration data.
+
+    Parameters
+    ----------
+    old_raw: The parsed data of the previous load.
+    new_raw: The parsed data of the reload, which is modified by the
+        validation.
+    old_config: The configuration data validated from `old_raw`.
+    lazy_callables: Load callables as LazyCallable proxies.
+        Defaults to False.
+
+    Returns
+    -------
+    The configuration data of `new_raw` and the number of its nodes which
+    were validated, see count_nodes. All other nodes are reused from
+    `old_config`.
+
+    Raises
+    ------
+    RecursionError: If the changes are nested too deep.
+    """
+    revalidation = _Revalidation(lazy_callables)
+    config = revalidation.value(old_raw, new_raw, old_config)
+    return config, revalidation.revalidated
+
+
+class _Revalidation:
+    """Revalidation of the changed subtrees of a reload."""
+
+    def __init__(self, lazy_callables: bool):
+        self.lazy_callables = lazy_callables
+        self.revalidated = 0
+
+    def value(self, old_raw: Any, new_raw: Any, old_value: Any) -> Any:
+        """Get the value of a node, reusing the old value if unchanged."""
+        if _same_data(old_raw, new_raw):
+            return old_value
+        if isinstance(new_raw, dict) and isinstance(old_raw, dict):
+            config_class_type = new_raw.get(CONFIG_CLASS_TYPE_KEY)
+            if config_class_type is None:
+                if type(old_value) is dict:
+                    self.revalidated += 1
+                    return self.children(old_raw, new_raw, old_value)
+            elif config_class_type == old_raw.get(
+                CONFIG_CLASS_TYPE_KEY
+            ) and type(old_value) is resolve_config_class(config_class_type):
+                self.revalidated += 1
+                return validate_config_class(
+                    type(old_value),
+                    self.fields(type(old_value), old_raw, new_raw, old_value),
+                    self.lazy_callables,
+                )
+        elif (
+            isinstance(new_raw, list)
+            and isinstance(old_raw, list)
+            and isinstance(old_value, list | tuple)
+            and len(old_value) == len(old_raw)
+        ):
+            self.revalidated += 1
+            values = [
+                self.value(old_raw[index], item, old_value[index])
+                if index < len(old_raw)
+                else self.validate(item)
+                for index, item in enumerate(new_raw)
+            ]
+            return values if isinstance(old_value, list) else tuple(values)
+        return self.validate(new_raw)
+
+    def fields(
+        self,
+        config_class: type[Configclass],
+        old_raw: dict,
+        new_raw: dict,
+        old_value: Configclass,
+    ) -> dict:
+        """Get the data of a changed Configclass node to validate."""
+        field_infos = config_class.__pydantic_fields__
+        old_values = old_value.__dict__
+        data = {}
+        for key, item in new_raw.items():
+            if key == CONFIG_CLASS_TYPE_KEY:
+                continue
+            field_info = field_infos.get(key)
+            if field_info is None or not can_hold_config_node(
+                field_info.annotation
+            ):
+                # The class validates the parsed data, e.g. with validators
+                # of the mode "before"
+                self.revalidated += count_nodes(item)
+                data[key] = item
+            elif key in old_raw and key in old_values:
+                data[key] = self.value(old_raw[key], item, old_values[key])
+            else:
+                data[key] = self.validate(item)
+        return data
+
+    def children(self, old_raw: dict, new_raw: dict, old_values: dict) -> dict:
+        """Get the children of a dictionary node."""
+        return {
+            key: self.value(old_raw[key], item, old_values[key])
+            if key in old_raw and key in old_values
+            else self.validate(item)
+            for key, item in new_raw.items()
+        }
+
+    def validate(self, new_raw: Any) -> Any:
+        """Validate a new or changed subtree."""
+        if not isinstance(new_raw, dict | list | tuple):
+            return new_raw
+        self.revalidated += count_nodes(new_raw)
+        return validate_config(new_raw, self.lazy_callables)
+
+
+__all__ = [
+    "collect_nodes",
+    "copy_config_data",
+    "count_nodes",
+    "is_unmodified",
+    "revalidate_config",
+]
@@ -0,0 +1,207 @@
+"""
+Lazy loading of the top level sections of configuration files.
+
+Services which only read a few sections of a large configuration file do
+not need to construct the whole file. parse_lazy_config scans the file
+once for the byte offsets of its top level sections and returns a
+LazySections mapping, which constructs the Configclass objects of a
+section on its first access. Saving the mapping writes the original bytes
+of the sections which were never accessed.
+
+Example:
+    ``` python
+    from simple_config_builder.configparser import Configparser
+
+    configparser = Configparser("config.yaml", lazy=True)
+    # Only the section "database" is constructed
+    database = configparser.config_data["database"]
+    database.port = 5433
+    configparser.save()
+    ```
+
+The sections are found by the format of the file, see
+ConfigFormat.sections. The YAML and the binary format can be split, the
+files of the other formats and documents whose root is not a mapping are
+parsed at once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, MutableMapping
+from threading import RLock
+from typing import Any
+
+from simple_config_builder.config_formats import ConfigFormat, FormatRegistry
+from simple_config_builder.config_io import parse_config, validate_config
+from simple_config_builder.config_types import ConfigTypes
+
+
+class LazySections(MutableMapping):
+    """
+    Mapping of the top level sections of a configuration file.
+
+    The sections are constructed on their first access. Sections which are
+    assigned or accessed are serialized on save, the others are written
+    with their original bytes.
+    """
+
+    def __init__(
+        self,
+        config_bytes: bytes,
+        config_format: ConfigFormat,
+        offsets: dict[Any, tuple[int, int]],
+        lazy_callables: bool = False,
+    ):
+        """
+        Initialize the sections.
+
+        Parameters
+        ----------
+        config_bytes: The content of the file.
+        config_format: The format of the file.
+        offsets: The start and end offsets of the sections by their key,
+            see ConfigFormat.sections.
+        lazy_callables: Load callables as LazyCallable proxies.
+            Defaults to False.
+        """
+        self._config_bytes = config_bytes
+        self._format = config_format
+        self._offsets = dict(offsets)
+        self._lazy_callables = lazy_callables
+        self._keys: dict[Any, None] = dict.fromkeys(offsets)
+        self._loaded: dict[Any, Any] = {}
+        self._lock = RLock()
+        # Called with the value of every section constructed on access
+        self.on_load: Callable[[Any], object] | None = None
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get a section, constructing it on the first access."""
+        with self._lock:
+            if key in self._loaded:
+                return self._loaded[key]
+            start, end = self._offsets[key]
+            config_data = self._format.load_section(
+                self._config_bytes, key, start, end
+            )
+            value = validate_config(config_data, self._lazy_callables)
+            self._loaded[key] = value
+            del self._offsets[key]
+        if self.on_load is not None:
+            self.on_load(value)
+        return value
+
+    def __setitem__(self, key: Any, value: Any):
+        """Set a section."""
+        with self._lock:
+            self._keys[key] = None
+            self._loaded[key] = value
+            self._offsets.pop(key, None)
+
+    def __delitem__(self, key: Any):
+        """Delete a section."""
+        with self._lock:
+            del self._keys[key]
+            self._loaded.pop(key, None)
+            self._offsets.pop(key, None)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the keys in the order of the file."""
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        """Get the number of sections."""
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        """Check for a section without constructing it."""
+        return key in self._keys
+
+    def __repr__(self) -> str:
+        """Represent the sections without constructing them."""
+        loaded = sum(key in self._loaded for key in self._keys)
+        return (
+            f"{type(self).__name__}({list(self._keys)!r}, "
+            f"loaded={loaded}/{len(self._keys)})"
+        )
+
+    def is_loaded(self, key: Any) -> bool:
+        """
+        Check if a section was constructed or assigned.
+
+        Parameters
+        ----------
+        key: The key of the section.
+
+        Returns
+        -------
+        True if the section is held as Python objects.
+        """
+        return key in self._loaded
+
+    def loaded_values(self) -> list[Any]:
+        """
+        Get the sections which were constructed or assigned.
+
+        Returns
+        -------
+        The values of the sections, without constructing the others.
+        """
+        with self._lock:
+            return list(self._loaded.values())
+
+    def serialize(self) -> bytes:
+        """
+        Serialize the sections to the content of the file.
+
+        Returns
+        -------
+        The content of the file, with the original bytes of the sections
+        which were never accessed.
+        """
+        with self._lock:
+            sections = [
+                (key, self._offsets.get(key), self._loaded.get(key))
+                for key in self._keys
+            ]
+            return self._format.dump_sections(self._config_bytes, sections)
+
+
+def parse_lazy_config(
+    config_file: str,
+    config_type: ConfigTypes,
+    lazy_callables: bool = False,
+    config_bytes: bytes | None = None,
+) -> LazySections | dict | list | Any:
+    """
+    Parse the configuration file with lazily constructed sections.
+
+    Parameters
+    ----------
+    config_file: The configuration file path.
+    config_type: The configuration file type.
+    lazy_callables: Load callables as LazyCallable proxies.
+        Defaults to False.
+    config_bytes: The content of the file, if it was already read.
+        Defaults to None, which reads the file.
+
+    Returns
+    -------
+    The LazySections of the file, or the configuration data parsed at once
+    if the file cannot be split into sections.
+    """
+    config_format = FormatRegistry.get(config_type)
+    if config_bytes is None:
+        try:
+            with open(config_file, "rb") as f:
+                config_bytes = f.read()
+        except FileNotFoundError:
+            return {}
+    offsets = config_format.sections(config_bytes)
+    if offsets is None:
+        return parse_config(
+            config_file, config_type, lazy_callables, config_bytes=config_bytes
+        )
+    return LazySections(config_bytes, config_format, offsets, lazy_callables)
+
+
+__all__ = ["LazySections", "parse_lazy_config"]
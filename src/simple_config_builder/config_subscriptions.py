@@ -0,0 +1,253 @@
+"""
+Subscriptions to the changes of paths of configuration data.
+
+A subscription calls its callback with the changes of the paths which
+match its pattern, see diff_configs for the changes. The changes of one
+reload are passed in one call. Patterns are paths whose segments can be
+globs, e.g. `cache.*`, `db.pools[*].timeout` or `servers.**`, where `*`
+matches one segment and `**` any number of segments. A pattern matches
+the changes at, below and above the paths it matches, so `cache.*` is
+notified if `cache.size`, `cache.pools[0].timeout` or `cache` changed.
+Changes above are only notified if their old or new value can have
+children, e.g. `servers.**.port` is notified if `servers.a` was added,
+but not if the string `servers.a.host` changed.
+
+The callbacks run inline by default. They can be run by an executor of
+concurrent.futures, e.g. a ThreadPoolExecutor, or on an asyncio event
+loop, where coroutine functions are awaited, so slow callbacks do not
+block the reload.
+
+Example:
+    ``` python
+    from concurrent.futures import ThreadPoolExecutor
+
+    from simple_config_builder.configparser import Configparser
+
+    configparser = Configparser("config.yaml", autoreload=True)
+    configparser.on_change(
+        "cache.*",
+        lambda changes: rebuild_cache(changes),
+        executor=ThreadPoolExecutor(max_workers=1),
+    )
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import inspect
+import logging
+import re
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from threading import Lock
+from typing import Any
+
+from simple_config_builder.config_diff import MISSING, Change
+
+logger = logging.getLogger(__name__)
+
+# A name or an index in brackets of a path or pattern
+_SEGMENT = re.compile(r"\[([^\]]*)\]|([^.\[]+)")
+
+# The types of the values without children
+_LEAVES = frozenset({str, int, float, bool, type(None), bytes, type(MISSING)})
+
+
+def split_path(path: str) -> list[tuple[str, bool]]:
+    """
+    Split a path or pattern into its segments.
+
+    Parameters
+    ----------
+    path: The path, e.g. `db.pools[2].timeout`.
+
+    Returns
+    -------
+    The segments as pairs of the name or index and whether it is an
+    index, e.g. `[("db", False), ("pools", False), ("2", True), ...]`.
+    """
+    return [
+        (name, False) if name else (index, True)
+        for index, name in _SEGMENT.findall(path)
+    ]
+
+
+class Subscription:
+    """Subscription to the changes of the paths matching a pattern."""
+
+    __slots__ = ("_segments", "callback", "executor", "pattern")
+
+    def __init__(
+        self,
+        pattern: str,
+        callback: Callable[[list[Change]], Any],
+        executor: Executor | asyncio.AbstractEventLoop | None = None,
+    ):
+        """
+        Initialize the subscription.
+
+        Parameters
+        ----------
+        pattern: The pattern of the paths, see the module.
+        callback: The callable to call with the list of the changes.
+        executor: The executor of the callback, or the event loop to run
+            it on. Defaults to None, which calls the callback inline.
+        """
+        self.pattern = pattern
+        self.callback = callback
+        self.executor = executor
+        # The compiled globs of the segments, None for `**`
+        self._segments = [
+            (
+                None
+                if segment == "**"
+                else re.compile(fnmatch.translate(segment)),
+                index,
+            )
+            for segment, index in split_path(pattern)
+        ]
+
+    def matches(
+        self, segments: list[tuple[str, bool]], parent: bool = True
+    ) -> bool:
+        """
+        Check if the change of a path concerns the subscription.
+
+        The positions in the pattern the segments of the path can reach
+        are followed segment by segment, `**` stays at its position or
+        skips to the next one.
+
+        Parameters
+        ----------
+        segments: The segments of the path, see split_path.
+        parent: Whether the changed value can have children, so the path
+            can be an ancestor of the matching paths. Defaults to True.
+
+        Returns
+        -------
+        True if the pattern matches the path or one of its ancestors, or
+        if the path is the parent of a matching path.
+        """
+        pattern = self._segments
+        end = len(pattern)
+        positions = self._skip({0})
+        for segment, is_index in segments:
+            if end in positions:
+                # An ancestor of the path matches
+                return True
+            reached = set()
+            for position in positions:
+                glob, index = pattern[position]
+                if glob is None:
+                    reached.add(position)
+                elif index == is_index and glob.match(segment) is not None:
+                    reached.add(position + 1)
+            if not reached:
+                return False
+            positions = self._skip(reached)
+        return end in positions or parent
+
+    def _skip(self, positions: set[int]) -> set[int]:
+        """Add the positions after the `**` at the positions."""
+        pattern = self._segments
+        for position in sorted(positions):
+            while position < len(pattern) and pattern[position][0] is None:
+                position += 1
+                positions.add(position)
+        return positions
+
+    def notify(self, changes: list[Change]):
+        """Call the callback with the changes by the executor."""
+        executor = self.executor
+        if executor is None:
+            _run(self.callback, changes)
+        elif isinstance(executor, asyncio.AbstractEventLoop):
+            if inspect.iscoroutinefunction(self.callback):
+                future = asyncio.run_coroutine_threadsafe(
+                    self.callback(changes), executor
+                )
+                future.add_done_callback(self._log_failure)
+            else:
+                executor.call_soon_threadsafe(_run, self.callback, changes)
+        else:
+            executor.submit(_run, self.callback, changes)
+
+    def _log_failure(self, future: Future):
+        """Log the exception of a callback run on an event loop."""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(
+                "Change callback %r failed.",
+                self.callback,
+                exc_info=future.exception(),
+            )
+
+
+def _run(callback: Callable[[list[Change]], Any], changes: list[Change]):
+    """Call a callback and log its exception."""
+    try:
+        callback(changes)
+    except Exception:
+        logger.exception("Change callback %r failed.", callback)
+
+
+class ChangeSubscriptions:
+    """The subscriptions of a configparser."""
+
+    def __init__(self):
+        """Initialize the subscriptions."""
+        self._lock = Lock()
+        self._subscriptions: list[Subscription] = []
+
+    def __bool__(self) -> bool:
+        """Whether there are subscriptions."""
+        return bool(self._subscriptions)
+
+    def subscribe(self, subscription: Subscription):
+        """Add a subscription."""
+        with self._lock:
+            self._subscriptions = [*self._subscriptions, subscription]
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove a subscription, if it was added."""
+        with self._lock:
+            self._subscriptions = [
+                item
+                for item in self._subscriptions
+                if item is not subscription
+            ]
+
+    def dispatch(self, changes: list[Change]):
+        """
+        Notify the subscriptions of a batch of changes.
+
+        Every subscription is called once with the changes which concern
+        it, subscriptions without such changes are not called.
+
+        Parameters
+        ----------
+        changes: The changes, e.g. of one reload.
+        """
+        subscriptions = self._subscriptions
+        if not changes or not subscriptions:
+            return
+        segments = [
+            (
+                split_path(change.path),
+                type(change.old) not in _LEAVES
+                or type(change.new) not in _LEAVES,
+            )
+            for change in changes
+        ]
+        for subscription in subscriptions:
+            matching = [
+                change
+                for change, (path_segments, parent) in zip(changes, segments)
+                if subscription.matches(path_segments, parent)
+            ]
+            if matching:
+                subscription.notify(matching)
+
+
+__all__ = ["ChangeSubscriptions", "Subscription", "split_path"]
@@ -0,0 +1,656 @@
+"""
+Validation of whole configuration trees.
+
+A parsed configuration file is a tree of dictionaries, lists, tuples and
+scalar values. Dictionaries carrying a `_config_class_type` key are
+constructed into the registered Configclass of that name. The
+ConfigTreeValidator validates such a tree in a single pydantic-core call
+with a union keyed on `_config_class_type`, instead of walking the tree in
+Python. Tagged nodes are validated by the core schema of their class, and
+only the fields which can hold tagged nodes are traversed. The schema is
+built from the ConfigClassRegistry and rebuilt whenever a class is
+registered.
+"""
+
+from __future__ import annotations
+
+import copy
+import importlib
+import re
+from collections.abc import Callable
+from functools import partial
+from threading import Lock
+from types import UnionType
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    ForwardRef,
+    Literal,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import SchemaValidator, core_schema
+
+from simple_config_builder.config import Configclass, ConfigClassRegistry
+
+CONFIG_CLASS_TYPE_KEY = "_config_class_type"
+
+
+def resolve_config_class(config_class_type: Any) -> type[Configclass]:
+    """
+    Resolve the class of a `_config_class_type` value.
+
+    Registered classes are looked up directly. Otherwise the module of the
+    class is imported, which registers the classes defined in it.
+
+    Parameters
+    ----------
+    config_class_type: The value of the `_config_class_type` key.
+
+    Raises
+    ------
+    ValueError: If the value is not a string or the class is not found.
+    ImportError: If the module of the class can not be imported.
+
+    Returns
+    -------
+    The registered class.
+    """
+    if not isinstance(config_class_type, str):
+        # A ValueError like the construction of the nodes always raised
+        raise ValueError(  # noqa: TRY004
+            "The _config_class_type must be a "
+            "string representing the class type."
+        )
+    try:
+        return ConfigClassRegistry.get(config_class_type)
+    except ValueError:
+        pass
+
+    # cut of the class name if it is a full path
+    config_class_module = config_class_type.rsplit(".", 1)[0]
+    if "." in config_class_type:
+        try:
+            importlib.import_module(config_class_module)
+        except ImportError:
+            raise ImportError(
+                f"Could not import the module '{config_class_module}'. "
+                "Please make sure the module is installed and available "
+                "in the Python path."
+            )
+    try:
+        return ConfigClassRegistry.get(config_class_type)
+    except ValueError:
+        raise ValueError(
+            f"Please make sure the class '{config_class_type}' "
+            f"is in the module '{config_class_module}'."
+        )
+
+
+def validate_config_class(
+    config_class: type[Configclass],
+    config_data: dict,
+    lazy_callables: bool = False,
+) -> Configclass:
+    """
+    Validate the data of a configuration node into its class.
+
+    Parameters
+    ----------
+    config_class: The class to validate the data into.
+    config_data: The data of the node without the `_config_class_type`.
+    lazy_callables: Load callables as LazyCallable proxies.
+
+    Raises
+    ------
+    ValueError: If the data has keys which are not fields of the class.
+
+    Returns
+    -------
+    The validated Configclass instance.
+    """
+    expected_fields = config_class.__pydantic_fields__.keys()
+    mismatched_keys = config_data.keys() - expected_fields
+    if mismatched_keys:
+        raise ValueError(
+            f"Mismatched keys in config data: {mismatched_keys}. "
+            f"Expected fields: {set(expected_fields)}"
+        )
+    return config_class.model_validate(
+        config_data, context={"lazy_callables": lazy_callables}
+    )
+
+
+# Choices of the tree union for nodes which are not registered classes.
+# Class strings never contain "<", so the names can not collide.
+_DICT = "<dict>"
+_UNRESOLVED = "<unresolved>"
+_LIST = "<list>"
+_TUPLE = "<tuple>"
+_VALUE = "<value>"
+
+_TAG_KEYS = frozenset((CONFIG_CLASS_TYPE_KEY,))
+
+
+def can_hold_config_node(annotation: Any) -> bool:
+    """
+    Check if a field annotation allows the field to hold tagged nodes.
+
+    Fields annotated with scalar types or containers of scalar types can
+    not hold dictionaries with a `_config_class_type`, so the tree
+    validation leaves their values to the validation of the class.
+
+    Parameters
+    ----------
+    annotation: The annotation of the field.
+
+    Returns
+    -------
+    True if the field can hold tagged nodes.
+    """
+    if annotation is Any or annotation is object:
+        return True
+    if isinstance(annotation, (str, ForwardRef, TypeVar)):
+        return True
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return False
+    if origin is Annotated:
+        return can_hold_config_node(get_args(annotation)[0])
+    if origin is not None:
+        args = get_args(annotation)
+        if not args:
+            return True
+        return any(
+            can_hold_config_node(arg) for arg in args if arg is not Ellipsis
+        )
+    if isinstance(annotation, type):
+        # Models are constructed from tagged nodes, unparametrized
+        # containers like list or dict hold anything
+        return issubclass(annotation, BaseModel) or hasattr(
+            annotation, "__class_getitem__"
+        )
+    return True
+
+
+def _fields_schema(
+    config_class: type[BaseModel], node: core_schema.CoreSchema
+) -> core_schema.CoreSchema:
+    """
+    Create the schema for the children of a tagged node.
+
+    Fields which can hold tagged nodes are validated as tree nodes, all
+    other fields are passed through as they are and the
+    `_config_class_type` is dropped.
+    """
+    fields = {
+        key: core_schema.typed_dict_field(
+            node
+            if can_hold_config_node(field_info.annotation)
+            else core_schema.any_schema(),
+            required=False,
+        )
+        for key, field_info in config_class.__pydantic_fields__.items()
+    }
+    return core_schema.typed_dict_schema(
+        fields,
+        extra_behavior="ignore",
+    )
+
+
+def _shared_schema(
+    schema: core_schema.CoreSchema,
+    definitions: dict[str, core_schema.CoreSchema | None],
+) -> core_schema.CoreSchema:
+    """
+    Move the definitions of the core schema of a class to shared ones.
+
+    The schemas of classes define the schemas of the classes they refer
+    to, and a validator may define each of them only once.
+
+    Parameters
+    ----------
+    schema: The core schema of the class.
+    definitions: The shared definitions by their reference.
+
+    Returns
+    -------
+    A reference to the schema of the class.
+    """
+    if schema["type"] == "definitions":
+        for definition in schema["definitions"]:
+            definitions.setdefault(definition["ref"], definition)
+        schema = schema["schema"]
+    ref = schema.get("ref")
+    if ref is None:
+        return schema
+    definitions.setdefault(ref, schema)
+    return core_schema.definition_reference_schema(ref)
+
+
+def _discriminator(fields: dict[str, frozenset[str]]) -> Callable:
+    """
+    Create the function selecting the choice of the tree union.
+
+    Parameters
+    ----------
+    fields: The field names of the classes with a choice in the union.
+    """
+    # Aliases and short names of the classes, mapped to their choice
+    names: dict[str, str | None] = {name: name for name in fields}
+
+    def choice_of(config_class_type: str) -> str | None:
+        try:
+            config_class = ConfigClassRegistry.get(config_class_type)
+        except ValueError:
+            # Not registered yet, the module is imported in Python
+            return None
+        choice = ConfigClassRegistry.get_class_str_from_class(config_class)
+        names[config_class_type] = choice
+        return choice
+
+    def discriminate(value: Any) -> str:
+        if isinstance(value, dict):
+            if CONFIG_CLASS_TYPE_KEY not in value:
+                return _DICT
+            config_class_type = value[CONFIG_CLASS_TYPE_KEY]
+            if not isinstance(config_class_type, str):
+                return _UNRESOLVED
+            choice = names.get(config_class_type)
+            if choice is None:
+                choice = choice_of(config_class_type)
+            class_fields = fields.get(choice) if choice is not None else None
+            # Nodes with unknown keys are constructed in Python, which
+            # raises the error about the mismatched keys
+            if class_fields is None or value.keys() - class_fields - _TAG_KEYS:
+                return _UNRESOLVED
+            return choice
+        if isinstance(value, list):
+            return _LIST
+        if isinstance(value, tuple):
+            return _TUPLE
+        return _VALUE
+
+    return discriminate
+
+
+class _ConstructionError(Exception):
+    """
+    Carry an error of a node construction through pydantic-core.
+
+    pydantic-core converts ValueErrors and AssertionErrors raised by
+    validator functions into ValidationErrors of the whole tree. Wrapping
+    the error stops the validation at the first failing node, whose error
+    construct_config raises then.
+    """
+
+
+def _construct(config_class: type[Configclass] | None, data: dict, info):
+    """Construct a tagged node whose children are already validated."""
+    try:
+        if config_class is None:
+            config_class = resolve_config_class(data[CONFIG_CLASS_TYPE_KEY])
+        del data[CONFIG_CLASS_TYPE_KEY]
+        lazy_callables = bool(
+            info.context and info.context.get("lazy_callables")
+        )
+        return validate_config_class(config_class, data, lazy_callables)
+    except (ValueError, AssertionError) as e:
+        # Other exceptions pass pydantic-core unchanged
+        raise _ConstructionError(e)
+
+
+class ConfigTreeValidator:
+    """
+    Validator for whole configuration trees.
+
+    Every node of the tree is validated by a discriminated union:
+
+    - scalar values are passed through,
+    - dictionaries tagged with a registered class string are constructed
+      by a choice of that class, selected by the `_config_class_type` key,
+    - dictionaries with another `_config_class_type` are constructed after
+      the module of the class is imported,
+    - other dictionaries, lists and tuples are validated item by item.
+
+    The children of a node are validated before the node itself, so the
+    tree is constructed bottom up, like construct_config does.
+    """
+
+    __validator: ClassVar[SchemaValidator | None] = None
+    __generation: ClassVar[int] = -1
+    __lock: ClassVar = Lock()
+
+    @classmethod
+    def _build(cls) -> SchemaValidator:
+        """Build the validator from the registered classes."""
+        node = core_schema.definition_reference_schema("config-node")
+        children = core_schema.dict_schema(
+            keys_schema=core_schema.any_schema(), values_schema=node
+        )
+        choices: dict[Any, core_schema.CoreSchema] = {}
+        fields: dict[str, frozenset[str]] = {}
+        definitions: dict[str, core_schema.CoreSchema | None] = {}
+        for class_str, config_class in ConfigClassRegistry.items():
+            if not (
+                isinstance(config_class, type)
+                and issubclass(config_class, BaseModel)
+                and config_class.__pydantic_complete__
+            ):
+                continue
+            # The fields are validated as tree nodes first and then by the
+            # schema of the class, without a call into Python per node
+            choices[class_str] = core_schema.chain_schema(
+                [
+                    _fields_schema(config_class, node),
+                    _shared_schema(
+                        config_class.__pydantic_core_schema__, definitions
+                    ),
+                ]
+            )
+            fields[class_str] = frozenset(config_class.__pydantic_fields__)
+        choices[_DICT] = children
+        choices[_UNRESOLVED] = core_schema.chain_schema(
+            [
+                children,
+                core_schema.with_info_plain_validator_function(
+                    partial(_construct, None)
+                ),
+            ]
+        )
+        choices[_LIST] = core_schema.list_schema(node)
+        choices[_TUPLE] = core_schema.tuple_schema(
+            [node], variadic_item_index=0
+        )
+        choices[_VALUE] = core_schema.any_schema()
+        tree = core_schema.union_schema(
+            [
+                # Scalars are passed through without calling into Python
+                core_schema.is_instance_schema((str, int, float, type(None))),
+                core_schema.tagged_union_schema(
+                    choices, discriminator=_discriminator(fields)
+                ),
+            ],
+            mode="left_to_right",
+            ref="config-node",
+        )
+        return SchemaValidator(
+            core_schema.definitions_schema(node, [tree, *definitions.values()])
+        )
+
+    @classmethod
+    def validator(cls) -> SchemaValidator:
+        """
+        Get the validator for the currently registered classes.
+
+        Returns
+        -------
+        The validator, rebuilt if classes were registered since it was
+        last built.
+        """
+        generation = ConfigClassRegistry.generation()
+        validator = cls.__validator
+        if validator is None or cls.__generation != generation:
+            with cls.__lock:
+                generation = ConfigClassRegistry.generation()
+                validator = cls._build()
+                cls.__validator = validator
+                cls.__generation = generation
+        return validator
+
+    @classmethod
+    def validate(cls, config_data: Any, lazy_callables: bool = False) -> Any:
+        """
+        Validate a parsed configuration tree.
+
+        Parameters
+        ----------
+        config_data: The parsed configuration data.
+        lazy_callables: Load callables as LazyCallable proxies.
+
+        Raises
+        ------
+        RecursionError: If the tree is nested too deep for pydantic-core.
+
+        Returns
+        -------
+        The configuration data with the Configclass objects constructed.
+        The containers of the tree are copies, the input is not modified.
+
+        Invalid trees are constructed again by construct_config, so they
+        raise its errors, e.g. the ValidationError of the failing class
+        with a note of the path of the node, and not the errors of the
+        union of the tree validator.
+        """
+        try:
+            return cls.validator().validate_python(
+                config_data, context={"lazy_callables": lazy_callables}
+            )
+        except ValidationError as e:
+            if any(error["type"] == "recursion_loop" for error in e.errors()):
+                raise RecursionError(
+                    "The configuration is nested too deep to be validated "
+                    "in one pass."
+                ) from None
+        except (_ConstructionError, ImportError):
+            pass
+        from simple_config_builder.config_io import construct_config
+
+        return construct_config(copy.deepcopy(config_data), lazy_callables)
+
+
+def _json_class_schema(
+    config_class: type[BaseModel],
+    definitions: dict[str, core_schema.CoreSchema | None],
+) -> core_schema.CoreSchema | None:
+    """
+    Create the schema of a tagged node of a typed JSON document.
+
+    The node is validated by a typed dictionary of the fields of the class
+    first, which validates the `_config_class_type` of the class, forbids
+    other keys and constructs the children, and then by the unchanged
+    schema of the class, so nodes with unknown keys or of another class
+    fail the validation.
+
+    Parameters
+    ----------
+    config_class: The class of the node.
+    definitions: The schemas of the nodes and the shared definitions of
+        the classes by their reference, filled by the function.
+
+    Returns
+    -------
+    A reference to the schema of the class in `definitions`, or None if
+    the documents of the class are not typed.
+    """
+    class_str = ConfigClassRegistry.get_class_str_from_class(config_class)
+    ref = f"json:{class_str}"
+    if ref in definitions:
+        return core_schema.definition_reference_schema(ref)
+    if not (
+        issubclass(config_class, Configclass)
+        and config_class.__pydantic_complete__
+        and config_class.model_config.get("extra") in (None, "ignore")
+    ):
+        return None
+    # Added before the fields, so recursive classes refer to themselves
+    definitions[ref] = None
+    fields = {
+        CONFIG_CLASS_TYPE_KEY: core_schema.typed_dict_field(
+            core_schema.literal_schema([class_str]), required=False
+        )
+    }
+    for key, field_info in config_class.__pydantic_fields__.items():
+        schema = _json_field_schema(field_info.annotation, definitions)
+        if schema is None:
+            return None
+        fields[key] = core_schema.typed_dict_field(schema, required=False)
+    definitions[ref] = core_schema.chain_schema(
+        [
+            core_schema.typed_dict_schema(fields, extra_behavior="forbid"),
+            # The constructed children are kept by the model validation
+            _shared_schema(config_class.__pydantic_core_schema__, definitions),
+        ],
+        ref=ref,
+    )
+    return core_schema.definition_reference_schema(ref)
+
+
+def _json_field_schema(
+    annotation: Any, definitions: dict[str, core_schema.CoreSchema | None]
+) -> core_schema.CoreSchema | None:
+    """
+    Create the schema of a field value of a typed JSON document.
+
+    Values which can not hold tagged nodes are passed through to the
+    validation of the class, like callables, which the class resolves.
+    Tagged nodes are only supported in fields annotated with Configclasses
+    and lists, tuples, dictionaries and optionals of them.
+
+    Returns
+    -------
+    The schema, or None if the field can hold tagged nodes elsewhere.
+    """
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if annotation is Callable or origin is Callable:
+        return core_schema.any_schema()
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _json_class_schema(annotation, definitions)
+    if not can_hold_config_node(annotation):
+        return core_schema.any_schema()
+    if origin is Annotated:
+        return _json_field_schema(args[0], definitions)
+    if origin in (Union, UnionType) and len(args) == 2 and type(None) in args:
+        (item,) = (arg for arg in args if arg is not type(None))
+        schema = _json_field_schema(item, definitions)
+        return None if schema is None else core_schema.nullable_schema(schema)
+    if origin is list and len(args) == 1:
+        schema = _json_field_schema(args[0], definitions)
+        return None if schema is None else core_schema.list_schema(schema)
+    if origin is dict and len(args) == 2:
+        schema = _json_field_schema(args[1], definitions)
+        return (
+            None
+            if schema is None
+            else core_schema.dict_schema(core_schema.any_schema(), schema)
+        )
+    if origin is tuple and args:
+        variadic = args[-1] is Ellipsis
+        schemas = [
+            _json_field_schema(arg, definitions)
+            for arg in (args[:1] if variadic else args)
+        ]
+        if None in schemas:
+            return None
+        return core_schema.tuple_schema(
+            schemas, variadic_item_index=0 if variadic else None
+        )
+    return None
+
+
+# Matches the tag of the root node if it is the first key of the document,
+# as written by write_json.
+_ROOT_TAG = re.compile(rb'\A\s*\{\s*"_config_class_type"\s*:\s*"([^"\\]*)"')
+
+
+class ConfigJsonValidator:
+    """
+    Validator for typed JSON configuration documents.
+
+    A document is typed if its root is tagged with a Configclass whose
+    fields only hold tagged nodes in fields annotated with Configclasses.
+    Such documents are validated from the JSON bytes into the Configclass
+    instances in pydantic-core, without building the dictionary tree
+    first. For other documents, and for documents which fail this
+    validation, validate returns None and the document is validated by
+    the ConfigTreeValidator, which raises the errors of the document.
+    """
+
+    __validators: ClassVar[dict[str, SchemaValidator | None]] = {}
+    __generation: ClassVar[int] = -1
+    __lock: ClassVar = Lock()
+
+    @classmethod
+    def validator(cls, config_class_type: str) -> SchemaValidator | None:
+        """
+        Get the JSON validator of a registered class.
+
+        Parameters
+        ----------
+        config_class_type: The `_config_class_type` of the root node.
+
+        Returns
+        -------
+        The validator, or None if the class is not registered or the
+        documents of the class are not typed.
+        """
+        with cls.__lock:
+            generation = ConfigClassRegistry.generation()
+            if cls.__generation != generation:
+                cls.__validators = {}
+                cls.__generation = generation
+            if config_class_type in cls.__validators:
+                return cls.__validators[config_class_type]
+            try:
+                config_class = ConfigClassRegistry.get(config_class_type)
+            except ValueError:
+                # The module of the class is imported by the tree path
+                return None
+            validator = None
+            definitions: dict[str, core_schema.CoreSchema | None] = {}
+            root = _json_class_schema(config_class, definitions)
+            if root is not None:
+                validator = SchemaValidator(
+                    core_schema.definitions_schema(
+                        root, list(definitions.values())
+                    )
+                )
+            cls.__validators[config_class_type] = validator
+            return validator
+
+    @classmethod
+    def validate(
+        cls, config_data: bytes, lazy_callables: bool = False
+    ) -> Configclass | None:
+        """
+        Validate a typed JSON document.
+
+        Parameters
+        ----------
+        config_data: The JSON document.
+        lazy_callables: Load callables as LazyCallable proxies.
+
+        Returns
+        -------
+        The Configclass instance of the root node, or None if the document
+        is not typed or has to be validated by the ConfigTreeValidator.
+        """
+        match = _ROOT_TAG.match(config_data)
+        if match is None:
+            return None
+        validator = cls.validator(match.group(1).decode())
+        if validator is None:
+            return None
+        try:
+            return validator.validate_json(
+                config_data, context={"lazy_callables": lazy_callables}
+            )
+        except (ValueError, RecursionError):
+            # Includes ValidationErrors, e.g. for unknown keys or
+            # polymorphic nodes, which the tree validation handles
+            return None
+
+
+__all__ = [
+    "ConfigJsonValidator",
+    "ConfigTreeValidator",
+    "can_hold_config_node",
+    "resolve_config_class",
+    "validate_config_class",
+]
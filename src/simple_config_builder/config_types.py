@@ -1,4 +1,4 @@
-"""The module defines the configuration types using an enumeration."""
+"""The module defines the configuration types and write durability levels."""
 
 from enum import Enum
 
@@ -15,3 +15,29 @@ class ConfigTypes(Enum):
     JSON = "json"
     YAML = "yaml"
     TOML = "toml"
+    MSGPACK = "msgpack"
+    JSONL = "jsonl"
+    BINARY = "binary"
+
+
+class Durability(Enum):
+    """
+    The enumeration of the durability levels of writes.
+
+    Configuration files are always written atomically: the data is written
+    to a temporary file in the same directory, which then replaces the
+    file. Readers see either the old or the new file, never a truncated
+    one. The durability level decides what is flushed to the disk before
+    the write returns, which trades the speed of the write for surviving a
+    crash of the system.
+
+    - NONE: Nothing is flushed, e.g. for frequent autosaves. A crash of
+      the system may lose the write, but does not truncate the file.
+    - FILE: The temporary file is flushed before it replaces the file.
+    - FULL: The directory is flushed as well, so the replacement itself
+      survives a crash.
+    """
+
+    NONE = "none"
+    FILE = "file"
+    FULL = "full"
@@ -7,12 +7,155 @@ It gives the ability to autosave the configuration file when the configuration
 objects are updated.
 """
 
-from threading import Timer
+import asyncio
+import hashlib
+import logging
+import os
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Executor
+from threading import Lock
 from typing import Any
 
-from simple_config_builder.config import Configclass
-from simple_config_builder.config_io import parse_config, write_config
-from simple_config_builder.config_types import ConfigTypes
+from simple_config_builder.config import AssignmentObservers, Configclass
+from simple_config_builder.config_cache import ConfigCache
+from simple_config_builder.config_diff import MISSING, Change, diff_configs
+from simple_config_builder.config_formats import FormatRegistry
+from simple_config_builder.config_index import ConfigIndex
+from simple_config_builder.config_io import (
+    atomic_write,
+    load_config_data,
+    parse_config,
+    serialize_config,
+    validate_config,
+)
+from simple_config_builder.config_path import PathAccessor
+from simple_config_builder.config_revalidate import (
+    collect_nodes,
+    copy_config_data,
+    count_nodes,
+    is_unmodified,
+    revalidate_config,
+)
+from simple_config_builder.config_sections import (
+    LazySections,
+    parse_lazy_config,
+)
+from simple_config_builder.config_subscriptions import (
+    ChangeSubscriptions,
+    Subscription,
+)
+from simple_config_builder.config_types import ConfigTypes, Durability
+from simple_config_builder.scheduler import Scheduler, Task
+from simple_config_builder.watcher import FileWatcher
+
+logger = logging.getLogger(__name__)
+
+
+def _file_signature(file: str | int) -> tuple[int, int, int] | None:
+    """Get the inode, size and modification time of a file or descriptor."""
+    try:
+        stat = os.stat(file)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class _FileState:
+    """
+    The content of the file of a configparser and the counts of writes.
+
+    The digest and the stat signature are those of the content which was
+    read or written last, see Configparser._write.
+    """
+
+    def __init__(self):
+        self.digest: str | None = None
+        self.signature: tuple[int, int, int] | None = None
+        self.writes = 0
+        self.skipped_writes = 0
+
+    def remember(self, config_bytes: bytes | None, signature: Any):
+        """Remember the content and the stat signature of the file."""
+        self.digest = (
+            None
+            if config_bytes is None
+            else hashlib.blake2b(config_bytes, digest_size=16).hexdigest()
+        )
+        self.signature = signature
+
+
+class _Autosaver:
+    """
+    Write the configuration data of a configparser after changes.
+
+    Assignments to the Configclass instances of the configuration data and
+    to `config_data` mark the configparser dirty. The first change
+    registers a write with the shared Scheduler and the changes until it
+    runs are written at once, so the file is written at most once per
+    interval. A pending write also runs at the shutdown of the scheduler.
+    """
+
+    def __init__(self, configparser: "Configparser", interval: float):
+        self._configparser = weakref.ref(configparser)
+        self.interval = interval
+        self.dirty = False
+        self._lock = Lock()
+        self._task: Task | None = None
+
+    def observe(self, config_data: Any):
+        """Observe the assignments of the Configclass instances of a tree."""
+        stack = [config_data]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, Configclass):
+                AssignmentObservers.observe(value, self._assigned)
+                stack.extend(value.__dict__.values())
+            elif isinstance(value, LazySections):
+                # Sections are observed when they are constructed
+                value.on_load = self.observe
+                stack.extend(value.loaded_values())
+            elif isinstance(value, dict):
+                stack.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                stack.extend(value)
+
+    def _assigned(self, config: Configclass, name: str):
+        """Observe the assigned value and mark the configparser dirty."""
+        self.observe(getattr(config, name))
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        """Mark the configparser dirty and schedule a write."""
+        with self._lock:
+            self.dirty = True
+            if self._task is None:
+                self._task = Scheduler.shared().register(
+                    self._write, self.interval, run_at_shutdown=True
+                )
+
+    def mark_clean(self):
+        """Mark the configparser clean, e.g. after it was saved."""
+        with self._lock:
+            self.dirty = False
+
+    def _write(self):
+        """Write the configuration data if the configparser is dirty."""
+        with self._lock:
+            self._task = None
+            if not self.dirty:
+                return
+            self.dirty = False
+        configparser = self._configparser()
+        if configparser is None:
+            return
+        try:
+            configparser._write()
+        except Exception:
+            logger.exception(
+                "Autosave of %s failed.", configparser.config_file
+            )
+            self.mark_dirty()
 
 
 class Configparser:
@@ -28,7 +171,12 @@ class Configparser:
     config_type: ConfigTypes | None
     autosave: bool
     autoreload: bool
-    config_data: dict | list | Configclass
+    lazy_callables: bool
+    cache: ConfigCache | None
+    autosave_interval: float
+    durability: Durability
+    lazy: bool
+    config_data: dict | list | Configclass | LazySections
 
     def __init__(
         self,
@@ -36,6 +184,11 @@ class Configparser:
         config_type: ConfigTypes | None = None,
         autosave: bool = False,
         autoreload: bool = False,
+        lazy_callables: bool = False,
+        cache: ConfigCache | None = None,
+        autosave_interval: float = 1.0,
+        durability: Durability = Durability.FILE,
+        lazy: bool = False,
     ):
         """
         Initialize the configparser.
@@ -46,6 +199,19 @@ class Configparser:
         config_type: The configuration type. Defaults to None.
         autosave: Autosave the configuration file. Defaults to False.
         autoreload: Autoreload the configuration file. Defaults to False.
+        lazy_callables: Load callables as proxies that import their module
+            on first use. Defaults to False.
+        cache: Cache of parsed configuration files, see ConfigCache.
+            Defaults to None.
+        autosave_interval: The minimal time in seconds between two
+            autosaves, changes in between are written at once. Defaults
+            to 1.0.
+        durability: What is flushed to the disk by save and autosave, see
+            Durability. Frequent autosaves can use Durability.NONE.
+            Defaults to Durability.FILE.
+        lazy: Construct the top level sections of the configuration data
+            on their first access, see LazySections. The cache is not
+            used in the lazy mode. Defaults to False.
 
         Raises
         ------
@@ -56,6 +222,12 @@ class Configparser:
         self.config_type = config_type
         self.autosave = autosave
         self.autoreload = autoreload
+        self.lazy_callables = lazy_callables
+        self.cache = cache
+        self.autosave_interval = autosave_interval
+        self.durability = durability
+        self.lazy = lazy
+        self._init_state()
         if self.autoreload and self.autosave:
             raise ValueError(
                 "Autoreload and autosave cannot be enabled at the same time."
@@ -68,7 +240,44 @@ class Configparser:
         if self.config_type is None:
             raise ValueError("The configuration type is not supported.")
         # first read
-        self.config_data = parse_config(self.config_file, self.config_type)
+        self.config_data = self._parse(self._read())
+        if self.autoreload:
+            self._auto_reload_config()
+        if self.autosave:
+            self._auto_save_config()
+
+    def _init_state(self):
+        """
+        Initialize the private state of the configparser.
+
+        The private attributes are runtime state, they are neither pickled
+        nor serialized by the GUI backend.
+        """
+        self._file_state = _FileState()
+        self._autosaver: _Autosaver | None = None
+        self._unwatch: weakref.finalize | None = None
+        self._config_index: ConfigIndex | None = None
+        self._index_lock = Lock()
+        self._subscriptions: ChangeSubscriptions | None = None
+        # The compiled path accessors, see get
+        self._accessors: dict[str, PathAccessor] = {}
+        self._reload_stats = {"revalidated": 0, "reused": 0}
+        # The parsed data of the last reload and the collected nodes of the
+        # configuration data at that time, see reload
+        self._raw_data: tuple[Any, list[Any]] | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the public attributes, the private state is not pickled."""
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if not name.startswith("_")
+        }
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the public attributes and start the autosave/reload."""
+        self._init_state()
+        self.__dict__.update(state)
         if self.autoreload:
             self._auto_reload_config()
         if self.autosave:
@@ -82,6 +291,11 @@ class Configparser:
         config_type: ConfigTypes | None = None,
         autosave: bool = False,
         autoreload: bool = False,
+        lazy_callables: bool = False,
+        cache: ConfigCache | None = None,
+        autosave_interval: float = 1.0,
+        durability: Durability = Durability.FILE,
+        lazy: bool = False,
     ) -> "Configparser":
         """
         Create a Configparser instance from Python data.
@@ -93,6 +307,16 @@ class Configparser:
         config_type: The configuration type.
         autosave: Autosave the configuration file. Defaults to False.
         autoreload: Autoreload the configuration file. Defaults to False.
+        lazy_callables: Load callables as proxies that import their module
+            on first use. Defaults to False.
+        cache: Cache of parsed configuration files, see ConfigCache.
+            Defaults to None.
+        autosave_interval: The minimal time in seconds between two
+            autosaves. Defaults to 1.0.
+        durability: What is flushed to the disk by save and autosave.
+            Defaults to Durability.FILE.
+        lazy: Construct the sections of reloaded configuration data on
+            their first access. Defaults to False.
 
         Returns
         -------
@@ -103,53 +327,134 @@ class Configparser:
             config_type=config_type,
             autosave=autosave,
             autoreload=autoreload,
+            lazy_callables=lazy_callables,
+            cache=cache,
+            autosave_interval=autosave_interval,
+            durability=durability,
+            lazy=lazy,
         )
         configparser.config_data = data
         return configparser
 
+    def _read(self) -> bytes | None:
+        """
+        Read the content of the configuration file.
+
+        The digest of the content is remembered, so writes of the same
+        content are skipped, see _write.
+
+        Returns
+        -------
+        The content, or None if the file does not exist.
+        """
+        try:
+            with open(self.config_file, "rb") as f:
+                signature = _file_signature(f.fileno())
+                config_bytes = f.read()
+        except FileNotFoundError:
+            signature = config_bytes = None
+        self._file_state.remember(config_bytes, signature)
+        return config_bytes
+
+    def _parse(
+        self, config_bytes: bytes | None
+    ) -> dict | list | Configclass | LazySections:
+        """Parse the content of the file, lazily in the lazy mode."""
+        if self.config_type is None or config_bytes is None:
+            return {}
+        if self.lazy:
+            return parse_lazy_config(
+                self.config_file,
+                self.config_type,
+                self.lazy_callables,
+                config_bytes,
+            )
+        return parse_config(
+            self.config_file,
+            self.config_type,
+            self.lazy_callables,
+            self.cache,
+            config_bytes,
+        )
+
     def _get_config_type(self) -> ConfigTypes:
         """
         Get the configuration type from the configuration file.
 
+        The type is looked up by the file extension in the FormatRegistry.
+
         Returns
         -------
             The configuration type.
         """
-        if self.config_file.endswith(".json"):
-            return ConfigTypes.JSON
-        if self.config_file.endswith(".yaml"):
-            return ConfigTypes.YAML
-        if self.config_file.endswith(".toml"):
-            return ConfigTypes.TOML
-        raise ValueError("The configuration type is not supported.")
+        return FormatRegistry.config_type_of(self.config_file)
+
+    def __setattr__(self, name: str, value: Any):
+        """Mark the configparser dirty if the configuration data is set."""
+        super().__setattr__(name, value)
+        if name == "config_data":
+            self._raw_data = None
+            self._accessors.clear()
+            self._close_index()
+            if self._subscriptions:
+                # The assignments are observed through the index
+                self._index()
+            autosaver = self._autosaver
+            if autosaver is not None:
+                autosaver.observe(value)
+                autosaver.mark_dirty()
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the configuration data has changes to autosave."""
+        autosaver = self._autosaver
+        return autosaver is not None and autosaver.dirty
 
     def _auto_save_config(self):
-        """Autosave the configuration file."""
-        self._old_config_data = self.config_data
-
-        def _save_config():
-            if self.config_type is None:
-                return
-            if self._old_config_data != self.config_data:
-                write_config(
-                    self.config_file, self.config_data, self.config_type
-                )
-                self._old_config_data = self.config_data
+        """
+        Autosave the configuration file.
 
-        Timer(1, _save_config).start()
+        Assignments to the configuration data are tracked through the
+        AssignmentObservers of the Configclass instances, so checking for
+        changes does not depend on the size of the configuration.
+        """
+        autosaver = _Autosaver(self, self.autosave_interval)
+        autosaver.observe(self.config_data)
+        self._autosaver = autosaver
 
     def _auto_reload_config(self):
-        """Autoreload the configuration file."""
+        """
+        Autoreload the configuration file.
 
-        # Check for changes in the configuration file
-        def _reload_config():
-            if self.config_type is None:
-                return
-            new_config_data = parse_config(self.config_file, self.config_type)
-            if new_config_data != self.config_data:
-                self.config_data = new_config_data
+        The file is watched by the shared FileWatcher, which reloads the
+        configuration data after the file changed. The watcher only holds
+        a weak reference, so the watch ends with the configparser.
+        """
+        reference = weakref.ref(self)
+
+        def _reload_config(_path: str):
+            configparser = reference()
+            if configparser is not None:
+                configparser.reload()
 
-        Timer(1, _reload_config).start()
+        watcher = FileWatcher.shared()
+        watch_id = watcher.watch(self.config_file, _reload_config)
+        self._unwatch = weakref.finalize(self, watcher.unwatch, watch_id)
+
+    def close(self):
+        """
+        Stop the autoreload and write pending autosave changes.
+
+        The index of the configuration data is dropped as well.
+        """
+        unwatch, self._unwatch = self._unwatch, None
+        if unwatch is not None:
+            unwatch()
+        self._close_index()
+        autosaver, self._autosaver = self._autosaver, None
+        if autosaver is not None and autosaver.dirty:
+            autosaver.mark_clean()
+            self._write()
 
     def contains(
         self, config_field_type: Any = None, config_field: str | None = None
@@ -157,9 +462,12 @@ class Configparser:
         """
         Check if the configuration data contains the given field or type.
 
-        The method returns the first occurrence of the field or type in the
-        configuration data. Either `config_field_type` or `config_field`
-        must be provided, but not both.
+        The field or type is looked up in the index of the configuration
+        data, which is built on the first call and updated on assignments,
+        see ConfigIndex. Mutations of containers, e.g.
+        `config_data["key"] = 1`, are indexed by reindex. A dictionary or list
+        at the root is not matched by its type. Either `config_field_type`
+        or `config_field` must be provided, but not both.
 
         Parameters
         ----------
@@ -177,76 +485,383 @@ class Configparser:
         ValueError: If both `config_field_type` and `config_field`
                     are provided.
         """
-
-        def _contains_type(config_data, config_type: Any) -> bool:
-            if isinstance(config_data, dict):
-                for key, value in config_data.items():
-                    if isinstance(value, config_type):
-                        return True
-                    if _contains_type(value, config_type):
-                        return True
-            elif isinstance(config_data, list):
-                for item in config_data:
-                    if isinstance(item, config_type):
-                        return True
-                    if _contains_type(item, config_type):
-                        return True
-            elif isinstance(config_data, Configclass):
-                if isinstance(config_data, config_type):
-                    return True
-                for name in type(config_data).model_fields.keys():
-                    if _contains_type(getattr(config_data, name), config_type):
-                        return True
-            elif isinstance(config_data, config_type):
-                return True
-            return False
-
-        def _contains_field(config_data, field: str) -> bool:
-            if isinstance(config_data, dict):
-                if field in config_data:
-                    return True
-                for value in config_data.values():
-                    if _contains_field(value, field):
-                        return True
-            elif isinstance(config_data, list):
-                if field in config_data:
-                    return True
-                for item in config_data:
-                    if _contains_field(item, field):
-                        return True
-            elif isinstance(config_data, Configclass):
-                if field in list(type(config_data).model_fields.keys()):
-                    return True
-                for name in type(config_data).model_fields.keys():
-                    if _contains_field(getattr(config_data, name), field):
-                        return True
-            return False
-
         if config_field_type is None and config_field is None:
-            msg = (
-                "Either config_field_type or config_field " "must be provided."
-            )
+            msg = "Either config_field_type or config_field must be provided."
             raise ValueError(msg)
         if config_field_type is not None and config_field is not None:
             msg = (
-                "Only one of config_field_type or config_field"
-                "can be provided."
+                "Only one of config_field_type or config_field can be "
+                "provided."
             )
             raise ValueError(msg)
         if config_field is not None:
-            return _contains_field(self.config_data, config_field)
-        if config_field_type is not None:
-            return _contains_type(self.config_data, config_field_type)
-        return False
+            return self._index().has_field(config_field)
+        return self._index().has_type(config_field_type)
+
+    def find_all(
+        self, field: str | None = None, type: Any = None
+    ) -> list[tuple[str, Any]]:
+        """
+        Find every occurrence of a field or type in the configuration data.
+
+        The matches are looked up in the index of the configuration data,
+        see ConfigIndex. Either `field` or `type` must be provided, but
+        not both.
+
+        Parameters
+        ----------
+        field: The field name, which matches the keys of dictionaries, the
+            fields of Configclass instances and the strings of lists.
+        type: The type, which matches its instances.
+
+        Returns
+        -------
+        The paths and values of the matches, e.g.
+        `[("db.pools[2].timeout", 5)]`. The matches are in the order of
+        the data, except that assigned subtrees come last.
+
+        Raises
+        ------
+        ValueError: If neither or both of `field` and `type` are provided.
+        """
+        if (field is None) == (type is None):
+            raise ValueError("Exactly one of field or type must be provided.")
+        if field is not None:
+            return self._index().find_field(field)
+        return self._index().find_type(type)
+
+    def reindex(self):
+        """
+        Index the configuration data again after mutations of containers.
+
+        Assignments to the Configclass instances, set and the replacement
+        of `config_data` update the index, mutations of dictionaries and
+        lists, e.g. `config_data["key"] = 1`, are only indexed by a call of
+        reindex.
+        """
+        with self._index_lock:
+            index = self._config_index
+            if index is not None:
+                index.reindex()
+
+    def get(self, path: str) -> Any:
+        """
+        Get the value at a path of the configuration data.
+
+        The path is compiled once into an accessor, which is cached until
+        the configuration data is replaced, e.g. by a reload, see
+        PathAccessor.
+
+        Parameters
+        ----------
+        path: The dotted path, e.g. `db.pools[2].timeout`, or the JSON
+            pointer, e.g. `/db/pools/2/timeout`.
+
+        Returns
+        -------
+        The value.
+
+        Raises
+        ------
+        KeyError: If the path is not in the configuration data.
+        ValueError: If the path is not valid.
+        """
+        accessor = self._accessors.get(path)
+        if accessor is None:
+            accessor = self._accessor(path)
+        return accessor.get(self.config_data)
+
+    def get_many(self, paths: list[str]) -> list[Any]:
+        """
+        Get the values at several paths of the configuration data.
+
+        Parameters
+        ----------
+        paths: The paths, see get.
+
+        Returns
+        -------
+        The values in the order of the paths.
+
+        Raises
+        ------
+        KeyError: If a path is not in the configuration data.
+        ValueError: If a path is not valid.
+        """
+        config_data = self.config_data
+        return [self._accessor(path).get(config_data) for path in paths]
+
+    def set(self, path: str, value: Any):
+        """
+        Set the value at a path of the configuration data.
+
+        Fields of Configclass instances are assigned, so the value is
+        validated by `validate_assignment` and the assignment is autosaved
+        and indexed like any other assignment. Items of dictionaries and
+        lists are set as they are.
+
+        Parameters
+        ----------
+        path: The path, see get. The root cannot be set, assign
+            `config_data` instead.
+        value: The value.
+
+        Raises
+        ------
+        KeyError: If the parent of the path is not in the configuration
+            data, or the Configclass at it has no such field.
+        ValueError: If the path is not valid or is the root.
+        pydantic.ValidationError: If the value is not valid for the field.
+        """
+        accessor = self._accessor(path)
+        # The items of containers are not collected again
+        self._raw_data = None
+        subscriptions = self._subscriptions
+        if subscriptions:
+            try:
+                old_value = accessor.get(self.config_data)
+            except KeyError:
+                old_value = MISSING
+        if accessor.set(self.config_data, value):
+            return
+        # The item of a container is not observed by the index and autosave
+        self._close_index()
+        autosaver = self._autosaver
+        if autosaver is not None:
+            autosaver.observe(value)
+            autosaver.mark_dirty()
+        if subscriptions:
+            self._index()
+            subscriptions.dispatch(diff_configs(old_value, value, path))
+
+    def on_change(
+        self,
+        pattern: str,
+        callback: Callable[[list[Change]], Any],
+        executor: Executor | asyncio.AbstractEventLoop | None = None,
+    ) -> Subscription:
+        """
+        Subscribe to the changes of the paths matching a pattern.
+
+        The callback is called with the list of the changes which concern
+        the pattern, once per reload and once per assignment of a field of
+        a Configclass or call of set. Changes of the paths of other
+        patterns and reloads which change nothing are not notified.
+        Assignments are observed through the index of the configuration
+        data, see ConfigIndex, which is kept while there are
+        subscriptions.
+
+        Parameters
+        ----------
+        pattern: The pattern of the paths, e.g. `cache.*`, see
+            config_subscriptions.
+        callback: The callable to call with the list of the changes, see
+            diff_configs.
+        executor: The executor of concurrent.futures to run the callback,
+            e.g. a ThreadPoolExecutor, or the asyncio event loop to run it
+            on. Defaults to None, which calls the callback inline.
+
+        Returns
+        -------
+        The subscription, which is removed by unsubscribe.
+        """
+        subscription = Subscription(pattern, callback, executor)
+        if self._subscriptions is None:
+            self._subscriptions = ChangeSubscriptions()
+        self._subscriptions.subscribe(subscription)
+        self._index()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """
+        Remove a subscription of on_change.
+
+        Parameters
+        ----------
+        subscription: The subscription.
+        """
+        if self._subscriptions is not None:
+            self._subscriptions.unsubscribe(subscription)
+
+    def _accessor(self, path: str) -> PathAccessor:
+        """Get the cached accessor of a path, compiling it once."""
+        accessor = self._accessors.get(path)
+        if accessor is None:
+            accessor = PathAccessor.compile(path, self.config_data)
+            self._accessors[path] = accessor
+        return accessor
+
+    def _index(self) -> ConfigIndex:
+        """Get the index of the configuration data, building it once."""
+        with self._index_lock:
+            index = self._config_index
+            if index is None:
+                index = ConfigIndex(self.config_data)
+                index.on_assigned = self._assigned_handler()
+                self._config_index = index
+            return index
+
+    def _close_index(self):
+        """Drop the index of the configuration data."""
+        with self._index_lock:
+            index, self._config_index = self._config_index, None
+        if index is not None:
+            index.close()
+
+    def _assigned_handler(self) -> Callable[[str, Any, Any], None]:
+        """Get the handler of the assignments, which notifies the changes."""
+        reference = weakref.ref(self)
+
+        def _assigned(path: str, old_value: Any, new_value: Any):
+            configparser = reference()
+            if configparser is None:
+                return
+            subscriptions = configparser._subscriptions
+            if subscriptions:
+                subscriptions.dispatch(
+                    diff_configs(old_value, new_value, path)
+                )
+
+        return _assigned
 
     def save(self):
         """Save the configuration data to the configuration file."""
+        autosaver = self._autosaver
+        if autosaver is not None:
+            autosaver.mark_clean()
+        self._write()
+
+    def _write(self):
+        """
+        Write the configuration data to the configuration file.
+
+        The write is skipped if the serialized data is the content the
+        file had when it was read or written last, and the file was not
+        changed since.
+        """
         if self.config_type is None:
             return
-        write_config(self.config_file, self.config_data, self.config_type)
+        if isinstance(self.config_data, LazySections):
+            # Untouched sections are written with their original bytes
+            config_bytes = self.config_data.serialize()
+        else:
+            config_bytes = serialize_config(self.config_data, self.config_type)
+        state = self._file_state
+        digest = hashlib.blake2b(config_bytes, digest_size=16).hexdigest()
+        if (
+            digest == state.digest
+            and _file_signature(self.config_file) == state.signature
+        ):
+            state.skipped_writes += 1
+            return
+        with atomic_write(self.config_file, "wb", self.durability) as f:
+            f.write(config_bytes)
+        state.writes += 1
+        state.digest = digest
+        state.signature = _file_signature(self.config_file)
+
+    def _revalidate(
+        self, old_data: Any, config_bytes: bytes | None
+    ) -> tuple[Any, Any]:
+        """Validate the changes of the file, returning a copy of its data."""
+        new_raw = (
+            {}
+            if config_bytes is None
+            else load_config_data(
+                self.config_file, self.config_type, config_bytes
+            )
+        )
+        raw_data = copy_config_data(new_raw)
+        nodes = count_nodes(new_raw)
+        previous = self._raw_data
+        if previous is not None and is_unmodified(previous[1], old_data):
+            try:
+                new_data, revalidated = revalidate_config(
+                    previous[0], new_raw, old_data, self.lazy_callables
+                )
+            except (RecursionError, ValueError, ImportError):
+                # The validation of all data raises the errors of the file,
+                # the failed validation may have modified the parsed data
+                new_raw = copy_config_data(raw_data)
+            else:
+                self._reload_stats = {
+                    "revalidated": revalidated,
+                    "reused": nodes - revalidated,
+                }
+                return new_data, raw_data
+        new_data = validate_config(new_raw, self.lazy_callables)
+        self._reload_stats = {"revalidated": nodes, "reused": 0}
+        return new_data, raw_data
+
+    def write_stats(self) -> dict[str, int]:
+        """
+        Get the statistics of the writes of save and autosave.
+
+        Returns
+        -------
+        A dictionary with the number of performed writes and of writes
+        which were skipped because the file content was up to date.
+        """
+        state = self._file_state
+        return {
+            "performed": state.writes,
+            "skipped": state.skipped_writes,
+        }
+
+    def reload_stats(self) -> dict[str, int]:
+        """
+        Get the statistics of the validation of the last reload.
+
+        Returns
+        -------
+        A dictionary with the number of nodes, i.e. dictionaries and
+        lists of the parsed data, which were validated and which were
+        reused from the previous configuration data, see reload.
+        """
+        return dict(self._reload_stats)
+
+    def reload(self) -> list[Change]:
+        """
+        Reload the configuration data from the configuration file.
+
+        The parsed data is compared with the parsed data of the previous
+        reload and only the changed subtrees are validated, the unchanged
+        Configclass instances are reused, see revalidate_config. The
+        first reload, reloads after assignments to the configuration data
+        or modifications of its containers and reloads in the lazy mode or
+        with a cache validate all data.
+        The counts of the nodes are reported by reload_stats.
 
-    def reload(self):
-        """Reload the configuration data from the configuration file."""
+        Returns
+        -------
+        The changes of the configuration data, see diff_configs. Lazily
+        loaded data is not compared, it is reported as a change of the
+        root.
+        """
         if self.config_type is None:
-            return
-        self.config_data = parse_config(self.config_file, self.config_type)
+            return []
+        old_data = self.config_data
+        raw_data = None
+        config_bytes = self._read()
+        if self.lazy or self.cache is not None:
+            new_data = self._parse(config_bytes)
+            self._reload_stats = {"revalidated": 0, "reused": 0}
+        else:
+            new_data, raw_data = self._revalidate(old_data, config_bytes)
+        if isinstance(old_data, LazySections) or isinstance(
+            new_data, LazySections
+        ):
+            changes = [Change("", old_data, new_data)]
+        else:
+            changes = diff_configs(old_data, new_data)
+        self.config_data = new_data
+        if raw_data is not None:
+            self._raw_data = (raw_data, collect_nodes(new_data))
+        autosaver = self._autosaver
+        if autosaver is not None:
+            # The reloaded data matches the file
+            autosaver.mark_clean()
+        subscriptions = self._subscriptions
+        if subscriptions:
+            subscriptions.dispatch(changes)
+        return changes
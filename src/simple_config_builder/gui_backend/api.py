@@ -1,6 +1,7 @@
 """API routes for the GUI backend."""
 
 import uuid
+from typing import Any
 from fastapi import APIRouter, Request
 from fastapi import FastAPI
 from fastapi import Response
@@ -17,6 +18,15 @@ api_router_v1 = APIRouter(prefix="/api/v1")
 session_data = SessionData()
 
 
+def public_attributes(instance: Any) -> dict[str, Any]:
+    """Get the attributes of an instance which do not start with "_"."""
+    return {
+        name: value
+        for name, value in vars(instance).items()
+        if not name.startswith("_")
+    }
+
+
 @app.middleware("http")
 async def check_for_session_data(request, call_next):
     """Middleware to check for session data."""
@@ -73,7 +83,7 @@ async def load_config(config_path: str, request: Request):
     except ValueError as e:
         return {"error": str(e)}
     session_data[request.state.session_key]["config"] = config
-    return {"config": config}
+    return {"config": public_attributes(config)}
 
 
 @api_router_v1.get("/get-config-classes")
@@ -0,0 +1,368 @@
+"""
+Process wide scheduler of the background tasks of the configparsers.
+
+The autosave and autoreload of every Configparser run as tasks of one
+Scheduler, so the number of threads does not grow with the number of
+configparsers. The scheduler keeps the timed tasks in a heap and runs
+them on a single daemon thread, which also waits for readable file
+descriptors, e.g. the inotify events of the FileWatcher.
+
+Example:
+    ``` python
+    from simple_config_builder.scheduler import Scheduler
+
+    scheduler = Scheduler.shared()
+    task = scheduler.register(lambda: print("tick"), delay=1, interval=1)
+    ...
+    scheduler.unregister(task)
+    print(scheduler.metrics())
+    ```
+
+Tasks run one after another on the thread of the scheduler, so they
+should return quickly. How late the tasks start is reported as lag by
+`metrics`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import heapq
+import logging
+import os
+import selectors
+import time
+from collections.abc import Callable
+from itertools import count
+from threading import Lock, Thread, current_thread
+
+logger = logging.getLogger(__name__)
+
+
+class Task:
+    """A task registered with the Scheduler."""
+
+    __slots__ = (
+        "callback",
+        "cancelled",
+        "deadline",
+        "interval",
+        "run_at_shutdown",
+    )
+
+    def __init__(
+        self,
+        callback: Callable[[], object],
+        deadline: float,
+        interval: float | None,
+        run_at_shutdown: bool,
+    ):
+        self.callback = callback
+        self.deadline = deadline
+        self.interval = interval
+        self.run_at_shutdown = run_at_shutdown
+        self.cancelled = False
+
+
+class Scheduler:
+    """
+    Run timed tasks and file descriptor callbacks on one daemon thread.
+
+    The thread is started with the first task or reader.
+    """
+
+    _shared: Scheduler | None = None
+    _shared_lock = Lock()
+
+    def __init__(self):
+        """Initialize the scheduler."""
+        self._lock = Lock()
+        self._heap: list[tuple[float, int, Task]] = []
+        self._sequence = count()
+        self._tasks = 0
+        self._readers: dict[int, Callable[[], object]] = {}
+        self._thread: Thread | None = None
+        self._closed = False
+        self._runs = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+        self._lag_last = 0.0
+        self._wake_read, self._wake_write = os.pipe()
+        os.set_blocking(self._wake_read, False)
+        os.set_blocking(self._wake_write, False)
+        # The selector is only used by the thread, which registers the
+        # readers in it before it waits
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._wake_read, selectors.EVENT_READ)
+
+    @classmethod
+    def shared(cls) -> Scheduler:
+        """
+        Get the process wide scheduler, which is used by the Configparser.
+
+        The shared scheduler is shut down when the interpreter exits.
+
+        Returns
+        -------
+        The shared Scheduler.
+        """
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared._closed:
+                cls._shared = cls()
+                atexit.register(cls._shared.shutdown)
+            return cls._shared
+
+    def register(
+        self,
+        callback: Callable[[], object],
+        delay: float = 0.0,
+        interval: float | None = None,
+        run_at_shutdown: bool = False,
+    ) -> Task:
+        """
+        Register a task.
+
+        Parameters
+        ----------
+        callback: The callable to run.
+        delay: The time in seconds until the first run. Defaults to 0.
+        interval: The time in seconds between the runs of a periodic
+            task. Defaults to None, which runs the task once.
+        run_at_shutdown: Run the task at the shutdown of the scheduler if
+            it is still pending, e.g. to write pending changes. Defaults
+            to False.
+
+        Returns
+        -------
+        The task, which is passed to unregister.
+
+        Raises
+        ------
+        RuntimeError: If the scheduler is shut down.
+        """
+        task = Task(
+            callback, time.monotonic() + delay, interval, run_at_shutdown
+        )
+        with self._lock:
+            self._check_open()
+            self._push(task)
+            self._start()
+        self._wake()
+        return task
+
+    def unregister(self, task: Task):
+        """
+        Unregister a task, so it does not run anymore.
+
+        Parameters
+        ----------
+        task: The task returned by register.
+        """
+        with self._lock:
+            if not task.cancelled:
+                task.cancelled = True
+                self._tasks -= 1
+
+    def add_reader(self, fd: int, callback: Callable[[], object]):
+        """
+        Call a callback whenever a file descriptor is readable.
+
+        Parameters
+        ----------
+        fd: The file descriptor.
+        callback: The callable to call, which must read the pending data.
+
+        Raises
+        ------
+        RuntimeError: If the scheduler is shut down.
+        """
+        with self._lock:
+            self._check_open()
+            self._readers[fd] = callback
+            self._start()
+        self._wake()
+
+    def remove_reader(self, fd: int):
+        """
+        Stop watching a file descriptor.
+
+        Parameters
+        ----------
+        fd: The file descriptor.
+        """
+        with self._lock:
+            self._readers.pop(fd, None)
+        self._wake()
+
+    def metrics(self) -> dict[str, float]:
+        """
+        Get the metrics of the scheduler.
+
+        Returns
+        -------
+        A dictionary with the number of pending tasks (`queue_depth`),
+        file descriptors (`readers`) and runs of tasks (`runs`), and the
+        last, mean and maximum lag of the runs behind their deadline in
+        seconds (`lag_last`, `lag_mean`, `lag_max`).
+        """
+        with self._lock:
+            return {
+                "queue_depth": self._tasks,
+                "readers": len(self._readers),
+                "runs": self._runs,
+                "lag_last": self._lag_last,
+                "lag_mean": self._lag_total / self._runs
+                if self._runs
+                else 0.0,
+                "lag_max": self._lag_max,
+            }
+
+    def shutdown(self):
+        """
+        Stop the scheduler.
+
+        Pending tasks registered with `run_at_shutdown` are run before the
+        method returns, all other tasks are dropped. The method is called
+        when the interpreter exits for the shared scheduler.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        self._wake()
+        if thread is not None and thread is not current_thread():
+            thread.join()
+        with self._lock:
+            pending = sorted(self._heap)
+            self._heap.clear()
+            self._tasks = 0
+            self._readers.clear()
+        for _, _, task in pending:
+            if task.run_at_shutdown and not task.cancelled:
+                task.cancelled = True
+                self._run(task)
+        self._selector.close()
+        os.close(self._wake_read)
+        os.close(self._wake_write)
+
+    def _check_open(self):
+        """Raise an error if the scheduler is shut down."""
+        if self._closed:
+            raise RuntimeError("The scheduler is shut down.")
+
+    def _push(self, task: Task):
+        """Push a task on the heap."""
+        heapq.heappush(self._heap, (task.deadline, next(self._sequence), task))
+        self._tasks += 1
+
+    def _start(self):
+        """Start the thread of the scheduler if it is not running."""
+        if self._thread is None:
+            self._thread = Thread(
+                target=self._loop, name="ConfigScheduler", daemon=True
+            )
+            self._thread.start()
+
+    def _wake(self):
+        """Wake the thread of the scheduler up."""
+        try:
+            os.write(self._wake_write, b"\0")
+        except OSError:
+            # The pipe is full, the thread is woken up anyway
+            pass
+
+    def _loop(self):
+        """Run the due tasks and wait for the next deadline or reader."""
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                due = self._pop_due(time.monotonic())
+                timeout = (
+                    max(0.0, self._heap[0][0] - time.monotonic())
+                    if self._heap
+                    else None
+                )
+                readers = dict(self._readers)
+            for task in due:
+                self._run(task)
+            if due:
+                # The tasks may have taken time, check the deadlines again
+                continue
+            self._update_selector(readers)
+            for key, _ in self._selector.select(timeout):
+                fd = key.fd
+                if fd == self._wake_read:
+                    self._drain()
+                    continue
+                callback = readers.get(fd)
+                if callback is None:
+                    continue
+                try:
+                    callback()
+                except Exception:
+                    logger.exception("Scheduler reader %s failed.", fd)
+
+    def _update_selector(self, readers: dict[int, Callable[[], object]]):
+        """
+        Register the added readers in the selector and remove the others.
+
+        A file descriptor which cannot be registered, e.g. because it was
+        closed, is logged and removed from the readers.
+        """
+        selector = self._selector
+        for fd, key in list(selector.get_map().items()):
+            # A reader added again may use a new file with the same number
+            if fd != self._wake_read and readers.get(fd) is not key.data:
+                selector.unregister(fd)
+        registered = selector.get_map()
+        for fd, callback in list(readers.items()):
+            if fd in registered:
+                continue
+            try:
+                selector.register(fd, selectors.EVENT_READ, callback)
+            except (OSError, ValueError):
+                logger.exception("Scheduler reader %s cannot be watched.", fd)
+                del readers[fd]
+                with self._lock:
+                    if self._readers.get(fd) is callback:
+                        del self._readers[fd]
+
+    def _pop_due(self, now: float) -> list[Task]:
+        """Pop the due tasks and push periodic tasks again."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, task = heapq.heappop(self._heap)
+            if task.cancelled:
+                continue
+            lag = now - task.deadline
+            self._runs += 1
+            self._lag_total += lag
+            self._lag_last = lag
+            self._lag_max = max(self._lag_max, lag)
+            self._tasks -= 1
+            if task.interval is not None:
+                task.deadline = max(task.deadline + task.interval, now)
+                self._push(task)
+            else:
+                task.cancelled = True
+            due.append(task)
+        return due
+
+    def _run(self, task: Task):
+        """Run a task and log its errors."""
+        try:
+            task.callback()
+        except Exception:
+            logger.exception("Scheduler task %r failed.", task.callback)
+
+    def _drain(self):
+        """Read the wake up bytes."""
+        try:
+            while os.read(self._wake_read, 1024):
+                pass
+        except BlockingIOError:
+            pass
+
+
+__all__ = ["Scheduler", "Task"]
@@ -0,0 +1,407 @@
+"""
+Watch configuration files for changes.
+
+The FileWatcher calls a callback when a watched file changed. On Linux it
+waits for inotify events of the directory of the file, so a change is
+noticed within milliseconds and an idle file costs no CPU. Watching the
+directory instead of the file also covers editors and writers which save
+by writing a temporary file and renaming it over the watched file. On
+other platforms, or if the directory can not be watched, the files are
+polled by comparing their inode, size and modification time.
+
+Events are debounced: the callback is called once the file was quiet for
+the debounce time, and only if the file exists and its inode, size or
+modification time differs from the last call, so the burst of events of
+one save results in one call.
+
+Example:
+    ``` python
+    from simple_config_builder.watcher import FileWatcher
+
+    watcher = FileWatcher(debounce=0.05)
+    watch_id = watcher.watch("config.yaml", lambda path: print(path))
+    ...
+    watcher.unwatch(watch_id)
+    ```
+"""
+
+from __future__ import annotations
+
+import ctypes
+import logging
+import os
+import struct
+import time
+from collections.abc import Callable
+from functools import partial
+from itertools import count
+from threading import Lock
+
+from simple_config_builder.scheduler import Scheduler, Task
+
+logger = logging.getLogger(__name__)
+
+# inotify constants, see inotify(7)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_IN_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+_EVENT = struct.Struct("iIII")
+
+Signature = tuple[int, int, int] | None
+
+
+def _signature(path: str) -> Signature:
+    """Get the inode, size and modification time of a file."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class _Inotify:
+    """Minimal ctypes binding of the inotify API of the C library."""
+
+    def __init__(self):
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    def add_watch(self, directory: str) -> int:
+        """Watch a directory and return the watch descriptor."""
+        wd = self._add_watch(self.fd, os.fsencode(directory), _IN_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), directory)
+        return wd
+
+    def rm_watch(self, wd: int):
+        """Stop watching a directory."""
+        self._rm_watch(self.fd, wd)
+
+    def read(self) -> list[tuple[int, int, str]]:
+        """Read the pending events as (wd, mask, name) tuples."""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                events.append((wd, mask, os.fsdecode(name)))
+
+    def close(self):
+        """Close the inotify instance."""
+        os.close(self.fd)
+
+
+class _Watch:
+    """A watched file."""
+
+    __slots__ = (
+        "callback",
+        "deadline",
+        "directory",
+        "name",
+        "path",
+        "signature",
+        "task",
+        "wd",
+    )
+
+    def __init__(self, path: str, callback: Callable[[str], None]):
+        self.path = os.path.abspath(path)
+        self.directory, self.name = os.path.split(self.path)
+        self.callback = callback
+        self.signature = _signature(self.path)
+        self.deadline = 0.0
+        self.task: Task | None = None
+        self.wd: int | None = None
+
+
+class FileWatcher:
+    """
+    Watch files and call a callback when they changed.
+
+    The watcher has no thread of its own, the inotify events, debounce
+    timers and polls are tasks of a Scheduler.
+    """
+
+    debounce: float
+    poll_interval: float
+    backend: str
+    scheduler: Scheduler
+
+    _shared: FileWatcher | None = None
+    _shared_lock = Lock()
+
+    def __init__(
+        self,
+        debounce: float = 0.05,
+        poll_interval: float = 0.5,
+        backend: str | None = None,
+        scheduler: Scheduler | None = None,
+    ):
+        """
+        Initialize the watcher.
+
+        Parameters
+        ----------
+        debounce: The time in seconds a file must be quiet before the
+            callback is called. Defaults to 0.05.
+        poll_interval: The interval in seconds in which polled files are
+            checked. Defaults to 0.5.
+        backend: "inotify" or "polling". Defaults to None, which uses
+            inotify if it is available.
+        scheduler: The scheduler to run on. Defaults to None, which uses
+            the shared Scheduler.
+
+        Raises
+        ------
+        ValueError: If the backend is unknown.
+        OSError: If the inotify backend is requested but not available.
+        """
+        if backend not in (None, "inotify", "polling"):
+            raise ValueError(f"Unknown file watcher backend {backend}.")
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.scheduler = scheduler or Scheduler.shared()
+        self._inotify: _Inotify | None = None
+        if backend != "polling":
+            try:
+                self._inotify = _Inotify()
+            except (AttributeError, OSError):
+                if backend == "inotify":
+                    raise
+        self.backend = "polling" if self._inotify is None else "inotify"
+        self._lock = Lock()
+        self._ids = count()
+        self._watches: dict[int, _Watch] = {}
+        self._directories: dict[str, int] = {}
+        self._wds: dict[int, str] = {}
+        self._reading = False
+        self._poll_task: Task | None = None
+        self._closed = False
+
+    @classmethod
+    def shared(cls) -> FileWatcher:
+        """
+        Get the process wide watcher, which is used by the Configparser.
+
+        Returns
+        -------
+        The shared FileWatcher.
+        """
+        with cls._shared_lock:
+            shared = cls._shared
+            if shared is not None and shared.scheduler is not (
+                Scheduler.shared()
+            ):
+                # The shared scheduler was shut down
+                shared.close()
+            if shared is None or shared._closed:
+                cls._shared = cls()
+            return cls._shared
+
+    def watch(self, path: str, callback: Callable[[str], None]) -> int:
+        """
+        Watch a file.
+
+        The file does not need to exist. The callback is called with the
+        path in the thread of the scheduler, so it should return quickly.
+
+        Parameters
+        ----------
+        path: The file path.
+        callback: The callable to call with the path after a change.
+
+        Returns
+        -------
+        The id of the watch, which is passed to unwatch.
+
+        Raises
+        ------
+        RuntimeError: If the watcher is closed.
+        """
+        watch = _Watch(path, callback)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The file watcher is closed.")
+            watch_id = next(self._ids)
+            self._watches[watch_id] = watch
+            self._add_watch(watch)
+            self._update_tasks()
+        return watch_id
+
+    def unwatch(self, watch_id: int):
+        """
+        Stop watching a file.
+
+        Unknown ids are ignored.
+
+        Parameters
+        ----------
+        watch_id: The id returned by watch.
+        """
+        with self._lock:
+            watch = self._watches.pop(watch_id, None)
+            if watch is None:
+                return
+            if watch.task is not None:
+                self.scheduler.unregister(watch.task)
+            if watch.wd is not None and not any(
+                other.wd == watch.wd for other in self._watches.values()
+            ):
+                del self._directories[watch.directory]
+                del self._wds[watch.wd]
+                if self._inotify is not None:
+                    self._inotify.rm_watch(watch.wd)
+            self._update_tasks()
+
+    def close(self):
+        """Stop watching all files and release the watcher resources."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for watch_id in list(self._watches):
+            self.unwatch(watch_id)
+        if self._inotify is not None:
+            self._inotify.close()
+
+    def _add_watch(self, watch: _Watch):
+        """Watch the directory of a file, if inotify is available."""
+        if self._inotify is None:
+            return
+        wd = self._directories.get(watch.directory)
+        if wd is None:
+            try:
+                wd = self._inotify.add_watch(watch.directory)
+            except OSError:
+                # E.g. the directory does not exist, the file is polled
+                return
+            self._directories[watch.directory] = wd
+            self._wds[wd] = watch.directory
+        watch.wd = wd
+
+    def _update_tasks(self):
+        """Register or unregister the inotify reader and the poll task."""
+        reading = any(watch.wd is not None for watch in self._watches.values())
+        if self._inotify is not None and reading != self._reading:
+            if reading:
+                self.scheduler.add_reader(self._inotify.fd, self._read)
+            else:
+                self.scheduler.remove_reader(self._inotify.fd)
+            self._reading = reading
+        polling = any(watch.wd is None for watch in self._watches.values())
+        if polling and self._poll_task is None:
+            self._poll_task = self.scheduler.register(
+                self._poll, self.poll_interval, self.poll_interval
+            )
+        elif not polling and self._poll_task is not None:
+            self.scheduler.unregister(self._poll_task)
+            self._poll_task = None
+
+    def _debounce(self, watch: _Watch):
+        """Check the file of a watch once it was quiet for the debounce."""
+        watch.deadline = time.monotonic() + self.debounce
+        if watch.task is None:
+            watch.task = self.scheduler.register(
+                partial(self._check, watch), self.debounce
+            )
+
+    def _read(self):
+        """Debounce the watches of the files of inotify events."""
+        assert self._inotify is not None
+        events = self._inotify.read()
+        with self._lock:
+            for wd, mask, name in events:
+                if mask & _IN_Q_OVERFLOW:
+                    # Events were lost, every file may have changed
+                    for watch in self._watches.values():
+                        self._debounce(watch)
+                    continue
+                if mask & _IN_IGNORED:
+                    # The directory was removed, its files are polled
+                    directory = self._wds.pop(wd, None)
+                    self._directories.pop(directory, None)
+                    for watch in self._watches.values():
+                        if watch.wd == wd:
+                            watch.wd = None
+                    self._update_tasks()
+                    continue
+                for watch in self._watches.values():
+                    if watch.wd == wd and watch.name == name:
+                        self._debounce(watch)
+
+    def _poll(self):
+        """Debounce the polled files which changed."""
+        with self._lock:
+            for watch in self._watches.values():
+                if watch.wd is not None:
+                    continue
+                if watch.directory not in self._directories:
+                    # Watch the directory with inotify once it exists
+                    self._add_watch(watch)
+                if (
+                    watch.task is None
+                    and _signature(watch.path) != watch.signature
+                ):
+                    self._debounce(watch)
+            self._update_tasks()
+
+    def _check(self, watch: _Watch):
+        """Call the callback of a debounced watch if the file changed."""
+        with self._lock:
+            watch.task = None
+            remaining = watch.deadline - time.monotonic()
+            if remaining > 0:
+                # Events arrived meanwhile, wait until the file is quiet
+                watch.task = self.scheduler.register(
+                    partial(self._check, watch), remaining
+                )
+                return
+            signature = _signature(watch.path)
+            # A removed file is not reported, e.g. it is replaced next
+            if signature is None or signature == watch.signature:
+                return
+            watch.signature = signature
+        try:
+            watch.callback(watch.path)
+        except Exception:
+            logger.exception("File watcher callback of %s failed.", watch.path)
+
+
+__all__ = ["FileWatcher"]
@@ -59,6 +59,12 @@ class ApiTest(TestCase):
         )
         assert response.status_code == 200
         assert response.json()["config"] is not None
+        # The private state of the configparser is not serialized
+        assert not [
+            name
+            for name in response.json()["config"]
+            if name.startswith("_")
+        ]
 
     def test_get_config_classes(self):
         """Test the get-config-classes API route."""
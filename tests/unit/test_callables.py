@@ -0,0 +1,134 @@
+"""Tests for the callables module."""
+
+import os
+import tempfile
+from unittest import TestCase
+
+from simple_config_builder.callables import CallableCache, LazyCallable
+
+
+class TestCallableCache(TestCase):
+    """Test the CallableCache class."""
+
+    def setUp(self):
+        """Create a python file with two functions and clear the cache."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "functions.py")
+        with open(self.file_path, "w") as f:
+            f.write("def first():\n    return 1\n\n")
+            f.write("def second():\n    return 2\n")
+        CallableCache.invalidate()
+        CallableCache.reset_stats()
+
+    def tearDown(self):
+        """Remove the python file."""
+        CallableCache.invalidate()
+        self.directory.cleanup()
+
+    def test_file_is_executed_once(self):
+        """Test that callables from one file share one module."""
+        first = CallableCache.resolve("functions", "first", self.file_path)
+        second = CallableCache.resolve("functions", "second", self.file_path)
+        self.assertEqual(first(), 1)
+        self.assertEqual(second(), 2)
+        self.assertIs(first.__globals__, second.__globals__)
+        self.assertIs(
+            CallableCache.resolve("functions", "first", self.file_path),
+            first,
+        )
+        stats = CallableCache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["modules"], 1)
+
+    def test_modified_file_is_executed_again(self):
+        """Test that a modified file is executed again."""
+        first = CallableCache.resolve("functions", "first", self.file_path)
+        with open(self.file_path, "w") as f:
+            f.write("def first():\n    return 3\n")
+        stat = os.stat(self.file_path)
+        os.utime(
+            self.file_path,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+        )
+        reloaded = CallableCache.resolve("functions", "first", self.file_path)
+        self.assertIsNot(first, reloaded)
+        self.assertEqual(reloaded(), 3)
+
+    def test_invalidate_and_maxsize(self):
+        """Test invalidating entries and limiting the cache size."""
+        CallableCache.resolve("functions", "first", self.file_path)
+        CallableCache.resolve("os.path", "join")
+        CallableCache.invalidate(file_path=self.file_path)
+        stats = CallableCache.stats()
+        self.assertEqual(stats["callables"], 1)
+        self.assertEqual(stats["modules"], 0)
+
+        maxsize = stats["maxsize"]
+        try:
+            CallableCache.set_maxsize(1)
+            CallableCache.resolve("os.path", "exists")
+            self.assertEqual(CallableCache.stats()["callables"], 1)
+            with self.assertRaises(ValueError):
+                CallableCache.set_maxsize(0)
+        finally:
+            CallableCache.set_maxsize(maxsize)
+
+
+class TestLazyCallable(TestCase):
+    """Test the LazyCallable class."""
+
+    def test_resolve_on_call(self):
+        """Test that the proxy resolves the callable on the first call."""
+        func = LazyCallable("os.path", "join")
+        self.assertFalse(func.resolved)
+        self.assertEqual(func("a", "b"), os.path.join("a", "b"))
+        self.assertTrue(func.resolved)
+
+    def test_resolve_on_attribute_access(self):
+        """Test that the proxy forwards attribute access."""
+        func = LazyCallable("os.path", "join")
+        self.assertEqual(func.__name__, "join")
+        self.assertTrue(func.resolved)
+
+    def test_serialize_without_resolving(self):
+        """Test that serializing the proxy does not import the module."""
+        func = LazyCallable("module_that_does_not_exist", "func")
+        self.assertEqual(
+            func.serialize(),
+            {
+                "type": "callable",
+                "module": "module_that_does_not_exist",
+                "name": "func",
+                "file_path": "",
+            },
+        )
+        self.assertFalse(func.resolved)
+        self.assertEqual(
+            func, LazyCallable("module_that_does_not_exist", "func")
+        )
+        with self.assertRaises(ImportError):
+            func()
+
+    def test_compare_without_resolving(self):
+        """Test that comparisons resolve only matching callables."""
+        func = LazyCallable("module_that_does_not_exist", "func")
+        self.assertNotEqual(func, "func")
+        self.assertNotEqual(func, os.path.join)
+        self.assertNotEqual(func, None)
+        self.assertFalse(func.resolved)
+
+        func = LazyCallable(os.path.join.__module__, "join")
+        self.assertNotEqual(func, os.path.split)
+        self.assertFalse(func.resolved)
+        self.assertEqual(func, os.path.join)
+        self.assertTrue(func.resolved)
+
+    def test_hash_of_equal_callables(self):
+        """Test that a proxy hashes like the callable it equals."""
+        func = LazyCallable(os.path.join.__module__, "join")
+        self.assertEqual(hash(func), hash(os.path.join))
+        self.assertIn(os.path.join, {func})
+        self.assertIn(func, {os.path.join: 1})
+        other = LazyCallable(os.path.join.__module__, "join")
+        self.assertEqual(len({func, other, os.path.join}), 1)
@@ -81,6 +81,52 @@ class TestConfig(TestCase):
 
         self.assertFalse(ConfigClassRegistry.is_registered(E))
 
+    def test_config_class_registry_get_by_alias_and_short_name(self):
+        """Test resolving registered classes by alias and short name."""
+
+        class RegistryAliasClass(Configclass, aliases=("registry_alias",)):
+            value1: int = 1
+
+        self.assertIs(
+            ConfigClassRegistry.get("registry_alias"), RegistryAliasClass
+        )
+        self.assertIs(
+            ConfigClassRegistry.get("RegistryAliasClass"), RegistryAliasClass
+        )
+        self.assertIs(
+            ConfigClassRegistry.get(
+                ConfigClassRegistry.get_class_str_from_class(
+                    RegistryAliasClass
+                )
+            ),
+            RegistryAliasClass,
+        )
+        with self.assertRaises(ValueError):
+            ConfigClassRegistry.get("registry_alias_not_registered")
+
+        with self.assertRaises(ValueError):
+
+            class OtherAliasClass(Configclass, aliases=("registry_alias",)):
+                pass
+
+    def test_config_class_registry_get_class_attributes(self):
+        """Test that the class attributes are returned from the registry."""
+
+        class RegistryAttributesClass(Configclass):
+            value1: int = 1
+            value2: str = "a"
+
+        class_str = ConfigClassRegistry.get_class_str_from_class(
+            RegistryAttributesClass
+        )
+        attributes = ConfigClassRegistry.get_class_attributes(class_str)
+        self.assertEqual(attributes, {"value1": int, "value2": str})
+        attributes["value3"] = float
+        self.assertEqual(
+            ConfigClassRegistry.get_class_attributes(class_str),
+            {"value1": int, "value2": str},
+        )
+
     def test_config_class_decorator(self):
         """Test the configclass decorator."""
 
@@ -257,6 +303,108 @@ class TestConfig(TestCase):
         n = OClass.model_validate_json(json)
         self.assertEqual(func.__code__, n.func1.__code__)
 
+    def test_lazy_callables(self):
+        """Test that callables are resolved on first use in lazy mode."""
+        from simple_config_builder.callables import LazyCallable
+
+        class LazyCallableClass(Configclass):
+            func1: Callable
+            funcs: list[Callable]
+
+        serialized = {
+            "type": "callable",
+            "module": "module_that_does_not_exist",
+            "name": "func",
+            "file_path": "",
+        }
+        n = LazyCallableClass.model_validate(
+            {"func1": dict(serialized), "funcs": [dict(serialized)]},
+            context={"lazy_callables": True},
+        )
+        self.assertIsInstance(n.func1, LazyCallable)
+        self.assertIsInstance(n.funcs[0], LazyCallable)
+        dumped = n.model_dump()
+        self.assertEqual(dumped["func1"], serialized)
+        self.assertEqual(dumped["funcs"], [serialized])
+        self.assertFalse(n.func1.resolved)
+        with self.assertRaises(ImportError):
+            n.func1()
+
+    def test_serialization_plan(self):
+        """Test that only fields which can hold callables are walked."""
+
+        class PlanInner(Configclass):
+            value1: int = 1
+
+        class PlanClass(Configclass):
+            number: int = 1
+            names: list[str] = Field(default_factory=lambda: ["a"])
+            inner: PlanInner = Field(default_factory=PlanInner)
+            func1: Callable | None = None
+            funcs: dict[str, Callable] = Field(default_factory=dict)
+            anything: list = Field(default_factory=list)
+
+        self.assertEqual(
+            PlanClass._callable_fields(), ("func1", "funcs", "anything")
+        )
+        self.assertEqual(PlanInner._callable_fields(), ())
+
+        c = PlanClass(func1=fun, anything=[fun, 1])
+        dumped = c.model_dump()
+        self.assertEqual(
+            dumped["inner"],
+            {"_config_class_type": c.inner._config_class_type, "value1": 1},
+        )
+        self.assertEqual(dumped["func1"]["type"], "callable")
+        self.assertEqual(dumped["anything"][0]["type"], "callable")
+        self.assertEqual(dumped["anything"][1], 1)
+        self.assertEqual(next(iter(dumped)), "_config_class_type")
+
+    def test_config_class_type_with_post_init(self):
+        """Test the class string of subclasses with own post init hooks."""
+        from pydantic import PrivateAttr
+
+        from simple_config_builder.config import AssignmentObservers
+
+        class PostInitClass(Configclass):
+            x: int = 1
+            _doubled: int = PrivateAttr(default=0)
+
+            def model_post_init(self, context, /):
+                super().model_post_init(context)
+                self._doubled = 2 * self.x
+
+        class PlainClass(Configclass):
+            x: int = 1
+
+        generation = AssignmentObservers.generation()
+        plain = PlainClass(x=2)
+        self.assertEqual(AssignmentObservers.generation(), generation)
+        self.assertEqual(plain._config_class_type, f"{__name__}.PlainClass")
+
+        c = PostInitClass(x=2)
+        self.assertEqual(c._config_class_type, f"{__name__}.PostInitClass")
+        self.assertEqual(c._doubled, 4)
+        self.assertEqual(
+            c.model_dump()["_config_class_type"], c._config_class_type
+        )
+
+    def test_no_callable_fields_skip_deserialization(self):
+        """Test that classes without callable fields skip the scan."""
+
+        class NoCallableClass(Configclass):
+            values: dict[str, dict[str, str]]
+
+        serialized = {
+            "type": "callable",
+            "module": "module_that_does_not_exist",
+            "name": "func",
+            "file_path": "",
+        }
+        self.assertEqual(NoCallableClass._callable_fields(), ())
+        c = NoCallableClass(values={"func": serialized})
+        self.assertEqual(c.values["func"], serialized)
+
     def test_literal(self):
         """Test if Literal works as expected."""
 
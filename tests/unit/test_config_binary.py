@@ -0,0 +1,128 @@
+"""Tests for the config_binary module."""
+
+import datetime
+import os
+import tempfile
+from unittest import TestCase
+
+from click.testing import CliRunner
+
+from simple_config_builder.cli import config as cli
+from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_binary import (
+    deserialize_binary,
+    serialize_binary,
+)
+from simple_config_builder.config_io import (
+    convert_config,
+    parse_config,
+    write_config,
+)
+from simple_config_builder.config_types import ConfigTypes
+from simple_config_builder.configparser import Configparser
+
+
+class _BinaryInner(Configclass):
+    """Inner class of the binary configurations."""
+
+    value: float = 1.5
+    labels: dict[str, str] = Field(default_factory=lambda: {"unit": "m"})
+
+
+class _BinaryConfig(Configclass):
+    """Binary configuration."""
+
+    name: str = "binary"
+    inners: list[_BinaryInner] = Field(
+        default_factory=lambda: [_BinaryInner(value=i) for i in range(10)]
+    )
+    shape: tuple[int, int] = (2, 3)
+
+
+class TestConfigBinary(TestCase):
+    """Test the binary configuration format."""
+
+    def setUp(self):
+        """Create a directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_round_trip_values(self):
+        """Test that the values are read with their types."""
+        data = {
+            "numbers": [0, -1, 2**70, -(2**70), 0.1, float("inf")],
+            "constants": [None, True, False],
+            "strings": ["", "ünïcødé ✓", "x" * 1000],
+            "bytes": b"\x00\xff",
+            "tuple": (1, ("nested",)),
+            "empty": [{}, [], ()],
+            1: datetime.date(2020, 1, 2),
+            "time": datetime.datetime(2020, 1, 2, 3, 4, 5),
+        }
+        self.assertEqual(deserialize_binary(serialize_binary(data)), data)
+
+    def test_string_table(self):
+        """Test that keys and configuration types are stored once."""
+        config_bytes = serialize_binary({"config": _BinaryConfig()})
+        self.assertEqual(config_bytes.count(b"labels"), 1)
+        self.assertEqual(config_bytes.count(b"_BinaryInner"), 1)
+        self.assertEqual(config_bytes.count(b"_config_class_type"), 0)
+        self.assertEqual(
+            deserialize_binary(config_bytes),
+            {"config": _BinaryConfig().model_dump()},
+        )
+
+    def test_deep_tree(self):
+        """Test that the depth is not limited by the recursion limit."""
+        root: list = []
+        node = root
+        for _ in range(5000):
+            node.append([])
+            node = node[0]
+        node = deserialize_binary(serialize_binary(root))
+        for _ in range(5000):
+            node = node[0]
+        self.assertEqual(node, [])
+
+    def test_invalid_content(self):
+        """Test the errors of content not in the binary format."""
+        config_bytes = serialize_binary({"key": ["value"]})
+        for content in (b"", b"{}", config_bytes[:-3], config_bytes + b"\0"):
+            with self.subTest(content=content), self.assertRaises(ValueError):
+                deserialize_binary(content)
+        with self.assertRaises(TypeError):
+            serialize_binary({"key": object()})
+
+    def test_configparser(self):
+        """Test a round trip through the Configparser."""
+        config_file = os.path.join(self.directory.name, "config.scb")
+        config = {"config": _BinaryConfig()}
+        Configparser.from_python(config, config_file).save()
+        parser = Configparser(config_file)
+        self.assertEqual(parser.config_type, ConfigTypes.BINARY)
+        self.assertEqual(parser.config_data, config)
+        self.assertEqual(parser.config_data["config"].shape, (2, 3))
+
+    def test_convert_yaml(self):
+        """Test the conversion of YAML files to and from the format."""
+        yaml_file = os.path.join(self.directory.name, "config.yaml")
+        binary_file = os.path.join(self.directory.name, "config.scb")
+        converted_file = os.path.join(self.directory.name, "converted.yml")
+        config = {"config": _BinaryConfig()}
+        write_config(yaml_file, config, ConfigTypes.YAML)
+
+        convert_config(yaml_file, binary_file)
+        self.assertLess(
+            os.path.getsize(binary_file), os.path.getsize(yaml_file)
+        )
+        self.assertEqual(parse_config(binary_file, ConfigTypes.BINARY), config)
+
+        result = CliRunner().invoke(
+            cli, ["convert", binary_file, converted_file]
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        with open(yaml_file) as f, open(converted_file) as g:
+            self.assertEqual(f.read(), g.read())
+
+        result = CliRunner().invoke(cli, ["convert", yaml_file, "config.ini"])
+        self.assertNotEqual(result.exit_code, 0)
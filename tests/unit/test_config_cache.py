@@ -0,0 +1,163 @@
+"""Tests for the config_cache module."""
+
+import importlib
+import os
+import sys
+import tempfile
+from unittest import TestCase
+
+from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_cache import ConfigCache
+from simple_config_builder.config_io import parse_config, write_config
+from simple_config_builder.config_types import ConfigTypes
+from simple_config_builder.configparser import Configparser
+
+
+class CachedInner(Configclass):
+    """Inner class of the cached configurations."""
+
+    value: int = 1
+
+
+class CachedConfig(Configclass):
+    """Cached configuration."""
+
+    name: str = "cached"
+    inners: list[CachedInner] = Field(default_factory=list)
+
+
+class TestConfigCache(TestCase):
+    """Test the ConfigCache class."""
+
+    def setUp(self):
+        """Write a configuration file and create an empty cache."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.config_file = os.path.join(self.directory.name, "config.yaml")
+        self.cache = ConfigCache(os.path.join(self.directory.name, "cache"))
+        self.config = CachedConfig(inners=[CachedInner(), CachedInner()])
+        write_config(self.config_file, self.config, ConfigTypes.YAML)
+
+    def test_hit_after_miss(self):
+        """Test that an unchanged file is loaded from the cache."""
+        first = parse_config(
+            self.config_file, ConfigTypes.YAML, cache=self.cache
+        )
+        second = parse_config(
+            self.config_file, ConfigTypes.YAML, cache=self.cache
+        )
+        self.assertEqual(first, self.config)
+        self.assertEqual(second, self.config)
+        self.assertIsNot(first, second)
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["entries"], 1)
+
+        configparser = Configparser(self.config_file, cache=self.cache)
+        self.assertEqual(configparser.config_data, self.config)
+        self.assertEqual(self.cache.stats()["hits"], 2)
+
+    def test_changed_file_is_parsed_again(self):
+        """Test that a changed file replaces its stale entry."""
+        parse_config(self.config_file, ConfigTypes.YAML, cache=self.cache)
+        changed = CachedConfig(name="changed")
+        write_config(self.config_file, changed, ConfigTypes.YAML)
+        stat = os.stat(self.config_file)
+        os.utime(
+            self.config_file,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+        )
+        config = parse_config(
+            self.config_file, ConfigTypes.YAML, cache=self.cache
+        )
+        self.assertEqual(config, changed)
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (0, 2))
+        self.assertEqual(stats["entries"], 1)
+
+    def test_eviction_and_unstorable_results(self):
+        """Test the size bound and results which can not be stored."""
+        key = self.cache.key(self.config_file, ConfigTypes.YAML)
+        self.assertTrue(self.cache.store(key, self.config))
+        size = self.cache.stats()["size"]
+
+        cache = ConfigCache(self.cache.directory, max_size=size)
+        other_file = os.path.join(self.directory.name, "other.yaml")
+        write_config(other_file, CachedConfig(), ConfigTypes.YAML)
+        other_key = cache.key(other_file, ConfigTypes.YAML)
+        self.assertTrue(cache.store(other_key, self.config))
+        self.assertEqual(cache.stats()["entries"], 1)
+        self.assertEqual(cache.load(other_key)[0], True)
+        self.assertEqual(cache.load(key), (False, None))
+
+        self.assertFalse(cache.store(key, {"values": {1, 2}}))
+        self.assertIsNone(
+            cache.key(
+                os.path.join(self.directory.name, "missing.yaml"),
+                ConfigTypes.YAML,
+            )
+        )
+
+    def test_key_of_the_parsed_content(self):
+        """Test that entries are keyed by the content they are parsed from."""
+        key = self.cache.key(self.config_file, ConfigTypes.YAML)
+        with open(self.config_file, "rb") as f:
+            content = f.read()
+        self.assertEqual(
+            self.cache.key(
+                self.config_file, ConfigTypes.YAML, content=content
+            ),
+            key,
+        )
+        self.assertNotEqual(
+            self.cache.key(
+                self.config_file, ConfigTypes.YAML, content=content + b"\n"
+            ),
+            key,
+        )
+
+        # Damaged entries are misses
+        self.assertTrue(self.cache.store(key, self.config))
+        with open(self.cache._entry_file(key), "r+b") as f:
+            f.truncate(f.seek(0, os.SEEK_END) - 1)
+        self.assertEqual(self.cache.load(key), (False, None))
+        self.assertEqual(
+            parse_config(self.config_file, ConfigTypes.YAML, cache=self.cache),
+            self.config,
+        )
+
+    def test_entries_in_the_binary_format(self):
+        """Test that entries are stored in the binary format, not pickled."""
+        parse_config(self.config_file, ConfigTypes.YAML, cache=self.cache)
+        key = self.cache.key(self.config_file, ConfigTypes.YAML)
+        with open(self.cache._entry_file(key), "rb") as f:
+            self.assertIn(b"SCFG", f.read(16))
+        found, config_data = self.cache.load(key)
+        self.assertTrue(found)
+        self.assertEqual(config_data["inners"][0]["value"], 1)
+
+    def test_key_of_the_class_sources(self):
+        """Test that a changed module of a class changes the keys."""
+        module_file = os.path.join(self.directory.name, "cached_module.py")
+        sys.path.insert(0, self.directory.name)
+        self.addCleanup(sys.path.remove, self.directory.name)
+        self.addCleanup(sys.modules.pop, "cached_module", None)
+        with open(module_file, "w") as f:
+            f.write(_MODULE.format(limit=1))
+        module = importlib.import_module("cached_module")
+        key = self.cache.key(self.config_file, ConfigTypes.YAML)
+        with open(module_file, "w") as f:
+            f.write(_MODULE.format(limit=22))
+        importlib.reload(module)
+        self.assertNotEqual(
+            self.cache.key(self.config_file, ConfigTypes.YAML), key
+        )
+
+
+_MODULE = """
+from simple_config_builder.config import Configclass
+
+
+class CachedModuleConfig(Configclass):
+    limit: int = {limit}
+"""
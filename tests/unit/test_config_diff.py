@@ -0,0 +1,128 @@
+"""Tests for the config_diff module."""
+
+import os
+import tempfile
+from unittest import TestCase
+
+from click.testing import CliRunner
+
+from simple_config_builder.cli import config as cli
+from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_diff import MISSING, Change, diff_configs
+from simple_config_builder.config_io import write_config
+from simple_config_builder.config_types import ConfigTypes
+from simple_config_builder.configparser import Configparser
+
+
+class _Pool(Configclass):
+    """Pool of the diff configurations."""
+
+    timeout: int = 5
+    hosts: list[str] = Field(default_factory=lambda: ["a", "b"])
+
+
+class _OtherPool(Configclass):
+    """Pool of another class."""
+
+    timeout: int = 5
+    hosts: list[str] = Field(default_factory=lambda: ["a", "b"])
+
+
+class _Database(Configclass):
+    """Database of the diff configurations."""
+
+    name: str = "db"
+    pools: list[_Pool] = Field(default_factory=lambda: [_Pool(), _Pool()])
+    options: dict[str, int] = Field(default_factory=lambda: {"a": 1, "b": 2})
+
+
+class TestDiffConfigs(TestCase):
+    """Test the diff_configs function."""
+
+    def test_changes(self):
+        """Test the changes in the order of the data."""
+        old = {"db": _Database(), "removed": 1, "flag": 1}
+        new = {
+            "db": _Database(
+                pools=[_Pool(), _Pool(timeout=6, hosts=["a"]), _Pool()],
+                options={"b": 2, "c": 3},
+            ),
+            "flag": True,
+            "added": (1,),
+        }
+        added_pool = new["db"].pools[2]
+        self.assertEqual(
+            diff_configs(old, new),
+            [
+                Change("db.pools[1].timeout", 5, 6),
+                Change("db.pools[1].hosts[1]", "b", MISSING),
+                Change("db.pools[2]", MISSING, added_pool),
+                Change("db.options.a", 1, MISSING),
+                Change("db.options.c", MISSING, 3),
+                Change("removed", 1, MISSING),
+                Change("flag", 1, True),
+                Change("added", MISSING, (1,)),
+            ],
+        )
+        self.assertEqual(diff_configs(old, old), [])
+        self.assertEqual(diff_configs(_Database(), _Database()), [])
+        self.assertEqual(
+            diff_configs([_Pool()], [_OtherPool()]),
+            [Change("[0]", _Pool(), _OtherPool())],
+        )
+        self.assertEqual(diff_configs(1, 2), [Change("", 1, 2)])
+
+    def test_mutated_subtrees(self):
+        """Test that assigned and mutated subtrees are compared."""
+        database = _Database()
+        other = _Database()
+        self.assertEqual(diff_configs(other, database), [])
+        database.pools[0].timeout = 6
+        database.pools[1].hosts.append("c")
+        database.options["a"] = 3
+        self.assertEqual(
+            diff_configs(other, database),
+            [
+                Change("pools[0].timeout", 5, 6),
+                Change("pools[1].hosts[2]", MISSING, "c"),
+                Change("options.a", 1, 3),
+            ],
+        )
+
+    def test_reload(self):
+        """Test that a reload returns the changes."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = os.path.join(directory, "config.json")
+            parser = Configparser.from_python({"db": _Database()}, config_file)
+            parser.save()
+            self.assertEqual(parser.reload(), [])
+            write_config(
+                config_file,
+                {"db": _Database(name="changed")},
+                ConfigTypes.JSON,
+            )
+            self.assertEqual(
+                parser.reload(), [Change("db.name", "db", "changed")]
+            )
+
+    def test_cli(self):
+        """Test the diff command of files of different formats."""
+        with tempfile.TemporaryDirectory() as directory:
+            old_file = os.path.join(directory, "old.yaml")
+            new_file = os.path.join(directory, "new.json")
+            write_config(old_file, {"db": _Database()}, ConfigTypes.YAML)
+            write_config(new_file, {"db": _Database()}, ConfigTypes.JSON)
+            result = CliRunner().invoke(cli, ["diff", old_file, new_file])
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertNotIn("db", result.output)
+
+            write_config(
+                new_file,
+                {"db": _Database(options={"a": 2, "b": 2}), "new": [1]},
+                ConfigTypes.JSON,
+            )
+            result = CliRunner().invoke(cli, ["diff", old_file, new_file])
+            self.assertEqual(result.exit_code, 1, result.output)
+            self.assertTrue(
+                result.output.endswith("~ db.options.a: 1 -> 2\n+ new: [1]\n")
+            )
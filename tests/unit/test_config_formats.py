@@ -0,0 +1,168 @@
+"""Tests for the config_formats module."""
+
+import importlib.util
+import json
+import os
+import tempfile
+from typing import Any
+from unittest import TestCase, skipUnless
+
+from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_formats import ConfigFormat, FormatRegistry
+from simple_config_builder.config_io import (
+    JsonFormat,
+    OrjsonFormat,
+    TomlFormat,
+    parse_config,
+    write_config,
+)
+from simple_config_builder.config_types import ConfigTypes
+from simple_config_builder.configparser import Configparser
+
+
+class _FormatInner(Configclass):
+    """Inner class of the format configurations."""
+
+    value: float = 1.5
+
+
+class _FormatConfig(Configclass):
+    """Format configuration."""
+
+    name: str = "formats"
+    inners: list[_FormatInner] = Field(
+        default_factory=lambda: [_FormatInner(), _FormatInner(value=2)]
+    )
+
+
+class _UppercaseJsonFormat(ConfigFormat):
+    """JSON format writing upper case JSON keys, for the tests."""
+
+    config_type = ConfigTypes.JSON
+    extensions = (".json",)
+    priority = 100
+    streaming = True
+    bytes_io = False
+
+    def load(self, f) -> Any:
+        return {key.lower(): value for key, value in json.load(f).items()}
+
+    def dump(self, config_data, f, compact=False):
+        f.write(json.dumps({key.upper(): 1 for key in config_data}).encode())
+
+
+class _MissingFormat(ConfigFormat):
+    """Format of a package which is not installed."""
+
+    config_type = ConfigTypes.MSGPACK
+    priority = 100
+
+    @classmethod
+    def available(cls) -> bool:
+        return False
+
+
+class TestFormatRegistry(TestCase):
+    """Test the FormatRegistry class."""
+
+    def setUp(self):
+        """Create a directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_config_type_of(self):
+        """Test the lookup of the configuration type by extension."""
+        for extension, config_type in [
+            (".json", ConfigTypes.JSON),
+            (".yaml", ConfigTypes.YAML),
+            (".yml", ConfigTypes.YAML),
+            (".toml", ConfigTypes.TOML),
+            (".msgpack", ConfigTypes.MSGPACK),
+        ]:
+            self.assertEqual(
+                FormatRegistry.config_type_of(f"dir.d/config{extension}"),
+                config_type,
+            )
+        with self.assertRaises(ValueError):
+            FormatRegistry.config_type_of("config.ini")
+
+    def test_builtin_formats(self):
+        """Test the built-in formats in use."""
+        self.assertIsInstance(
+            FormatRegistry.get(ConfigTypes.JSON),
+            OrjsonFormat if OrjsonFormat.available() else JsonFormat,
+        )
+        self.assertIsInstance(FormatRegistry.get(ConfigTypes.TOML), TomlFormat)
+        config_file = os.path.join(self.directory.name, "config.toml")
+        write_config(
+            config_file, {"config": _FormatConfig()}, ConfigTypes.TOML
+        )
+        self.assertEqual(
+            Configparser(config_file).config_data,
+            {"config": _FormatConfig()},
+        )
+
+    def test_register_streaming_format(self):
+        """Test that a registered format replaces the built-in one."""
+        FormatRegistry.register(_UppercaseJsonFormat)
+        self.addCleanup(FormatRegistry.unregister, _UppercaseJsonFormat)
+        self.assertIsInstance(
+            FormatRegistry.get(ConfigTypes.JSON), _UppercaseJsonFormat
+        )
+        config_file = os.path.join(self.directory.name, "config.json")
+        write_config(config_file, {"key": "value"}, ConfigTypes.JSON)
+        with open(config_file) as f:
+            self.assertEqual(f.read(), '{"KEY": 1}')
+        self.assertEqual(
+            parse_config(config_file, ConfigTypes.JSON), {"key": 1}
+        )
+
+        FormatRegistry.unregister(_UppercaseJsonFormat)
+        self.assertNotIsInstance(
+            FormatRegistry.get(ConfigTypes.JSON), _UppercaseJsonFormat
+        )
+
+    def test_unavailable_format(self):
+        """Test that formats of missing packages are not used."""
+        formats = FormatRegistry.formats(ConfigTypes.MSGPACK)
+        for format_class in formats:
+            FormatRegistry.unregister(format_class)
+        for format_class in formats:
+            self.addCleanup(FormatRegistry.register, format_class)
+        FormatRegistry.register(_MissingFormat)
+        self.addCleanup(FormatRegistry.unregister, _MissingFormat)
+        with self.assertRaises(ImportError):
+            FormatRegistry.get(ConfigTypes.MSGPACK)
+
+
+@skipUnless(importlib.util.find_spec("orjson"), "orjson is not installed")
+class TestOrjsonFormat(TestCase):
+    """Test the OrjsonFormat class."""
+
+    def test_loads_with_fallback(self):
+        """Test that documents orjson does not read are read by json."""
+        config_format = OrjsonFormat()
+        self.assertEqual(
+            config_format.loads(b'{"a": [1, 2.5]}'), {"a": [1, 2.5]}
+        )
+        self.assertEqual(
+            config_format.loads(
+                b'{"a": Infinity, "b": 123456789012345678901}'
+            ),
+            {"a": float("inf"), "b": 123456789012345678901},
+        )
+
+
+@skipUnless(importlib.util.find_spec("msgpack"), "msgpack is not installed")
+class TestMsgpackFormat(TestCase):
+    """Test the MsgpackFormat class."""
+
+    def test_round_trip(self):
+        """Test a round trip of a configuration through a msgpack file."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = os.path.join(directory, "config.msgpack")
+            config = {"config": _FormatConfig(), "values": [1, "two", None]}
+            Configparser.from_python(config, config_file).save()
+            parser = Configparser(config_file)
+            self.assertEqual(parser.config_type, ConfigTypes.MSGPACK)
+            self.assertEqual(parser.config_data, config)
@@ -0,0 +1,191 @@
+"""Tests for the config_index module."""
+
+import os
+import tempfile
+from unittest import TestCase
+
+from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_index import ConfigIndex
+from simple_config_builder.configparser import Configparser
+
+
+class _Pool(Configclass):
+    """Pool of the index configurations."""
+
+    timeout: int = 5
+    hosts: list[str] = Field(default_factory=lambda: ["a", "b"])
+
+
+class _SpecialPool(_Pool):
+    """Subclass of the pool."""
+
+
+class _Database(Configclass):
+    """Database of the index configurations."""
+
+    name: str = "db"
+    pools: list[_Pool] = Field(
+        default_factory=lambda: [_Pool(), _SpecialPool(timeout=7)]
+    )
+
+
+class TestConfigIndex(TestCase):
+    """Test the ConfigIndex class and Configparser.find_all."""
+
+    def setUp(self):
+        """Create a configparser."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.parser = Configparser.from_python(
+            {"db": _Database(), "labels": {"timeout": "none"}},
+            os.path.join(directory.name, "config.json"),
+        )
+        self.addCleanup(self.parser.close)
+
+    def test_find_all(self):
+        """Test the matches of fields and types in the order of the data."""
+        pools = self.parser.config_data["db"].pools
+        self.assertEqual(
+            self.parser.find_all(field="timeout"),
+            [
+                ("db.pools[0].timeout", 5),
+                ("db.pools[1].timeout", 7),
+                ("labels.timeout", "none"),
+            ],
+        )
+        self.assertEqual(
+            self.parser.find_all(type=_Pool),
+            [("db.pools[0]", pools[0]), ("db.pools[1]", pools[1])],
+        )
+        self.assertEqual(
+            self.parser.find_all(type=_SpecialPool),
+            [("db.pools[1]", pools[1])],
+        )
+        self.assertEqual(self.parser.find_all(field="missing"), [])
+        self.assertTrue(self.parser.contains(config_field="a"))
+        with self.assertRaises(ValueError):
+            self.parser.find_all()
+        with self.assertRaises(ValueError):
+            self.parser.find_all(field="timeout", type=int)
+
+    def test_assignments(self):
+        """Test that assignments update the index incrementally."""
+        database = self.parser.config_data["db"]
+        self.assertFalse(self.parser.contains(config_field="c"))
+        self.assertTrue(self.parser.contains(config_field_type=_SpecialPool))
+
+        database.pools = [_Pool(hosts=["c"])]
+        self.assertTrue(self.parser.contains(config_field="c"))
+        self.assertFalse(self.parser.contains(config_field="a"))
+        self.assertFalse(self.parser.contains(config_field_type=_SpecialPool))
+        self.assertEqual(
+            self.parser.find_all(field="timeout"),
+            [("labels.timeout", "none"), ("db.pools[0].timeout", 5)],
+        )
+
+        # The replaced instances are not observed anymore
+        old_pool = _Pool()
+        database.pools = [old_pool]
+        database.pools = []
+        old_pool.timeout = 8
+        self.assertEqual(
+            self.parser.find_all(field="timeout"),
+            [("labels.timeout", "none")],
+        )
+
+        self.parser.config_data = {"other": _Pool()}
+        self.assertEqual(
+            self.parser.find_all(field="timeout"), [("other.timeout", 5)]
+        )
+        database.name = "not indexed"
+        self.assertEqual(self.parser.find_all(field="name"), [])
+
+    def test_container_mutations(self):
+        """Test that mutations of containers are indexed by reindex."""
+        config_data = self.parser.config_data
+        self.assertFalse(self.parser.contains(config_field="new"))
+        config_data["new"] = 5
+        self.assertFalse(self.parser.contains(config_field="new"))
+        self.parser.reindex()
+        self.assertTrue(self.parser.contains(config_field="new"))
+
+        config_data["labels"]["y"] = _Pool()
+        config_data["db"].pools[0].hosts.append("tag")
+        self.parser.reindex()
+        self.assertTrue(self.parser.contains(config_field_type=_Pool))
+        self.assertEqual(self.parser.find_all(field="y")[0][0], "labels.y")
+        self.assertEqual(
+            self.parser.find_all(field="tag"),
+            [("db.pools[0].hosts[2]", "tag")],
+        )
+        # The instances of the mutated containers are observed
+        config_data["labels"]["y"].timeout = 9
+        self.assertIn(
+            ("labels.y.timeout", 9), self.parser.find_all(field="timeout")
+        )
+
+        # Items set through the configparser are indexed
+        self.parser.set("labels.z", 3)
+        self.assertEqual(self.parser.find_all(field="z"), [("labels.z", 3)])
+
+        del config_data["labels"]
+        self.parser.reindex()
+        self.assertFalse(self.parser.contains(config_field="y"))
+        self.assertFalse(self.parser.contains(config_field="labels"))
+
+    def test_keys_with_dots(self):
+        """Test keys which contain dots next to nested keys."""
+        config_data = {"a": {"x": 1}, "a.x": 2, "c": _Pool()}
+        index = ConfigIndex(config_data)
+        self.addCleanup(index.close)
+        self.assertEqual(index.find_field("x"), [("a.x", 1)])
+        self.assertEqual(index.find_field("a.x"), [("a.x", 2)])
+
+        config_data["c"].timeout = 6
+        self.assertEqual(index.find_field("a.x"), [("a.x", 2)])
+        self.assertEqual(index.find_field("timeout"), [("c.timeout", 6)])
+        del config_data["a.x"]
+        index.reindex()
+        self.assertFalse(index.has_field("a.x"))
+        self.assertEqual(index.find_field("x"), [("a.x", 1)])
+
+    def test_root_container(self):
+        """Test that the dictionary or list at the root is not matched."""
+        self.assertTrue(self.parser.contains(config_field_type=dict))
+        self.assertEqual(
+            self.parser.find_all(type=dict),
+            [("labels", self.parser.config_data["labels"])],
+        )
+        self.assertEqual(ConfigIndex(["a"]).find_type(list), [])
+        pool = _Pool()
+        self.assertEqual(ConfigIndex(pool).find_type(_Pool), [("", pool)])
+
+    def test_shared_instance(self):
+        """Test an instance at several paths of the data."""
+        pool = _Pool()
+        index = ConfigIndex({"first": pool, "second": [pool]})
+        self.addCleanup(index.close)
+        pool.timeout = 1
+        self.assertEqual(
+            index.find_field("timeout"),
+            [("first.timeout", 1), ("second[0].timeout", 1)],
+        )
+        index.close()
+        pool.timeout = 2
+        self.assertEqual(index.find_field("timeout")[0], ("first.timeout", 1))
+
+    def test_autosave_and_index(self):
+        """Test that the autosave and the index both observe assignments."""
+        with tempfile.TemporaryDirectory() as directory:
+            parser = Configparser.from_python(
+                _Database(),
+                os.path.join(directory, "config.json"),
+                autosave=True,
+                autosave_interval=60,
+            )
+            parser.save()
+            self.assertTrue(parser.contains(config_field_type=_SpecialPool))
+            parser.config_data.pools = []
+            self.assertTrue(parser.dirty)
+            self.assertFalse(parser.contains(config_field_type=_SpecialPool))
+            parser.close()
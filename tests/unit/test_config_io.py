@@ -1,10 +1,13 @@
 """Unit tests for the ConfigIO class."""
 
+from collections.abc import Callable
 from unittest import TestCase
 
 from simple_config_builder.config_io import (
     ConfigTypes,
+    construct_config,
     parse_config,
+    to_dict,
     write_config,
     write_json,
     write_yaml,
@@ -14,6 +17,7 @@ from simple_config_builder.config_io import (
     parse_toml,
 )
 from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_types import Durability
 
 
 class TestConfigIOMethods(TestCase):
@@ -108,6 +112,157 @@ class TestConfigIOMethods(TestCase):
         self.assertIsInstance(written_data_dct, dict)
         self.assertEqual(written_data_dct["test"]["key"], "value")
 
+    def test_write_json_like_json_dump(self):
+        """Test that write_json writes the layout of json.dump."""
+        import json
+        import os
+        import tempfile
+
+        config_data = {
+            "test": _TestClassConfigWithConfigClass(
+                list_key=[1e-7, 2.5e-12, 1e16, float("inf"), "1e-7"],
+                dict_key={"unicode": "\u00e9\u2028\U0001f600", "del": "\x7f"},
+            ),
+            "small": [1e-5, 1.5e-5, -9.99e-5, 1e-4, 0.5, "0.00001"],
+            "func": _TestClassConfigWithCallable(func=os.path.join),
+            "empty": {"list": [], "dict": {}},
+        }
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        config_file = os.path.join(directory.name, "config.json")
+        write_json(config_file, config_data)
+
+        with open(config_file, "r") as f:
+            written_data = f.read()
+
+        self.assertEqual(
+            written_data, json.dumps(to_dict(config_data), indent=4)
+        )
+
+        write_json(
+            config_file,
+            config_data,
+            compact=True,
+        )
+        with open(config_file, "r") as f:
+            written_data = f.read()
+
+        self.assertNotIn("\n", written_data)
+        self.assertEqual(
+            json.loads(written_data),
+            json.loads(json.dumps(to_dict(config_data))),
+        )
+
+        # None keys are written as null, also in Configclass fields
+        for config_data in (
+            {None: 1, "None": 2},
+            _TestClassConfigWithConfigClass(dict_key={None: 1e-5}),
+        ):
+            with self.subTest(config_data=config_data):
+                write_json(config_file, config_data)
+                with open(config_file, "r") as f:
+                    self.assertEqual(
+                        f.read(), json.dumps(to_dict(config_data), indent=4)
+                    )
+
+        with self.assertRaises(TypeError):
+            write_json(
+                config_file,
+                {"func": os.path.join},
+            )
+
+    def test_construct_config_deep_and_nested(self):
+        """Test constructing deep trees and nested lists and tuples."""
+        import sys
+
+        leaf = {"_config_class_type": "_TestClassConfigInnerWithConfigClass"}
+        config_data: dict = {"leaf": dict(leaf)}
+        for _ in range(sys.getrecursionlimit() * 2):
+            config_data = {"child": config_data}
+        config = construct_config(config_data)
+        while "child" in config:
+            config = config["child"]
+        self.assertIsInstance(
+            config["leaf"], _TestClassConfigInnerWithConfigClass
+        )
+
+        config = construct_config([[dict(leaf)], ({"a": (dict(leaf),)},)])
+        self.assertIsInstance(
+            config[0][0], _TestClassConfigInnerWithConfigClass
+        )
+        self.assertIsInstance(config[1], tuple)
+        self.assertIsInstance(
+            config[1][0]["a"][0], _TestClassConfigInnerWithConfigClass
+        )
+
+    def test_construct_config_error_path(self):
+        """Test that errors name the path of the failing node."""
+        config_data = {
+            "a": {
+                "b": [
+                    1,
+                    2,
+                    3,
+                    {
+                        "c": {
+                            "_config_class_type": (
+                                "_TestClassConfigInnerWithConfigClass"
+                            ),
+                            "unknown": 1,
+                        }
+                    },
+                ]
+            }
+        }
+        with self.assertRaises(ValueError) as context:
+            construct_config(config_data)
+        self.assertIn("Mismatched keys", str(context.exception))
+        self.assertEqual(
+            context.exception.__notes__,
+            ["In the configuration at 'a.b[3].c'."],
+        )
+
+    def test_write_config_atomic(self):
+        """Test that writes replace the file atomically."""
+        import os
+        import tempfile
+        from unittest.mock import patch
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        config_file = os.path.join(directory.name, "config.json")
+        write_json(config_file, {"key": "value"})
+        os.chmod(config_file, 0o640)
+        link = os.path.join(directory.name, "link.json")
+        os.symlink(config_file, link)
+
+        # A failing write leaves the file and no temporary file behind
+        with self.assertRaises(TypeError):
+            write_json(link, {"func": os.path.join})
+        self.assertEqual(parse_json(config_file), {"key": "value"})
+        self.assertEqual(
+            sorted(os.listdir(directory.name)), ["config.json", "link.json"]
+        )
+
+        fsyncs = {}
+        for durability in Durability:
+            with patch("os.fsync", wraps=os.fsync) as fsync:
+                write_config(
+                    link,
+                    {"key": durability.value},
+                    ConfigTypes.YAML,
+                    durability=durability,
+                )
+            fsyncs[durability] = fsync.call_count
+        self.assertEqual(
+            fsyncs,
+            {Durability.NONE: 0, Durability.FILE: 1, Durability.FULL: 2},
+        )
+        self.assertTrue(os.path.islink(link))
+        self.assertEqual(parse_yaml(config_file), {"key": "full"})
+        self.assertEqual(os.stat(config_file).st_mode & 0o777, 0o640)
+        self.assertEqual(len(os.listdir(directory.name)), 2)
+
     def test_parse_config_with_configclass_json(self):
         """Test parsing a configuration file with a ConfigClass."""
         config_data = parse_config(
@@ -186,6 +341,10 @@ class TestConfigIOMethods(TestCase):
         self.assertEqual(config_data["test"].sub_key.key, "value")
 
 
+class _TestClassConfigWithCallable(Configclass):
+    func: Callable
+
+
 class _TestClassConfigInnerWithConfigClass(Configclass):
     key: str = Field(default="value")
 
@@ -0,0 +1,148 @@
+"""Tests for the config_path module."""
+
+import os
+import tempfile
+from unittest import TestCase
+
+from pydantic import ValidationError
+
+from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_path import (
+    INDEX,
+    NAME,
+    SEGMENT,
+    PathAccessor,
+    parse_path,
+)
+from simple_config_builder.configparser import Configparser
+
+
+class _Pool(Configclass):
+    """Pool of the path configurations."""
+
+    timeout: int = 5
+    hosts: list[str] = Field(default_factory=lambda: ["a", "b"])
+
+
+class _Database(Configclass):
+    """Database of the path configurations."""
+
+    name: str = "db"
+    pools: list[_Pool] = Field(default_factory=lambda: [_Pool(), _Pool()])
+
+
+class _Order(Configclass):
+    """Order whose fields are named like methods of dictionaries."""
+
+    items: list[str] = Field(default_factory=lambda: ["a"])
+    keys: int = 1
+
+
+class TestParsePath(TestCase):
+    """Test the parse_path function."""
+
+    def test_paths(self):
+        """Test dotted paths and JSON pointers."""
+        self.assertEqual(parse_path(""), ())
+        self.assertEqual(
+            parse_path("db.pools[1].timeout"),
+            (("db", NAME), ("pools", NAME), (1, INDEX), ("timeout", NAME)),
+        )
+        self.assertEqual(
+            parse_path("""labels["a.b"]['c'][-1]"""),
+            (("labels", NAME), ("a.b", NAME), ("c", NAME), (-1, INDEX)),
+        )
+        self.assertEqual(
+            parse_path("/db/pools/1/a~1b~0"),
+            (
+                ("db", SEGMENT),
+                ("pools", SEGMENT),
+                ("1", SEGMENT),
+                ("a/b~", SEGMENT),
+            ),
+        )
+        for path in (".a", "a..b", "a.", "a[x]", "a[0]b", "a[1"):
+            with self.subTest(path=path), self.assertRaises(ValueError):
+                parse_path(path)
+
+
+class TestConfigparserPaths(TestCase):
+    """Test Configparser.get, get_many and set."""
+
+    def setUp(self):
+        """Create a configparser."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.parser = Configparser.from_python(
+            {"db": _Database(), "labels": {"a.b": [1, 2]}},
+            os.path.join(directory.name, "config.json"),
+        )
+        self.addCleanup(self.parser.close)
+
+    def test_get(self):
+        """Test reading the values of paths."""
+        database = self.parser.config_data["db"]
+        self.assertIs(self.parser.get(""), self.parser.config_data)
+        self.assertIs(self.parser.get("db"), database)
+        self.assertEqual(self.parser.get("db.pools[1].timeout"), 5)
+        self.assertEqual(self.parser.get("/db/pools/0/hosts/1"), "b")
+        self.assertEqual(self.parser.get('labels["a.b"][-1]'), 2)
+        self.assertEqual(
+            self.parser.get_many(["db.name", "db.pools[0].timeout"]),
+            ["db", 5],
+        )
+        for path in ("db.missing", "db.pools[2]", "db.name.upper", "db[0]"):
+            with self.subTest(path=path), self.assertRaises(KeyError):
+                self.parser.get(path)
+
+    def test_set(self):
+        """Test that fields are validated and that reloads are seen."""
+        self.parser.set("db.pools[1].timeout", 9)
+        self.assertEqual(self.parser.config_data["db"].pools[1].timeout, 9)
+        self.assertTrue(self.parser.contains(config_field="hosts"))
+        with self.assertRaises(ValidationError):
+            self.parser.set("db.pools[1].timeout", "not a number")
+        with self.assertRaises(KeyError):
+            self.parser.set("db.missing", 1)
+        with self.assertRaises(ValueError):
+            self.parser.set("", {})
+
+        self.parser.set("labels", _Pool(timeout=3))
+        self.assertEqual(self.parser.find_all(field="timeout")[-1][1], 3)
+        self.assertEqual(self.parser.get("labels.timeout"), 3)
+        self.parser.save()
+
+        self.parser.config_data["db"].pools = []
+        with self.assertRaises(KeyError):
+            self.parser.get("db.pools[1].timeout")
+        self.parser.reload()
+        self.assertEqual(self.parser.get("db.pools[1].timeout"), 9)
+        self.assertEqual(self.parser.get("labels.timeout"), 3)
+
+    def test_changed_shape(self):
+        """Test that compiled accessors fall back after shape changes."""
+        config_data = {"a": _Pool(hosts=["x"])}
+        accessor = PathAccessor.compile("a.hosts[0]", config_data)
+        self.assertEqual(accessor.get(config_data), "x")
+        config_data["a"] = {"hosts": ("y",)}
+        self.assertEqual(accessor.get(config_data), "y")
+        self.assertEqual(
+            PathAccessor.compile("a.missing", config_data).resolve(
+                config_data, -1
+            ),
+            {"hosts": ("y",)},
+        )
+
+    def test_replaced_by_dictionary(self):
+        """Test a Configclass which was replaced by a dictionary."""
+        config_data = {"order": _Order()}
+        items, keys = (
+            PathAccessor.compile(path, config_data)
+            for path in ("order.items", "order.keys")
+        )
+        self.assertEqual(items.get(config_data), ["a"])
+        self.assertEqual(keys.get(config_data), 1)
+        config_data["order"] = {"items": ["b"]}
+        self.assertEqual(items.get(config_data), ["b"])
+        with self.assertRaises(KeyError):
+            keys.get(config_data)
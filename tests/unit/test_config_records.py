@@ -0,0 +1,90 @@
+"""Tests for the record streaming of the config_io module."""
+
+import os
+import tempfile
+import tracemalloc
+from unittest import TestCase
+
+from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_io import (
+    iter_configs,
+    parse_config,
+    write_config,
+    write_configs,
+)
+from simple_config_builder.config_types import ConfigTypes
+
+
+class _Record(Configclass):
+    """Record of the record files."""
+
+    index: int = 0
+    name: str = "record"
+    values: list[float] = Field(default_factory=lambda: [0.5] * 8)
+
+
+def _records(count: int):
+    """Generate records without holding them in memory."""
+    for index in range(count):
+        yield _Record(index=index, name=f"record\n{index}")
+
+
+class TestConfigRecords(TestCase):
+    """Test iter_configs and write_configs."""
+
+    def setUp(self):
+        """Create a directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_round_trip(self):
+        """Test the records of JSON Lines and multi-document YAML files."""
+        for name in ("records.jsonl", "records.yaml"):
+            with self.subTest(name=name):
+                config_file = os.path.join(self.directory.name, name)
+                self.assertEqual(write_configs(config_file, _records(20)), 20)
+                records = iter_configs(config_file)
+                self.assertEqual(next(records), _Record(name="record\n0"))
+                self.assertEqual(list(records), list(_records(20))[1:])
+
+    def test_jsonl_files(self):
+        """Test blank lines, mixed records and write_config."""
+        config_file = os.path.join(self.directory.name, "records.ndjson")
+        with open(config_file, "w") as f:
+            f.write('{"a": 1}\n\n[1, 2]\n  \n"text"\n')
+        self.assertEqual(
+            list(iter_configs(config_file)), [{"a": 1}, [1, 2], "text"]
+        )
+
+        write_config(config_file, [_Record(), {"a": 1}], ConfigTypes.JSONL)
+        with open(config_file) as f:
+            self.assertEqual(len(f.readlines()), 2)
+        self.assertEqual(
+            parse_config(config_file, ConfigTypes.JSONL), [_Record(), {"a": 1}]
+        )
+        with self.assertRaises(TypeError):
+            write_config(config_file, {"a": 1}, ConfigTypes.JSONL)
+
+    def test_not_records(self):
+        """Test that files of other types are rejected at the call."""
+        config_file = os.path.join(self.directory.name, "config.json")
+        with self.assertRaises(ValueError):
+            iter_configs(config_file)
+        with self.assertRaises(ValueError):
+            write_configs(config_file, [])
+
+    def test_bounded_memory(self):
+        """Test that the records are not held in memory at once."""
+        config_file = os.path.join(self.directory.name, "records.jsonl")
+        write_configs(config_file, _records(20000))
+
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        count = sum(1 for _ in iter_configs(config_file))
+        _, streamed = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        records = parse_config(config_file, ConfigTypes.JSONL)
+        _, parsed = tracemalloc.get_traced_memory()
+
+        self.assertEqual(count, len(records))
+        self.assertLess(streamed * 10, parsed)
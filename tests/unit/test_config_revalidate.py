@@ -0,0 +1,249 @@
+"""Tests for the config_revalidate module."""
+
+import json
+import os
+import pickle
+import tempfile
+from unittest import TestCase
+
+from pydantic import field_validator
+
+from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_diff import Change
+from simple_config_builder.config_io import (
+    load_config_data,
+    validate_config,
+    write_config,
+)
+from simple_config_builder.config_revalidate import (
+    copy_config_data,
+    count_nodes,
+    revalidate_config,
+)
+from simple_config_builder.config_types import ConfigTypes
+from simple_config_builder.configparser import Configparser
+
+
+class _Sensor(Configclass):
+    """Sensor of the revalidation configurations."""
+
+    name: str = "sensor"
+    limits: list[int] = Field(default_factory=lambda: [0, 10])
+
+
+class _Station(Configclass):
+    """Station of the revalidation configurations."""
+
+    sensors: list[_Sensor] = Field(
+        default_factory=lambda: [_Sensor(name="a"), _Sensor(name="b")]
+    )
+    options: dict[str, int] = Field(default_factory=lambda: {"a": 1})
+
+
+class _Server(Configclass):
+    """Server whose hosts are parsed from a comma separated string."""
+
+    hosts: list[str] = Field(default_factory=list)
+    port: int = 80
+    verbose: bool | int = False
+
+    @field_validator("hosts", mode="before")
+    @classmethod
+    def split_hosts(cls, value):
+        """Split the hosts of the file."""
+        return value.split(",")
+
+
+class TestRevalidateConfig(TestCase):
+    """Test the revalidate_config function."""
+
+    def setUp(self):
+        """Write a configuration file."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.config_file = os.path.join(directory.name, "config.json")
+
+    def load(self, config_data):
+        """Write configuration data and load its parsed data."""
+        write_config(self.config_file, config_data, ConfigTypes.JSON)
+        return load_config_data(self.config_file, ConfigTypes.JSON)
+
+    def load_raw(self, raw_data):
+        """Write parsed data and load it with its configuration data."""
+        with open(self.config_file, "w") as f:
+            json.dump(raw_data, f)
+        raw_data = load_config_data(self.config_file, ConfigTypes.JSON)
+        return raw_data, validate_config(copy_config_data(raw_data))
+
+    def test_revalidate(self):
+        """Test that only the changed subtrees are validated."""
+        old_config = {"station": _Station(), "other": {"x": [1]}}
+        old_raw = self.load(old_config)
+        self.assertEqual(count_nodes(old_raw), 10)
+
+        new_station = _Station()
+        new_station.sensors[1].name = "changed"
+        new_raw = self.load({"station": new_station, "other": {"x": [1]}})
+        config, revalidated = revalidate_config(
+            copy_config_data(old_raw), new_raw, old_config
+        )
+        self.assertEqual(config, {"station": new_station, "other": {"x": [1]}})
+        # The root, the station, its sensors and the changed sensor, and the
+        # options and limits which their classes validate
+        self.assertEqual(revalidated, 6)
+        self.assertIs(config["other"], old_config["other"])
+        self.assertIs(
+            config["station"].sensors[0], old_config["station"].sensors[0]
+        )
+        # The fields of constructed instances are copies
+        self.assertEqual(
+            config["station"].options, old_config["station"].options
+        )
+        self.assertIsNot(config["station"], old_config["station"])
+
+        # Added items and changed classes are validated completely
+        new_raw = self.load(
+            {"station": _Station(sensors=[]), "other": _Sensor()}
+        )
+        config, revalidated = revalidate_config(old_raw, new_raw, old_config)
+        self.assertEqual(
+            config, {"station": _Station(sensors=[]), "other": _Sensor()}
+        )
+        # The station, its sensors and options, the root and the sensor
+        self.assertEqual(revalidated, 6)
+
+    def test_before_validators(self):
+        """Test that changed instances are validated from the parsed data."""
+        server = {"_config_class_type": _Server.__module__ + "._Server"}
+        old_raw, old_config = self.load_raw(
+            {"server": {**server, "hosts": "a,b", "port": 80}}
+        )
+        new_raw, expected = self.load_raw(
+            {"server": {**server, "hosts": "a,b", "port": 81}}
+        )
+        config, revalidated = revalidate_config(old_raw, new_raw, old_config)
+        self.assertEqual(config, expected)
+        self.assertEqual(config["server"].hosts, ["a", "b"])
+        self.assertEqual(revalidated, 2)
+
+    def test_types_of_values(self):
+        """Test that equal values of other types are changes."""
+        server = {"_config_class_type": _Server.__module__ + "._Server"}
+        old_raw, old_config = self.load_raw(
+            {"server": {**server, "verbose": 1}, "values": [1, 2.0]}
+        )
+        new_raw, _ = self.load_raw(
+            {"server": {**server, "verbose": True}, "values": [1, 2]}
+        )
+        config, _ = revalidate_config(
+            copy_config_data(old_raw), new_raw, old_config
+        )
+        self.assertIs(config["server"].verbose, True)
+        self.assertIs(type(config["values"][1]), int)
+
+        # Equal values of the same types are reused
+        new_raw, _ = self.load_raw(
+            {"server": {**server, "verbose": 1}, "values": [1, 2.0]}
+        )
+        config, revalidated = revalidate_config(old_raw, new_raw, old_config)
+        self.assertIs(config, old_config)
+        self.assertEqual(revalidated, 0)
+
+
+class TestConfigparserReload(TestCase):
+    """Test the incremental reloads of the configparser."""
+
+    def test_reload_stats(self):
+        """Test the reused instances and the counts of a reload."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = os.path.join(directory, "config.json")
+            parser = Configparser.from_python(
+                {"station": _Station(), "other": {"x": 1}}, config_file
+            )
+            parser.save()
+            self.assertEqual(
+                parser.reload_stats(), {"revalidated": 0, "reused": 0}
+            )
+            # The first reload validates all data
+            parser.reload()
+            self.assertEqual(
+                parser.reload_stats(), {"revalidated": 9, "reused": 0}
+            )
+            sensor = parser.config_data["station"].sensors[0]
+
+            write_config(
+                config_file,
+                {"station": _Station(), "other": {"x": 2}},
+                ConfigTypes.JSON,
+            )
+            self.assertEqual(parser.reload(), [Change("other.x", 1, 2)])
+            self.assertEqual(
+                parser.reload_stats(), {"revalidated": 2, "reused": 7}
+            )
+            self.assertIs(parser.config_data["station"].sensors[0], sensor)
+
+            # Assignments to instances of other data do not matter
+            _Sensor().name = "other"
+            write_config(
+                config_file,
+                {"station": _Station(), "other": {"x": 3}},
+                ConfigTypes.JSON,
+            )
+            self.assertEqual(parser.reload(), [Change("other.x", 2, 3)])
+            self.assertEqual(
+                parser.reload_stats(), {"revalidated": 2, "reused": 7}
+            )
+
+            # Assignments invalidate the parsed data of the last reload
+            sensor.name = "assigned"
+            self.assertEqual(
+                parser.reload(),
+                [Change("station.sensors[0].name", "assigned", "a")],
+            )
+            self.assertEqual(
+                parser.reload_stats(), {"revalidated": 9, "reused": 0}
+            )
+            self.assertEqual(parser.config_data["station"], _Station())
+
+    def test_modified_containers(self):
+        """Test that modified containers are validated from the file."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = os.path.join(directory, "config.json")
+            parser = Configparser.from_python(
+                {"a": {"b": 1}, "other": {"x": 1}}, config_file
+            )
+            parser.save()
+            parser.reload()
+            parser.config_data["a"]["b"] = 99
+            write_config(
+                config_file,
+                {"a": {"b": 1}, "other": {"x": 2}},
+                ConfigTypes.JSON,
+            )
+            self.assertEqual(
+                parser.reload(),
+                [Change("a.b", 99, 1), Change("other.x", 1, 2)],
+            )
+            self.assertEqual(
+                parser.config_data, {"a": {"b": 1}, "other": {"x": 2}}
+            )
+            self.assertEqual(
+                parser.reload_stats(), {"revalidated": 3, "reused": 0}
+            )
+
+    def test_state_not_pickled(self):
+        """Test that the reload state is not pickled with the parser."""
+        with tempfile.TemporaryDirectory() as directory:
+            parser = Configparser.from_python(
+                {"station": _Station()}, os.path.join(directory, "config.json")
+            )
+            parser.save()
+            parser.reload()
+            parser.reload()
+            self.assertGreater(parser.reload_stats()["reused"], 0)
+            other = pickle.loads(pickle.dumps(parser))
+            self.assertEqual(
+                other.reload_stats(), {"revalidated": 0, "reused": 0}
+            )
+            other.reload()
+            self.assertEqual(other.reload_stats()["reused"], 0)
@@ -0,0 +1,162 @@
+"""Tests for the config_sections module."""
+
+import os
+import tempfile
+from unittest import TestCase
+
+from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_io import write_config
+from simple_config_builder.config_sections import (
+    LazySections,
+    parse_lazy_config,
+)
+from simple_config_builder.config_types import ConfigTypes
+from simple_config_builder.configparser import Configparser
+
+
+class _SectionConfig(Configclass):
+    """Section configuration."""
+
+    name: str = "section"
+    values: list[int] = Field(default_factory=lambda: [1, 2, 3])
+
+
+_TYPE = f"{__name__}._SectionConfig"
+
+_YAML = f"""# The database settings
+database:
+  _config_class_type: {_TYPE}
+  name: database
+  values: [5432]
+# Kept as written, the section is never loaded
+server:
+  _config_class_type: {_TYPE}
+  name:   server   # odd spacing
+  values:
+  - 80
+  - 443
+'quoted key': 1
+"""
+
+
+class TestLazySections(TestCase):
+    """Test the lazy loading of the sections of configuration files."""
+
+    def setUp(self):
+        """Create a directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def _write(self, name: str, content: str) -> str:
+        config_file = os.path.join(self.directory.name, name)
+        with open(config_file, "w") as f:
+            f.write(content)
+        return config_file
+
+    def test_yaml_sections(self):
+        """Test that only accessed sections are constructed and written."""
+        config_file = self._write("config.yaml", _YAML)
+        parser = Configparser(config_file, lazy=True)
+        sections = parser.config_data
+        self.assertIsInstance(sections, LazySections)
+        self.assertEqual(list(sections), ["database", "server", "quoted key"])
+        self.assertIn("server", sections)
+        self.assertFalse(sections.is_loaded("database"))
+
+        database = sections["database"]
+        self.assertEqual(
+            database, _SectionConfig(name="database", values=[5432])
+        )
+        self.assertTrue(sections.is_loaded("database"))
+        self.assertFalse(sections.is_loaded("server"))
+        database.values = [5433]
+        sections["added"] = _SectionConfig()
+        parser.save()
+
+        with open(config_file) as f:
+            content = f.read()
+        # The untouched sections are written with their original bytes
+        server = _YAML[_YAML.index("# Kept") :]
+        self.assertIn(server, content)
+        self.assertNotIn("# The database settings", content)
+        self.assertFalse(sections.is_loaded("server"))
+        self.assertEqual(
+            dict(Configparser(config_file).config_data),
+            {
+                "database": _SectionConfig(name="database", values=[5433]),
+                "server": _SectionConfig(name="server", values=[80, 443]),
+                "quoted key": 1,
+                "added": _SectionConfig(),
+            },
+        )
+
+    def test_binary_sections(self):
+        """Test the sections of the binary format."""
+        config_file = os.path.join(self.directory.name, "config.scb")
+        config = {
+            f"section{i}": _SectionConfig(name=f"section{i}") for i in range(5)
+        }
+        config[3] = ("not", "a", "section")
+        write_config(config_file, config, ConfigTypes.BINARY)
+
+        sections = parse_lazy_config(config_file, ConfigTypes.BINARY)
+        self.assertIsInstance(sections, LazySections)
+        self.assertEqual(sections["section2"], config["section2"])
+        sections["section2"].name = "changed"
+        del sections["section4"]
+        self.assertEqual(
+            [key for key in config if sections.is_loaded(key)], ["section2"]
+        )
+        write_config(config_file, {}, ConfigTypes.BINARY)
+        with open(config_file, "wb") as f:
+            f.write(sections.serialize())
+
+        config["section2"] = _SectionConfig(name="changed")
+        del config["section4"]
+        self.assertEqual(
+            dict(parse_lazy_config(config_file, ConfigTypes.BINARY)), config
+        )
+
+    def test_not_split(self):
+        """Test that documents which cannot be split are parsed at once."""
+        cases = [
+            ("config.json", '{"a": {"b": 1}}', {"a": {"b": 1}}),
+            ("list.yaml", "- 1\n- 2\n", [1, 2]),
+            ("anchor.yaml", "a: &x [1]\nb: *x\n", {"a": [1], "b": [1]}),
+            ("documents.yaml", "---\na: 1\n", {"a": 1}),
+            # Flow collections and quoted scalars continued at the first
+            # column
+            (
+                "flow.yaml",
+                "a: {x: 1,\ny: 2}\nb: 3\n",
+                {"a": {"x": 1, "y": 2}, "b": 3},
+            ),
+            (
+                "quoted.yaml",
+                'a: "multi\nline: here"\nb: 1\n',
+                {"a": "multi line: here", "b": 1},
+            ),
+            (
+                "single.yaml",
+                "a: 'it''s\nb: x'\nc: 1\n",
+                {"a": "it's b: x", "c": 1},
+            ),
+        ]
+        for name, content, expected in cases:
+            with self.subTest(name=name):
+                config_file = self._write(name, content)
+                config_data = Configparser(config_file, lazy=True).config_data
+                self.assertNotIsInstance(config_data, LazySections)
+                self.assertEqual(config_data, expected)
+
+    def test_autosave_loaded_sections(self):
+        """Test that sections are observed by the autosave on access."""
+        config_file = self._write("config.yaml", _YAML)
+        parser = Configparser(
+            config_file, lazy=True, autosave=True, autosave_interval=60
+        )
+        self.addCleanup(parser.close)
+        self.assertFalse(parser.dirty)
+        parser.config_data["server"].name = "changed"
+        self.assertTrue(parser.dirty)
+        self.assertTrue(parser.contains(config_field="values"))
@@ -0,0 +1,202 @@
+"""Tests for the config_subscriptions module."""
+
+import asyncio
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_diff import MISSING, Change
+from simple_config_builder.config_io import write_config
+from simple_config_builder.config_subscriptions import (
+    ChangeSubscriptions,
+    Subscription,
+    split_path,
+)
+from simple_config_builder.config_types import ConfigTypes
+from simple_config_builder.configparser import Configparser
+
+
+class _Cache(Configclass):
+    """Cache of the subscription configurations."""
+
+    size: int = 10
+    hosts: list[str] = Field(default_factory=lambda: ["a"])
+
+
+class _Service(Configclass):
+    """Service of the subscription configurations."""
+
+    cache: _Cache = Field(default_factory=_Cache)
+    name: str = "service"
+
+
+class TestSubscription(TestCase):
+    """Test the matching of the patterns."""
+
+    def test_matches(self):
+        """Test patterns against paths, their ancestors and descendants."""
+        cases = [
+            ("cache.*", "cache.size", True),
+            ("cache.*", "cache.hosts[0]", True),
+            ("cache.*", "cache", True),
+            ("cache.*", "", True),
+            ("cache.*", "name", False),
+            ("cache.*", "cache[0]", False),
+            ("db.pools[*].timeout", "db.pools[3].timeout", True),
+            ("db.pools[*].timeout", "db.pools[3].size", False),
+            ("db.**", "db.pools[3].size", True),
+            ("db.**.x", "db", True),
+            ("a?", "ab.c", True),
+            # Segments after `**`
+            ("servers.**.port", "servers.a.port", True),
+            ("servers.**.port", "servers.a.b[0].port", True),
+            ("servers.**.port", "servers.port", True),
+            ("servers.**.port", "servers.a.port.x", True),
+            ("servers.**.port", "servers.a.host", True),
+            ("servers.**.port", "servers", True),
+            ("servers.**.port", "clients.a.port", False),
+            ("**.port", "a.b.port", True),
+            ("a.**.b.**.c", "a.x.b.y.z.c", True),
+            ("a.**.b.**.c", "a.b.c", True),
+            ("a.**.b.**.c", "a.c.c", True),
+        ]
+        for pattern, path, expected in cases:
+            with self.subTest(pattern=pattern, path=path):
+                self.assertEqual(
+                    Subscription(pattern, print).matches(split_path(path)),
+                    expected,
+                )
+
+    def test_matches_leaves(self):
+        """Test that changed leaves only match the paths below them."""
+        cases = [
+            ("servers.**.port", "servers.a.host", False),
+            ("servers.**.port", "servers.a.port", True),
+            ("servers.**.port", "servers.a.port.x", True),
+            ("servers.**.port", "servers", False),
+            ("cache.*", "cache", False),
+            ("cache.*", "cache.size", True),
+        ]
+        for pattern, path, expected in cases:
+            with self.subTest(pattern=pattern, path=path):
+                self.assertEqual(
+                    Subscription(pattern, print).matches(
+                        split_path(path), parent=False
+                    ),
+                    expected,
+                )
+
+    def test_dispatch(self):
+        """Test that the values of the changes decide about ancestors."""
+        subscriptions = ChangeSubscriptions()
+        batches = []
+        subscriptions.subscribe(
+            Subscription("servers.**.port", batches.append)
+        )
+        subscriptions.dispatch([Change("servers.a.host", "x", "y")])
+        self.assertEqual(batches, [])
+        added = Change("servers.b", MISSING, {"port": 80})
+        subscriptions.dispatch([Change("servers.a.host", "x", "y"), added])
+        self.assertEqual(batches, [[added]])
+
+
+class TestConfigparserSubscriptions(TestCase):
+    """Test Configparser.on_change."""
+
+    def setUp(self):
+        """Create a configparser and a subscription."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.config_file = os.path.join(directory.name, "config.json")
+        self.parser = Configparser.from_python(
+            {"service": _Service(), "other": {"x": 1}}, self.config_file
+        )
+        self.parser.save()
+        self.addCleanup(self.parser.close)
+        self.batches = []
+        self.subscription = self.parser.on_change(
+            "service.cache.*", self.batches.append
+        )
+
+    def test_reload(self):
+        """Test that the changes of one reload are notified at once."""
+        self.parser.reload()
+        self.assertEqual(self.batches, [])
+
+        write_config(
+            self.config_file,
+            {
+                "service": _Service(cache=_Cache(size=20, hosts=[])),
+                "other": {"x": 2},
+            },
+            ConfigTypes.JSON,
+        )
+        self.parser.reload()
+        self.assertEqual(
+            self.batches,
+            [
+                [
+                    Change("service.cache.size", 10, 20),
+                    Change("service.cache.hosts[0]", "a", MISSING),
+                ]
+            ],
+        )
+
+        # The instances of the reloaded data are observed
+        self.parser.config_data["service"].cache.size = 30
+        self.assertEqual(
+            self.batches[-1], [Change("service.cache.size", 20, 30)]
+        )
+
+    def test_assignments(self):
+        """Test assignments, set and unsubscribe."""
+        service = self.parser.config_data["service"]
+        service.name = "changed"
+        service.cache.size = 10
+        self.assertEqual(self.batches, [])
+
+        service.cache = _Cache(size=11)
+        self.parser.set("service.cache.hosts", ["a", "b"])
+        self.parser.set("other.x", 2)
+        self.assertEqual(
+            self.batches,
+            [
+                [Change("service.cache.size", 10, 11)],
+                [Change("service.cache.hosts[1]", MISSING, "b")],
+            ],
+        )
+
+        self.parser.unsubscribe(self.subscription)
+        service.cache.size = 12
+        self.assertEqual(len(self.batches), 2)
+
+    def test_executors(self):
+        """Test callbacks run by a thread pool and on an event loop."""
+        called = threading.Event()
+        threads = []
+
+        def callback(changes):
+            threads.append(threading.current_thread())
+            called.set()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.parser.on_change("service.name", callback, executor)
+            self.parser.config_data["service"].name = "changed"
+            self.assertTrue(called.wait(5))
+        self.assertIsNot(threads[0], threading.current_thread())
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            received = asyncio.Event()
+
+            async def coroutine_callback(changes):
+                received.set()
+
+            self.parser.on_change("other", coroutine_callback, loop)
+            await asyncio.to_thread(self.parser.set, "other.x", 3)
+            await asyncio.wait_for(received.wait(), 5)
+
+        asyncio.run(main())
@@ -0,0 +1,218 @@
+"""Tests for the config_tree module."""
+
+import copy
+import json
+import os
+from collections.abc import Callable
+from unittest import TestCase
+
+from pydantic import ValidationError, field_validator
+
+from simple_config_builder.callables import LazyCallable
+from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_io import construct_config
+from simple_config_builder.config_tree import (
+    ConfigJsonValidator,
+    ConfigTreeValidator,
+)
+
+
+class TreeLeaf(Configclass):
+    """Leaf of the test trees."""
+
+    name: str = "leaf"
+    weights: list[float] = Field(default_factory=list)
+
+
+class TreeGroup(Configclass):
+    """Group of the test trees with untyped fields."""
+
+    leaves: list
+    meta: dict = Field(default_factory=dict)
+    func: Callable | None = None
+
+
+def make_tree() -> dict:
+    """Make a tree with nested tagged and untagged nodes."""
+    return {
+        "groups": [
+            {
+                "_config_class_type": "TreeGroup",
+                "leaves": [
+                    {"_config_class_type": "TreeLeaf", "weights": [1.0, 2]},
+                    {"_config_class_type": "TreeLeaf", "name": "b"},
+                ],
+                "meta": {"plain": {"a": [1, None, "b"]}},
+                "func": {
+                    "type": "callable",
+                    "module": "os.path",
+                    "name": "join",
+                    "file_path": "",
+                },
+            }
+        ],
+        "pair": ({"_config_class_type": "TreeLeaf"}, 1),
+        "value": 1.5,
+    }
+
+
+class TestConfigTreeValidator(TestCase):
+    """Test the ConfigTreeValidator class."""
+
+    def test_validate_like_construct_config(self):
+        """Test that the tree is constructed like construct_config does."""
+        data = make_tree()
+        validated = ConfigTreeValidator.validate(data)
+        self.assertEqual(data, make_tree())
+        self.assertEqual(validated, construct_config(make_tree()))
+
+        group = validated["groups"][0]
+        self.assertIsInstance(group, TreeGroup)
+        self.assertIsInstance(group.leaves[0], TreeLeaf)
+        self.assertEqual(group.leaves[0].weights, [1.0, 2.0])
+        self.assertEqual(group.leaves[1].name, "b")
+        self.assertIsInstance(validated["pair"], tuple)
+        self.assertIsInstance(validated["pair"][0], TreeLeaf)
+        self.assertEqual(group.meta, {"plain": {"a": [1, None, "b"]}})
+        self.assertEqual(
+            group.func("a", "b"),
+            construct_config(make_tree())["groups"][0].func("a", "b"),
+        )
+
+    def test_same_errors_as_construct_config(self):
+        """Test that invalid nodes raise the errors of construct_config."""
+        invalid_trees = [
+            {"_config_class_type": "TreeLeaf", "unknown": 1},
+            {"_config_class_type": 1},
+            {"_config_class_type": "NotARegisteredClass"},
+            {"_config_class_type": "module_that_does_not_exist.Class"},
+            {"_config_class_type": "TreeLeaf", "weights": ["x"]},
+            {
+                "groups": [
+                    {
+                        "_config_class_type": "TreeGroup",
+                        "leaves": [
+                            {"_config_class_type": "TreeLeaf", "name": 1}
+                        ],
+                    }
+                ]
+            },
+        ]
+        for data in invalid_trees:
+            with self.subTest(data=data):
+                with self.assertRaises(Exception) as expected:
+                    construct_config(copy.deepcopy(data))
+                with self.assertRaises(type(expected.exception)) as raised:
+                    ConfigTreeValidator.validate(data)
+                self.assertEqual(
+                    str(raised.exception), str(expected.exception)
+                )
+                self.assertEqual(
+                    getattr(raised.exception, "__notes__", None),
+                    getattr(expected.exception, "__notes__", None),
+                )
+                if isinstance(expected.exception, ValidationError):
+                    self.assertEqual(
+                        raised.exception.errors(), expected.exception.errors()
+                    )
+
+    def test_rebuild_for_registered_classes(self):
+        """Test that classes registered later are constructed."""
+        ConfigTreeValidator.validate({})
+
+        class TreeLateClass(Configclass):
+            value1: int = 1
+
+        validated = ConfigTreeValidator.validate(
+            {"_config_class_type": "TreeLateClass", "value1": 2}
+        )
+        self.assertEqual(validated, TreeLateClass(value1=2))
+
+    def test_too_deep_tree(self):
+        """Test that trees too deep for one pass raise a RecursionError."""
+        data: list = []
+        for _ in range(1000):
+            data = [data]
+        with self.assertRaises(RecursionError):
+            ConfigTreeValidator.validate(data)
+
+
+class TreeTyped(Configclass):
+    """Typed root of the test JSON documents."""
+
+    leaves: list[TreeLeaf]
+    optional: TreeLeaf | None = None
+    func: Callable | None = None
+
+
+class TreeValidated(Configclass):
+    """Typed root with a field validator and nested containers."""
+
+    name: str
+    by_name: dict[str, TreeLeaf] = Field(default_factory=dict)
+    pair: tuple[TreeLeaf, ...] = ()
+    child: "TreeValidated | None" = None
+
+    @field_validator("name")
+    @classmethod
+    def _upper(cls, value: str) -> str:
+        return value.upper()
+
+
+class TestConfigJsonValidator(TestCase):
+    """Test the ConfigJsonValidator class."""
+
+    def setUp(self):
+        """Write a typed document."""
+        self.config = TreeTyped(
+            leaves=[TreeLeaf(name="a", weights=[1.0]), TreeLeaf()],
+            func=os.path.join,
+        )
+        self.config_bytes = self.config.model_dump_json(indent=4).encode()
+
+    def test_validate_typed_document(self):
+        """Test that typed documents are validated from the bytes."""
+        validated = ConfigJsonValidator.validate(self.config_bytes)
+        self.assertEqual(validated, self.config)
+        self.assertEqual(
+            validated,
+            ConfigTreeValidator.validate(json.loads(self.config_bytes)),
+        )
+        self.assertNotIn("_config_class_type", validated.leaves[0].__dict__)
+        self.assertEqual(
+            validated.leaves[0].model_fields_set, {"name", "weights"}
+        )
+        self.assertIs(validated.func, os.path.join)
+
+        lazy = ConfigJsonValidator.validate(self.config_bytes, True)
+        self.assertIsInstance(lazy.func, LazyCallable)
+
+    def test_fall_back_to_tree_validation(self):
+        """Test that other documents are left to the tree validation."""
+        untyped = json.dumps({"key": "value"}).encode()
+        mixed = json.dumps(
+            {"_config_class_type": "TreeGroup", "leaves": []}
+        ).encode()
+        unknown_key = self.config_bytes.replace(b'"name"', b'"nme"', 1)
+        other_class = self.config_bytes.replace(
+            b"test_config_tree.TreeLeaf", b"test_config_tree.TreeGroup", 1
+        )
+        for config_bytes in (untyped, mixed, unknown_key, other_class):
+            with self.subTest(config_bytes=config_bytes):
+                self.assertIsNone(ConfigJsonValidator.validate(config_bytes))
+
+    def test_validate_containers(self):
+        """Test recursive classes, containers and the class validators."""
+        config = TreeValidated(
+            name="a",
+            by_name={"x": TreeLeaf(name="x")},
+            pair=(TreeLeaf(), TreeLeaf(weights=[2.0])),
+            child=TreeValidated(name="b"),
+        )
+        config_bytes = config.model_dump_json().encode()
+        validated = ConfigJsonValidator.validate(config_bytes)
+        self.assertEqual(validated, config)
+        self.assertEqual(validated.child.name, "B")
+        self.assertEqual(
+            validated, ConfigTreeValidator.validate(json.loads(config_bytes))
+        )
@@ -1,5 +1,11 @@
 """Test for configparser Class."""
 
+import copy
+import json
+import os
+import pickle
+import tempfile
+import time
 from unittest import TestCase
 
 from simple_config_builder.config import Configclass
@@ -49,13 +55,14 @@ class TestConfigparser(TestCase):
         self.assertEqual(config.config_data, {"key": "value"})
 
         # Test autosave
-        self.assertEqual(config._old_config_data, {"key": "value"})
+        self.assertFalse(config.dirty)
         config.config_data = {"key": "value2"}
+        self.assertTrue(config.dirty)
         # sleep for 2 second
         import time
 
         time.sleep(2)
-        self.assertEqual(config._old_config_data, {"key": "value2"})
+        self.assertFalse(config.dirty)
         self.assertEqual(config.config_data, {"key": "value2"})
         # check if the file is updated
         with open("tests/unit/config_files/config_auto_save.json", "r") as f:
@@ -90,6 +97,54 @@ class TestConfigparser(TestCase):
         time.sleep(2)
         self.assertEqual(config.config_data, {"key": "value2"})
 
+    def test_save_skips_unchanged_content(self):
+        """Test that saving the content of the file again is skipped."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = os.path.join(directory, "config.json")
+            with open(config_file, "w") as f:
+                f.write('{\n    "key": "value"\n}')
+            parser = Configparser(config_file)
+            parser.save()
+            self.assertEqual(
+                parser.write_stats(), {"performed": 0, "skipped": 1}
+            )
+            parser.config_data["key"] = "value2"
+            parser.save()
+            parser.save()
+            self.assertEqual(
+                parser.write_stats(), {"performed": 1, "skipped": 2}
+            )
+
+            # A file changed by others is written again
+            with open(config_file, "w") as f:
+                f.write("{}")
+            parser.save()
+            self.assertEqual(
+                parser.write_stats(), {"performed": 2, "skipped": 2}
+            )
+            with open(config_file) as f:
+                self.assertEqual(json.load(f), {"key": "value2"})
+
+    def test_copy_and_pickle(self):
+        """Test that copies and unpickled configparsers have own state."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = os.path.join(directory, "config.json")
+            with open(config_file, "w") as f:
+                f.write('{"key": "value"}')
+            parser = Configparser(config_file)
+            parser.save()
+            self.assertTrue(parser.contains(config_field="key"))
+            for other in (
+                copy.copy(parser),
+                pickle.loads(pickle.dumps(parser)),
+            ):
+                self.assertEqual(other.config_data, {"key": "value"})
+                self.assertEqual(
+                    other.write_stats(), {"performed": 0, "skipped": 0}
+                )
+                self.assertTrue(other.contains(config_field="key"))
+                self.assertEqual(other.get("key"), "value")
+
     def test_get_item(self):
         """Test get item."""
         config = Configparser("tests/unit/config_files/configparser.json")
@@ -156,3 +211,46 @@ class TestConfigparser(TestCase):
         )
         self.assertTrue(parser.contains(config_field="key"))
         self.assertTrue(parser.contains(config_field="key2"))
+
+    def test_autosave_tracks_assignments(self):
+        """Test that assignments are coalesced into one autosave."""
+
+        class _AutosaveInner(Configclass):
+            value: int = 0
+
+        class _AutosaveConfig(Configclass):
+            inner: _AutosaveInner = _AutosaveInner()
+            name: str = "config"
+
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = os.path.join(directory, "config.json")
+            parser = Configparser.from_python(
+                _AutosaveConfig(),
+                config_file,
+                autosave=True,
+                autosave_interval=0.2,
+            )
+            self.assertTrue(parser.dirty)
+            time.sleep(0.5)
+            self.assertFalse(parser.dirty)
+
+            self.assertEqual(parser.write_stats()["performed"], 1)
+
+            for i in range(100):
+                parser.config_data.inner.value = i
+            self.assertTrue(parser.dirty)
+            time.sleep(0.5)
+            self.assertFalse(parser.dirty)
+            self.assertEqual(parser.write_stats()["performed"], 2)
+
+            # Instances assigned to the tree are tracked as well
+            parser.config_data.inner = _AutosaveInner(value=1)
+            time.sleep(0.5)
+            parser.config_data.inner.value = 2
+            with self.assertRaises(ValueError):
+                parser.config_data.inner.value = "invalid"
+            parser.close()
+            self.assertEqual(parser.write_stats()["performed"], 4)
+            self.assertFalse(parser.dirty)
+            with open(config_file) as f:
+                self.assertEqual(json.load(f)["inner"]["value"], 2)
@@ -0,0 +1,129 @@
+"""Tests for the scheduler module."""
+
+import os
+import resource
+import tempfile
+import threading
+import time
+from threading import Event
+from unittest import TestCase
+
+from simple_config_builder.configparser import Configparser
+from simple_config_builder.scheduler import Scheduler
+
+
+class TestScheduler(TestCase):
+    """Test the Scheduler class."""
+
+    def setUp(self):
+        """Create a scheduler."""
+        self.scheduler = Scheduler()
+        self.addCleanup(self.scheduler.shutdown)
+
+    def test_tasks_and_metrics(self):
+        """Test the order of tasks, periodic tasks and the metrics."""
+        runs: list[str] = []
+        done = Event()
+        self.scheduler.register(lambda: runs.append("b"), delay=0.1)
+        self.scheduler.register(lambda: runs.append("a"), delay=0.05)
+        periodic = self.scheduler.register(
+            lambda: runs.append("p"), delay=0.02, interval=0.02
+        )
+        cancelled = self.scheduler.register(lambda: runs.append("c"), 0.05)
+        self.scheduler.unregister(cancelled)
+        self.assertEqual(self.scheduler.metrics()["queue_depth"], 3)
+        self.scheduler.register(done.set, delay=0.15)
+        self.assertTrue(done.wait(5))
+        self.scheduler.unregister(periodic)
+
+        self.assertNotIn("c", runs)
+        self.assertLess(runs.index("a"), runs.index("b"))
+        self.assertGreaterEqual(runs.count("p"), 3)
+        metrics = self.scheduler.metrics()
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertEqual(metrics["runs"], len(runs) + 1)
+        self.assertGreaterEqual(metrics["lag_max"], metrics["lag_mean"])
+
+    def test_readers(self):
+        """Test the callbacks of readable file descriptors."""
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        received = Event()
+
+        def _read():
+            os.read(read_fd, 1024)
+            received.set()
+
+        self.scheduler.add_reader(read_fd, _read)
+        self.assertEqual(self.scheduler.metrics()["readers"], 1)
+        os.write(write_fd, b"data")
+        self.assertTrue(received.wait(5))
+        self.scheduler.remove_reader(read_fd)
+        self.assertEqual(self.scheduler.metrics()["readers"], 0)
+
+    def test_reader_above_select_limit(self):
+        """Test a reader with a file descriptor above 1023."""
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft <= 1500:
+            self.skipTest("The limit of open files is too low.")
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        high_fd = os.dup2(read_fd, 1500)
+        self.addCleanup(os.close, high_fd)
+        received = Event()
+
+        def _read():
+            os.read(high_fd, 1024)
+            received.set()
+
+        self.scheduler.add_reader(high_fd, _read)
+        os.write(write_fd, b"data")
+        self.assertTrue(received.wait(5))
+
+    def test_invalid_reader_dropped(self):
+        """Test that a closed file descriptor is logged and dropped."""
+        read_fd, write_fd = os.pipe()
+        os.close(read_fd)
+        os.close(write_fd)
+        runs = Event()
+        with self.assertLogs("simple_config_builder.scheduler", "ERROR"):
+            self.scheduler.add_reader(read_fd, lambda: None)
+            self.scheduler.register(runs.set, delay=0.05)
+            self.assertTrue(runs.wait(5))
+        self.assertEqual(self.scheduler.metrics()["readers"], 0)
+
+    def test_shutdown(self):
+        """Test that shutdown runs the tasks registered for it."""
+        runs: list[str] = []
+        self.scheduler.register(lambda: runs.append("save"), 60, None, True)
+        self.scheduler.register(lambda: runs.append("reload"), 60)
+        self.scheduler.shutdown()
+        self.assertEqual(runs, ["save"])
+        with self.assertRaises(RuntimeError):
+            self.scheduler.register(lambda: None)
+
+    def test_configparsers_share_one_thread(self):
+        """Test that configparsers do not start a thread each."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = os.path.join(directory, "config.json")
+            with open(config_file, "w") as f:
+                f.write('{"key": "value"}')
+            Configparser(config_file, autoreload=True).close()
+            threads = threading.active_count()
+            parsers = [
+                Configparser(config_file, autoreload=True) for _ in range(50)
+            ]
+            self.assertEqual(threading.active_count(), threads)
+            with open(config_file, "w") as f:
+                f.write('{"key": "value3"}')
+            deadline = time.monotonic() + 5
+            while any(
+                parser.config_data != {"key": "value3"} for parser in parsers
+            ):
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+            self.assertEqual(threading.active_count(), threads)
+            for parser in parsers:
+                parser.close()
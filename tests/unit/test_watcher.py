@@ -0,0 +1,104 @@
+"""Tests for the watcher module."""
+
+import os
+import tempfile
+import time
+from threading import Event
+from unittest import TestCase
+
+from simple_config_builder.configparser import Configparser
+from simple_config_builder.watcher import FileWatcher
+
+
+def _backends() -> list[str]:
+    """Get the backends which are available on the platform."""
+    try:
+        FileWatcher(backend="inotify").close()
+    except OSError:
+        return ["polling"]
+    return ["inotify", "polling"]
+
+
+class TestFileWatcher(TestCase):
+    """Test the FileWatcher class."""
+
+    def setUp(self):
+        """Create a directory with a watched file."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.config_file = os.path.join(self.directory.name, "config.json")
+        with open(self.config_file, "w") as f:
+            f.write('{"key": "value"}')
+
+    def _watch(self, backend: str) -> tuple[FileWatcher, list, Event]:
+        """Watch the file and record the calls of the callback."""
+        watcher = FileWatcher(
+            debounce=0.05, poll_interval=0.02, backend=backend
+        )
+        self.addCleanup(watcher.close)
+        calls: list[str] = []
+        called = Event()
+
+        def callback(path):
+            calls.append(path)
+            called.set()
+
+        watcher.watch(self.config_file, callback)
+        return watcher, calls, called
+
+    def test_write_and_atomic_rename(self):
+        """Test in place writes and writes replacing the file."""
+        for backend in _backends():
+            with self.subTest(backend=backend):
+                watcher, calls, called = self._watch(backend)
+                self.assertEqual(watcher.backend, backend)
+                with open(self.config_file, "w") as f:
+                    f.write('{"key": "value2"}')
+                self.assertTrue(called.wait(5))
+                self.assertEqual(calls, [os.path.abspath(self.config_file)])
+
+                called.clear()
+                temp_file = os.path.join(self.directory.name, "config.tmp")
+                with open(temp_file, "w") as f:
+                    f.write('{"key": "value3"}')
+                os.replace(temp_file, self.config_file)
+                self.assertTrue(called.wait(5))
+                self.assertEqual(len(calls), 2)
+                watcher.close()
+
+    def test_debounce_and_unwatch(self):
+        """Test that a burst of writes results in one call."""
+        watcher, calls, called = self._watch(_backends()[0])
+        watcher.debounce = 0.3
+        for i in range(10):
+            with open(self.config_file, "w") as f:
+                f.write(f'{{"key": {i}}}')
+            time.sleep(0.01)
+        self.assertTrue(called.wait(5))
+        time.sleep(0.4)
+        self.assertEqual(len(calls), 1)
+
+        # Other files in the directory are not reported
+        with open(os.path.join(self.directory.name, "other.json"), "w") as f:
+            f.write("{}")
+        time.sleep(0.4)
+        self.assertEqual(len(calls), 1)
+
+        watcher.unwatch(0)
+        with open(self.config_file, "w") as f:
+            f.write("{}")
+        time.sleep(0.4)
+        self.assertEqual(len(calls), 1)
+
+    def test_configparser_autoreload(self):
+        """Test the autoreload of the Configparser."""
+        config = Configparser(self.config_file, autoreload=True)
+        self.addCleanup(config.close)
+        temp_file = os.path.join(self.directory.name, "config.tmp")
+        with open(temp_file, "w") as f:
+            f.write('{"key": "value2"}')
+        os.replace(temp_file, self.config_file)
+        deadline = time.monotonic() + 5
+        while config.config_data != {"key": "value2"}:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
@@ -0,0 +1,110 @@
+"""Parity tests of the YAML backends of the config_io module."""
+
+import datetime
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+
+from simple_config_builder.config import Configclass, Field
+from simple_config_builder.config_io import (
+    YamlBackend,
+    parse_config,
+    parse_yaml,
+    serialize_yaml,
+    to_dict,
+    write_config,
+)
+from simple_config_builder.config_types import ConfigTypes
+
+
+class _YamlInner(Configclass):
+    """Inner class of the parity configurations."""
+
+    text: str = "ünïcødé ✓ 😀"
+    values: list[float] = Field(default_factory=lambda: [1e-7, -0.0, 1e20])
+
+
+class _YamlConfig(Configclass):
+    """Parity configuration."""
+
+    name: str = "multi\nline\nstring"
+    long: str = "x" * 200
+    flag: bool = True
+    missing: int | None = None
+    inners: list[_YamlInner] = Field(
+        default_factory=lambda: [_YamlInner(), _YamlInner(text="a: b")]
+    )
+    mapping: dict[str, str] = Field(
+        default_factory=lambda: {"yes": "no", "~": " lead", "tab": "a\tb"}
+    )
+
+
+_DOCUMENTS = [
+    {"config": _YamlConfig()},
+    [_YamlConfig(flag=False), {"nested": [[1, [2, [3]]], {}, []]}],
+    {
+        "tuple": (1, "2", 3.5),
+        "date": datetime.date(2020, 1, 2),
+        "big": 10**30,
+        "control": "\x7f\x01",
+        "numbers": ["123", "1e3", "0x1F", "null", "~"],
+    },
+]
+
+
+@skipUnless(YamlBackend.available(), "PyYAML is not built with libyaml")
+class TestYamlBackend(TestCase):
+    """Test that both YAML backends read and write the same documents."""
+
+    def setUp(self):
+        """Create a directory and reset the backend afterwards."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.addCleanup(YamlBackend.use, None)
+
+    def _serialize(self, backend: str, data) -> bytes:
+        YamlBackend.use(backend)
+        return serialize_yaml(to_dict(data))
+
+    def test_default_and_forced_backend(self):
+        """Test the automatic and the forced selection."""
+        YamlBackend.use(None)
+        self.assertEqual(YamlBackend.name(), "libyaml")
+        YamlBackend.use("python")
+        self.assertEqual(YamlBackend.name(), "python")
+        self.assertEqual(YamlBackend.loader().__name__, "FullLoader")
+        with self.assertRaises(ValueError):
+            YamlBackend.use("fast")
+
+    def test_identical_documents(self):
+        """Test that both backends write the same bytes."""
+        for data in _DOCUMENTS:
+            with self.subTest(data=type(data).__name__):
+                self.assertEqual(
+                    self._serialize("python", data),
+                    self._serialize("libyaml", data),
+                )
+
+    def test_documented_differences(self):
+        """Test the documented differences of the written documents."""
+        self.assertEqual(self._serialize("python", "text"), b"text\n...\n")
+        self.assertEqual(self._serialize("libyaml", "text"), b"text\n")
+        self.assertEqual(self._serialize("python", {"": 1}), b"? ''\n: 1\n")
+        self.assertEqual(self._serialize("libyaml", {"": 1}), b"'': 1\n")
+
+    def test_round_trip(self):
+        """Test that each backend reads what the other one wrote."""
+        config_file = os.path.join(self.directory.name, "config.yaml")
+        for data in _DOCUMENTS:
+            for writer in YamlBackend.BACKENDS:
+                for reader in YamlBackend.BACKENDS:
+                    with self.subTest(writer=writer, reader=reader):
+                        YamlBackend.use(writer)
+                        write_config(config_file, data, ConfigTypes.YAML)
+                        YamlBackend.use(reader)
+                        self.assertEqual(
+                            parse_config(config_file, ConfigTypes.YAML), data
+                        )
+                        self.assertEqual(
+                            parse_yaml(config_file), to_dict(data)
+                        )